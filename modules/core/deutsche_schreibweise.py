@@ -6,1148 +6,63 @@ WWAK-konform nach K-Beschluss!
 """
 
 import re
-from typing import Dict, List, Tuple, Optional, Set
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-import unicodedata
-from collections import defaultdict
+import sys
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-# ============= 1. TRANSLITERATION (UMSCHRIFT) =============
-
-class HebraischDeutschTransliterator:
-    """DIN 31636 konforme Umschrift Hebräisch→Deutsch"""
-    
-    def __init__(self):
-        # Konsonanten-Mapping nach DIN 31636
-        self.konsonanten = {
-            'א': '',      # Alef (stumm)
-            'ב': 'b/w',   # Bet/Wet
-            'ג': 'g',     # Gimel
-            'ד': 'd',     # Dalet
-            'ה': 'h',     # He (am Wortende meist stumm)
-            'ו': 'w',     # Waw
-            'ז': 's',     # Sajin
-            'ח': 'ch',    # Chet
-            'ט': 't',     # Tet
-            'י': 'j',     # Jod
-            'כ': 'k/ch',  # Kaf/Chaf
-            'ך': 'ch',    # Chaf sofit
-            'ל': 'l',     # Lamed
-            'מ': 'm',     # Mem
-            'ם': 'm',     # Mem sofit
-            'נ': 'n',     # Nun
-            'ן': 'n',     # Nun sofit
-            'ס': 'ss',    # Samech
-            'ע': '',      # Ajin (stumm)
-            'פ': 'p/f',   # Pe/Fe
-            'ף': 'f',     # Fe sofit
-            'צ': 'z',     # Zade
-            'ץ': 'z',     # Zade sofit
-            'ק': 'q',     # Qof (IMMER q!)
-            'ר': 'r',     # Resch
-            'ש': 'sch/s', # Schin/Sin
-            'ת': 't'      # Taw
-        }
-        
-        # WWAK-spezifische Transformationen
-        self.wwak_regeln = {
-            # v→w Transformationen
-            'Gevura': 'Gewura',
-            'gevura': 'gewura',
-            'Gevurah': 'Gewura',
-            'gevurah': 'gewura',
-            
-            # Doppel-SS Regel
-            'Chesed': 'Chessed',
-            'chesed': 'chessed',
-            'Yesod': 'Jessod',
-            'yesod': 'jessod',
-            'Jesod': 'Jessod',
-            'jesod': 'jessod',
-            
-            # K→Q bei hebräischen Begriffen
-            'Kabbala': 'Qabbala',
-            'kabbala': 'qabbala',
-            'Kabbalah': 'Qabbala',
-            'kabbalah': 'qabbala',
-            'Kawana': 'Qawana',
-            'kawana': 'qawana',
-            'Kli': 'Qli',
-            'kli': 'qli',
-            'Klipa': 'Qlipa',
-            'klipa': 'qlipa',
-            'Klipot': 'Qlipot',
-            'klipot': 'qlipot',
-            
-            # h-Elimination am Wortende
-            'Torah': 'Tora',
-            'torah': 'tora',
-            'Binah': 'Bina',
-            'binah': 'bina',
-            'Chochmah': 'Chochma',
-            'chochmah': 'chochma',
-            'Shekinah': 'Schechina',
-            'shekinah': 'schechina',
-            'Halakhah': 'Halacha',
-            'halakhah': 'halacha',
-            
-            # z→s bei Ze'ir → Se'ir
-            "Ze'ir Anpin": "Se'ir Anpin",
-            "ze'ir anpin": "se'ir anpin",
-            "Zeir Anpin": "Se'ir Anpin",
-            "zeir anpin": "se'ir anpin",
-            
-            # tz→z Transformation
-            'Tzimtzum': 'Zimzum',
-            'tzimtzum': 'zimzum',
-            'Atzilut': 'Azilut',
-            'atzilut': 'azilut',
-            
-            # Abkürzungen ohne Anführungszeichen
-            'S"A': 'SA',
-            'Z"A': 'SA',
-            'A"A': 'AA',
-            'A"K': 'AQ'
-        }
-    
-    def transliteriere(self, text: str) -> str:
-        """Hauptfunktion für Transliteration"""
-        # Erst WWAK-Regeln anwenden
-        for alt, neu in self.wwak_regeln.items():
-            text = text.replace(alt, neu)
-        
-        return text
-
-
-# ============= 2. ORTHOGRAFIE UND GRAMMATIK =============
-
-class DeutscheOrthografie:
-    """Deutsche Rechtschreibung und Grammatik-Prüfung"""
-    
-    def __init__(self):
-        # Artikel-Regeln
-        self.artikel = {
-            'Kli': 'das',      # Neutrum
-            'Klim': 'die',     # Plural
-            'Sefira': 'die',
-            'Sefirot': 'die',  # Plural
-            'Parzuf': 'der',
-            'Parzufim': 'die', # Plural
-            'Or': 'das',       # Licht
-            'Orot': 'die',     # Lichter
-            'Kawana': 'die',
-            'Zimzum': 'der',
-            'Tiqqun': 'der',
-            'Dwekut': 'die'
-        }
-        
-        # Genus-Regeln
-        self.genus_endungen = {
-            '-ung': 'feminin',  # die Offenbarung
-            '-heit': 'feminin', # die Weisheit
-            '-keit': 'feminin', # die Heiligkeit
-            '-schaft': 'feminin', # die Eigenschaft
-            '-ismus': 'maskulin', # der Chassidismus
-            '-er': 'maskulin'    # der Lehrer
-        }
-    
-    def pruefe_artikel(self, wort: str, artikel: str) -> Tuple[bool, str]:
-        """Prüft ob der Artikel korrekt ist"""
-        if wort in self.artikel:
-            korrekt = self.artikel[wort]
-            if artikel.lower() != korrekt:
-                return False, f"'{artikel} {wort}' → '{korrekt} {wort}'"
-        return True, ""
-    
-    def bestimme_genus(self, wort: str) -> Optional[str]:
-        """Bestimmt das Genus eines Wortes"""
-        for endung, genus in self.genus_endungen.items():
-            if wort.endswith(endung):
-                return genus
-        return None
-
-
-# ============= 3. SEMANTIK =============
-
-class SemantikPruefer:
-    """Prüft semantische Korrektheit und Bedeutung"""
-    
-    def __init__(self):
-        # Bedeutungs-Mapping
-        self.bedeutungen = {
-            'Kabbala': 'Empfangen, Überlieferung',
-            'Kawana': 'Absicht, geistige Ausrichtung',
-            'Zimzum': 'Kontraktion, Selbstbeschränkung',
-            'Tiqqun': 'Korrektur, Wiederherstellung',
-            'Dwekut': 'Anhaftung an das #!/usr/bin/env python3
-"""B"H - Deutsche Schreibweise Modul für Ez Chajim
-18. Tammus 5785, MESZ 04:50, Oostende
-Vollständiges sprachwissenschaftliches Werkzeug-System
-WWAK-konform nach K-Beschluss!
-"""
-
-import re
-from typing import Dict, List, Tuple, Optional, Set
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-import unicodedata
-from collections import defaultdict
-
-# ============= 1. TRANSLITERATION (UMSCHRIFT) =============
-
-class HebraischDeutschTransliterator:
-    """DIN 31636 konforme Umschrift Hebräisch→Deutsch"""
-    
-    def __init__(self):
-        # Konsonanten-Mapping nach DIN 31636
-        self.konsonanten = {
-            'א': '',      # Alef (stumm)
-            'ב': 'b/w',   # Bet/Wet
-            'ג': 'g',     # Gimel
-            'ד': 'd',     # Dalet
-            'ה': 'h',     # He (am Wortende meist stumm)
-            'ו': 'w',     # Waw
-            'ז': 's',     # Sajin
-            'ח': 'ch',    # Chet
-            'ט': 't',     # Tet
-            'י': 'j',     # Jod
-            'כ': 'k/ch',  # Kaf/Chaf
-            'ך': 'ch',    # Chaf sofit
-            'ל': 'l',     # Lamed
-            'מ': 'm',     # Mem
-            'ם': 'm',     # Mem sofit
-            'נ': 'n',     # Nun
-            'ן': 'n',     # Nun sofit
-            'ס': 'ss',    # Samech
-            'ע': '',      # Ajin (stumm)
-            'פ': 'p/f',   # Pe/Fe
-            'ף': 'f',     # Fe sofit
-            'צ': 'z',     # Zade
-            'ץ': 'z',     # Zade sofit
-            'ק': 'q',     # Qof (IMMER q!)
-            'ר': 'r',     # Resch
-            'ש': 'sch/s', # Schin/Sin
-            'ת': 't'      # Taw
-        }
-        
-        # WWAK-spezifische Transformationen
-        self.wwak_regeln = {
-            # v→w Transformationen
-            'Gevura': 'Gewura',
-            'gevura': 'gewura',
-            'Gevurah': 'Gewura',
-            'gevurah': 'gewura',
-            
-            # Doppel-SS Regel
-            'Chesed': 'Chessed',
-            'chesed': 'chessed',
-            'Yesod': 'Jessod',
-            'yesod': 'jessod',
-            'Jesod': 'Jessod',
-            'jesod': 'jessod',
-            
-            # K→Q bei hebräischen Begriffen
-            'Kabbala': 'Qabbala',
-            'kabbala': 'qabbala',
-            'Kabbalah': 'Qabbala',
-            'kabbalah': 'qabbala',
-            'Kawana': 'Qawana',
-            'kawana': 'qawana',
-            'Kli': 'Qli',
-            'kli': 'qli',
-            'Klipa': 'Qlipa',
-            'klipa': 'qlipa',
-            'Klipot': 'Qlipot',
-            'klipot': 'qlipot',
-            
-            # h-Elimination am Wortende
-            'Torah': 'Tora',
-            'torah': 'tora',
-            'Binah': 'Bina',
-            'binah': 'bina',
-            'Chochmah': 'Chochma',
-            'chochmah': 'chochma',
-            'Shekinah': 'Schechina',
-            'shekinah': 'schechina',
-            'Halakhah': 'Halacha',
-            'halakhah': 'halacha',
-            
-            # z→s bei Ze'ir → Se'ir
-            "Ze'ir Anpin": "Se'ir Anpin",
-            "ze'ir anpin": "se'ir anpin",
-            "Zeir Anpin": "Se'ir Anpin",
-            "zeir anpin": "se'ir anpin",
-            
-            # Weitere Korrekturen
-            'Tzimtzum': 'Zimzum',
-            'tzimtzum': 'zimzum',
-            'Atzilut': 'Azilut',
-            'atzilut': 'azilut',
-            'Tikkun': 'Tikkun',  # bleibt
-            'tikkun': 'tikkun',  # bleibt
-            'Tiqqun': 'Tikkun',  # qq→kk
-            'tiqqun': 'tikkun',  # qq→kk
-            
-            # Abkürzungen ohne Anführungszeichen
-            'S"A': 'SA',
-            'Z"A': 'SA',
-            'A"A': 'AA',
-            'A"K': 'AQ'
-        }
-    
-    def transliteriere(self, text: str) -> str:
-        """Hauptfunktion für Transliteration"""
-        # Erst WWAK-Regeln anwenden
-        for alt, neu in self.wwak_regeln.items():
-            text = text.replace(alt, neu)
-        
-        return text
-
-
-# ============= 2. ORTHOGRAFIE UND GRAMMATIK =============
-
-class DeutscheOrthografie:
-    """Deutsche Rechtschreibung und Grammatik-Prüfung"""
-    
-    def __init__(self):
-        # Artikel-Regeln
-        self.artikel = {
-            'Kli': 'das',      # Neutrum
-            'Klim': 'die',     # Plural
-            'Sefira': 'die',
-            'Sefirot': 'die',  # Plural
-            'Parzuf': 'der',
-            'Parzufim': 'die', # Plural
-            'Or': 'das',       # Licht
-            'Orot': 'die',     # Lichter
-            'Kawana': 'die',
-            'Zimzum': 'der',
-            'Tikkun': 'der',
-            'Dwekut': 'die'
-        }
-        
-        # Genus-Regeln
-        self.genus_endungen = {
-            '-ung': 'feminin',  # die Offenbarung
-            '-heit': 'feminin', # die Weisheit
-            '-keit': 'feminin', # die Heiligkeit
-            '-schaft': 'feminin', # die Eigenschaft
-            '-ismus': 'maskulin', # der Chassidismus
-            '-er': 'maskulin'    # der Lehrer
-        }
-    
-    def pruefe_artikel(self, wort: str, artikel: str) -> Tuple[bool, str]:
-        """Prüft ob der Artikel korrekt ist"""
-        if wort in self.artikel:
-            korrekt = self.artikel[wort]
-            if artikel.lower() != korrekt:
-                return False, f"'{artikel} {wort}' → '{korrekt} {wort}'"
-        return True, ""
-    
-    def bestimme_genus(self, wort: str) -> Optional[str]:
-        """Bestimmt das Genus eines Wortes"""
-        for endung, genus in self.genus_endungen.items():
-            if wort.endswith(endung):
-                return genus
-        return None
-
-
-# ============= 3. SEMANTIK =============
-
-class SemantikPruefer:
-    """Prüft semantische Korrektheit und Bedeutung"""
-    
-    def __init__(self):
-        # Bedeutungs-Mapping
-        self.bedeutungen = {
-            'Kabbala': 'Empfangen, Überlieferung',
-            'Kawana': 'Absicht, geistige Ausrichtung',
-            'Zimzum': 'Kontraktion, Selbstbeschränkung',
-            'Tikkun': 'Korrektur, Wiederherstellung',
-            'Dwekut': 'Anhaftung an das Göttliche',
-            'Sefirot': '10 göttliche Emanationen',
-            'Parzuf': 'Spirituelle Konfiguration',
-            'Klipa': 'Schale, verhüllende Kraft',
-            'Or': 'Göttliches Licht',
-            'Kli': 'Gefäß für göttliches Licht'
-        }
-        
-        # Semantische Felder
-        self.wortfelder = {
-            'Licht': ['Or', 'Orot', 'leuchten', 'strahlen', 'erhellen'],
-            'Gefäß': ['Kli', 'Klim', 'empfangen', 'aufnehmen', 'fassen'],
-            'Korrektur': ['Tikkun', 'korrigieren', 'heilen', 'wiederherstellen'],
-            'Verhüllung': ['Klipa', 'verbergen', 'verhüllen', 'bedecken']
-        }
-    
-    def erklaere_begriff(self, begriff: str) -> Optional[str]:
-        """Gibt Erklärung eines Begriffs zurück"""
-        return self.bedeutungen.get(begriff)
-    
-    def finde_verwandte_begriffe(self, wort: str) -> List[str]:
-        """Findet semantisch verwandte Begriffe"""
-        verwandte = []
-        for feld, begriffe in self.wortfelder.items():
-            if wort in begriffe:
-                verwandte.extend([b for b in begriffe if b != wort])
-        return verwandte
-
-
-# ============= 4. AUSDRUCK UND STIL =============
-
-class AusdruckStilPruefer:
-    """Prüft Ausdruck und Schreibstil"""
-    
-    def __init__(self):
-        # Stil-Ebenen
-        self.stil_ebenen = {
-            'akademisch': {
-                'merkmale': ['Fachbegriffe', 'komplexe Sätze', 'Zitate'],
-                'vermeiden': ['umgangssprachlich', 'Füllwörter']
-            },
-            'spirituell': {
-                'merkmale': ['heilige Begriffe', 'ehrfürchtig', 'präzise'],
-                'vermeiden': ['anthropomorph', 'profan']
-            },
-            'lehrend': {
-                'merkmale': ['klar', 'strukturiert', 'beispielhaft'],
-                'vermeiden': ['verwirrend', 'widersprüchlich']
-            }
-        }
-        
-        # Anti-anthropomorphe Ausdrücke
-        self.anthropomorph_vermeiden = [
-            "Gott will", "Gott denkt", "Gott fühlt",
-            "der Herr sagt", "Er wünscht", "Seine Hand"
-        ]
-        
-        # Bessere Alternativen
-        self.spirituelle_alternativen = {
-            "Gott will": "es ist der göttliche Wille",
-            "Gott sagt": "es steht geschrieben",
-            "Er": "die Höhere Kraft",
-            "Seine": "die göttliche"
-        }
-    
-    def pruefe_stil(self, text: str, stil: str = 'spirituell') -> List[str]:
-        """Prüft Text auf Stil-Konformität"""
-        probleme = []
-        
-        # Prüfe auf anthropomorphe Ausdrücke
-        for ausdruck in self.anthropomorph_vermeiden:
-            if ausdruck.lower() in text.lower():
-                alt = self.spirituelle_alternativen.get(ausdruck, "")
-                probleme.append(f"Vermeide: '{ausdruck}' → '{alt}'")
-        
-        return probleme
-
-
-# ============= 5. ZER-ELIMINATION =============
-
-class ZerEliminator:
-    """Eliminiert 'zer'-Präfixe nach WWAK"""
-    
-    def __init__(self):
-        self.zer_transformationen = {
-            'zerbrechen': 'bersten',
-            'zerbrochen': 'geborsten',
-            'zerbricht': 'berstet',
-            'zerstören': 'wandeln',
-            'zerstört': 'gewandelt',
-            'Zerstörung': 'Wandlung',
-            'zerreißen': 'trennen',
-            'zerrissen': 'getrennt',
-            'zerschlagen': 'transformieren',
-            'zerfallen': 'sich auflösen',
-            'zersetzen': 'umwandeln',
-            'zersplittern': 'sich teilen'
-        }
-    
-    def eliminiere_zer(self, text: str) -> Tuple[str, List[str]]:
-        """Ersetzt alle zer-Wörter"""
-        aenderungen = []
-        
-        for alt, neu in self.zer_transformationen.items():
-            if alt in text:
-                text = text.replace(alt, neu)
-                aenderungen.append(f"{alt} → {neu}")
-            # Auch Großschreibung
-            if alt.capitalize() in text:
-                text = text.replace(alt.capitalize(), neu.capitalize())
-                aenderungen.append(f"{alt.capitalize()} → {neu.capitalize()}")
-        
-        return text, aenderungen
-
-
-# ============= 6. SPRACHWISSENSCHAFTLICHE WERKZEUGE =============
-
-class SprachWerkzeuge:
-    """Sammlung sprachwissenschaftlicher Werkzeuge"""
-    
-    def __init__(self):
-        self.werkzeuge = {
-            'Phonetik': self.phonetische_analyse,
-            'Morphologie': self.morphologische_analyse,
-            'Etymologie': self.etymologische_herkunft,
-            'Gematria': self.gematria_berechnung
-        }
-    
-    def phonetische_analyse(self, wort: str) -> Dict:
-        """Analysiert Lautstruktur"""
-        return {
-            'silben': self._silben_trennung(wort),
-            'betonung': self._finde_betonung(wort),
-            'lautgruppen': self._klassifiziere_laute(wort)
-        }
-    
-    def morphologische_analyse(self, wort: str) -> Dict:
-        """Analysiert Wortstruktur"""
-        return {
-            'wortstamm': self._extrahiere_stamm(wort),
-            'präfixe': self._finde_praefixe(wort),
-            'suffixe': self._finde_suffixe(wort),
-            'wortart': self._bestimme_wortart(wort)
-        }
-    
-    def etymologische_herkunft(self, begriff: str) -> Dict:
-        """Bestimmt Wortherkunft"""
-        herkunft_db = {
-            'Kabbala': {'sprache': 'Hebräisch', 'wurzel': 'קבל (QBL)', 'bedeutung': 'empfangen'},
-            'Zimzum': {'sprache': 'Hebräisch', 'wurzel': 'צמצם', 'bedeutung': 'zusammenziehen'},
-            'Schechina': {'sprache': 'Hebräisch', 'wurzel': 'שכן', 'bedeutung': 'wohnen'}
-        }
-        return herkunft_db.get(begriff, {'sprache': 'unbekannt'})
-    
-    def gematria_berechnung(self, wort: str) -> int:
-        """Berechnet Gematria-Wert"""
-        gematria_werte = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ל': 30, 'מ': 40, 'נ': 50, 'ס': 60,
-            'ע': 70, 'פ': 80, 'צ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
-        return sum(gematria_werte.get(buchstabe, 0) for buchstabe in wort)
-    
-    def _silben_trennung(self, wort: str) -> List[str]:
-        """Trennt Wort in Silben"""
-        # Vereinfachte Silbentrennung
-        silben = []
-        aktuelle_silbe = ""
-        
-        for i, char in enumerate(wort):
-            aktuelle_silbe += char
-            # Einfache Regel: Nach Vokal+Konsonant trennen
-            if (i < len(wort) - 1 and 
-                char.lower() in 'aeiouäöü' and 
-                wort[i+1].lower() not in 'aeiouäöü'):
-                if i < len(wort) - 2 and wort[i+2].lower() not in 'aeiouäöü':
-                    silben.append(aktuelle_silbe)
-                    aktuelle_silbe = ""
-        
-        if aktuelle_silbe:
-            silben.append(aktuelle_silbe)
-        
-        return silben if silben else [wort]
-    
-    def _finde_betonung(self, wort: str) -> str:
-        """Findet betonte Silbe"""
-        # Hebräische Wörter: meist Endbetonung
-        if any(h in wort for h in ['Qabbala', 'Zimzum', 'Tiqqun']):
-            return 'Endbetonung'
-        return 'Standardbetonung'
-    
-    def _klassifiziere_laute(self, wort: str) -> Dict:
-        """Klassifiziert Laute im Wort"""
-        vokale = sum(1 for c in wort.lower() if c in 'aeiouäöüy')
-        konsonanten = sum(1 for c in wort.lower() if c.isalpha() and c not in 'aeiouäöüy')
-        
-        return {
-            'vokale': vokale,
-            'konsonanten': konsonanten,
-            'verhältnis': f"{konsonanten}:{vokale}"
-        }
-    
-    def _extrahiere_stamm(self, wort: str) -> str:
-        """Extrahiert Wortstamm"""
-        # Entferne häufige Suffixe
-        suffixe = ['ung', 'heit', 'keit', 'schaft', 'ismus', 'ist']
-        for suffix in suffixe:
-            if wort.endswith(suffix):
-                return wort[:-len(suffix)]
-        return wort
-    
-    def _finde_praefixe(self, wort: str) -> List[str]:
-        """Findet Präfixe"""
-        praefixe = []
-        moegliche = ['un', 'ver', 'be', 'ent', 'er', 'ge']
-        for praefix in moegliche:
-            if wort.startswith(praefix):
-                praefixe.append(praefix)
-        return praefixe
-    
-    def _finde_suffixe(self, wort: str) -> List[str]:
-        """Findet Suffixe"""
-        suffixe = []
-        moegliche = ['ung', 'heit', 'keit', 'schaft', 'lich', 'isch', 'ig']
-        for suffix in moegliche:
-            if wort.endswith(suffix):
-                suffixe.append(suffix)
-        return suffixe
-    
-    def _bestimme_wortart(self, wort: str) -> str:
-        """Bestimmt Wortart"""
-        # Vereinfachte Regeln
-        if wort[0].isupper():
-            return 'Substantiv'
-        elif wort.endswith(('en', 'ern', 'eln')):
-            return 'Verb'
-        elif wort.endswith(('ig', 'lich', 'isch')):
-            return 'Adjektiv'
-        return 'unbestimmt'
-
-
-# ============= HAUPTKLASSE =============
-
-class DeutscheSchreibweise:
-    """Hauptklasse für deutsche Schreibweise im Ez Chajim System"""
-    
-    def __init__(self):
-        self.transliterator = HebraischDeutschTransliterator()
-        self.orthografie = DeutscheOrthografie()
-        self.semantik = SemantikPruefer()
-        self.stil = AusdruckStilPruefer()
-        self.zer_eliminator = ZerEliminator()
-        self.werkzeuge = SprachWerkzeuge()
-    
-    def vollstaendige_pruefung(self, text: str) -> Dict:
-        """Führt vollständige Prüfung durch"""
-        ergebnis = {
-            'original': text,
-            'korrekturen': [],
-            'warnungen': [],
-            'empfehlungen': []
-        }
-        
-        # 1. Transliteration
-        korrigiert = self.transliterator.transliteriere(text)
-        if korrigiert != text:
-            ergebnis['korrekturen'].append(f"Transliteration: {len(korrigiert)} Zeichen geändert")
-            text = korrigiert
-        
-        # 2. Zer-Elimination
-        text, zer_aenderungen = self.zer_eliminator.eliminiere_zer(text)
-        if zer_aenderungen:
-            ergebnis['korrekturen'].extend(zer_aenderungen)
-        
-        # 3. Stil-Prüfung
-        stil_probleme = self.stil.pruefe_stil(text)
-        if stil_probleme:
-            ergebnis['warnungen'].extend(stil_probleme)
-        
-        # 4. Finale Version
-        ergebnis['korrigiert'] = text
-        
-        # 5. Q! am Ende sicherstellen
-        if not text.strip().endswith('Q!'):
-            ergebnis['korrigiert'] = text.rstrip() + '\n\nQ!'
-            ergebnis['empfehlungen'].append("Q! am Ende hinzugefügt")
-        
-        return ergebnis
-    
-    def zeige_regeln(self) -> str:
-        """Zeigt alle Schreibregeln"""
-        regeln = """
-B"H - DEUTSCHE SCHREIBWEISE REGELN
-=====================================
-Stand: 18. Tammus 5785, MESZ 05:07
-Beschluss: JBR.-Wolff!Q!
-
-1. SEFIROT (Korrekte Schreibweise):
-   1. Keter
-   2. Chochma
-   3. Bina
-   4. Chessed (mit Doppel-ss)
-   5. Gewura (mit w statt v)
-   6. Tiferet
-   7. Nezach
-   8. Hod
-   9. Jessod (mit Doppel-ss)
-   10. Malchut
-
-2. WWAK-TRANSFORMATIONEN:
-   - K bleibt K! (Kabbala, Kawana, Kli)
-   - Q→K bei falschen Schreibweisen
-   - V→W (Gewura statt Gevura)
-   - Keine h-Endungen (Tora statt Torah)
-   - Zer-Elimination (bersten statt zerbrechen)
-
-3. ABKÜRZUNGEN:
-   - SA (nicht S"A) = Se'ir Anpin
-   - AA (nicht A"A) = Arich Anpin
-   - AK (nicht A"K) = Adam Kadmon (mit K!)
-
-4. GRAMMATIK:
-   - das Kli (Neutrum), die Klim (Plural)
-   - der Zimzum, die Zimzumim
-   - die Sefira, die Sefirot
-
-5. ZEICHEN:
-   - Q! bleibt als Zeichen (wegen QBL-Wurzel)
-   - Aber KEINE Q-Schreibweise in Wörtern!
-
-6. STIL:
-   - Anti-anthropomorph
-   - Keine englischen Schreibweisen
-   - Q! am Ende jedes Haupttextes
-
-PHONETISCHE BEGRÜNDUNG:
-- Q im Deutschen = "Kw" Aussprache
-- Würde zu falscher Aussprache führen
-- Im Hebräischen kein k+w Laut
-- Daher: K-Schreibweise für Klarheit
-
-Motto: Prüfe. Meide. Wandle.
-Ki Ilu Azilut. Q!
-"""
-        return regeln
-
-
-# ============= BEISPIEL-VERWENDUNG =============
-
-if __name__ == "__main__":
-    # Erstelle Prüfer
-    pruefer = DeutscheSchreibweise()
-    
-    # Beispieltext mit vielen Fehlern
-    test_text = """
-    Die Torah lehrt uns über die Sephirot, besonders über Chesed und Gevurah.
-    Durch Tzimtzum kann das göttliche Licht in die Qlipot eindringen.
-    Gott will dass wir Seine Gebote befolgen.
-    Die Qabbala zerreißt die Schleier der Illusion.
-    S"A und A"A sind wichtige Parzufim.
-    """
-    
-    print("B\"H - Deutsche Schreibweise Prüfung")
-    print("="*60)
-    print("\nORIGINAL:")
-    print(test_text)
-    
-    # Führe Prüfung durch
-    ergebnis = pruefer.vollstaendige_pruefung(test_text)
-    
-    print("\nKORRIGIERT:")
-    print(ergebnis['korrigiert'])
-    
-    print("\nÄNDERUNGEN:")
-    for korrektur in ergebnis['korrekturen']:
-        print(f"  • {korrektur}")
-    
-    print("\nWARNUNGEN:")
-    for warnung in ergebnis['warnungen']:
-        print(f"  ⚠ {warnung}")
-    
-    # Zeige Regeln
-    print("\n" + pruefer.zeige_regeln())Göttliche',
-            'Sefirot': '10 göttliche Emanationen',
-            'Parzuf': 'Spirituelle Konfiguration',
-            'Klipa': 'Schale, verhüllende Kraft',
-            'Or': 'Göttliches Licht',
-            'Kli': 'Gefäß für göttliches Licht'
-        }
-        
-        # Semantische Felder
-        self.wortfelder = {
-            'Licht': ['Or', 'Orot', 'leuchten', 'strahlen', 'erhellen'],
-            'Gefäß': ['Kli', 'Klim', 'empfangen', 'aufnehmen', 'fassen'],
-            'Korrektur': ['Tiqqun', 'korrigieren', 'heilen', 'wiederherstellen'],
-            'Verhüllung': ['Klipa', 'verbergen', 'verhüllen', 'bedecken']
-        }
-    
-    def erklaere_begriff(self, begriff: str) -> Optional[str]:
-        """Gibt Erklärung eines Begriffs zurück"""
-        return self.bedeutungen.get(begriff)
-    
-    def finde_verwandte_begriffe(self, wort: str) -> List[str]:
-        """Findet semantisch verwandte Begriffe"""
-        verwandte = []
-        for feld, begriffe in self.wortfelder.items():
-            if wort in begriffe:
-                verwandte.extend([b for b in begriffe if b != wort])
-        return verwandte
-
-
-# ============= 4. AUSDRUCK UND STIL =============
-
-class AusdruckStilPruefer:
-    """Prüft Ausdruck und Schreibstil"""
-    
-    def __init__(self):
-        # Stil-Ebenen
-        self.stil_ebenen = {
-            'akademisch': {
-                'merkmale': ['Fachbegriffe', 'komplexe Sätze', 'Zitate'],
-                'vermeiden': ['umgangssprachlich', 'Füllwörter']
-            },
-            'spirituell': {
-                'merkmale': ['heilige Begriffe', 'ehrfürchtig', 'präzise'],
-                'vermeiden': ['anthropomorph', 'profan']
-            },
-            'lehrend': {
-                'merkmale': ['klar', 'strukturiert', 'beispielhaft'],
-                'vermeiden': ['verwirrend', 'widersprüchlich']
-            }
-        }
-        
-        # Anti-anthropomorphe Ausdrücke
-        self.anthropomorph_vermeiden = [
-            "Gott will", "Gott denkt", "Gott fühlt",
-            "der Herr sagt", "Er wünscht", "Seine Hand"
-        ]
-        
-        # Bessere Alternativen
-        self.spirituelle_alternativen = {
-            "Gott will": "es ist der göttliche Wille",
-            "Gott sagt": "es steht geschrieben",
-            "Er": "die Höhere Kraft",
-            "Seine": "die göttliche"
-        }
-    
-    def pruefe_stil(self, text: str, stil: str = 'spirituell') -> List[str]:
-        """Prüft Text auf Stil-Konformität"""
-        probleme = []
-        
-        # Prüfe auf anthropomorphe Ausdrücke
-        for ausdruck in self.anthropomorph_vermeiden:
-            if ausdruck.lower() in text.lower():
-                alt = self.spirituelle_alternativen.get(ausdruck, "")
-                probleme.append(f"Vermeide: '{ausdruck}' → '{alt}'")
-        
-        return probleme
-
-
-# ============= 5. ZER-ELIMINATION =============
-
-class ZerEliminator:
-    """Eliminiert 'zer'-Präfixe nach WWAK"""
-    
-    def __init__(self):
-        self.zer_transformationen = {
-            'zerbrechen': 'bersten',
-            'zerbrochen': 'geborsten',
-            'zerbricht': 'berstet',
-            'zerstören': 'wandeln',
-            'zerstört': 'gewandelt',
-            'Zerstörung': 'Wandlung',
-            'zerreißen': 'trennen',
-            'zerrissen': 'getrennt',
-            'zerschlagen': 'transformieren',
-            'zerfallen': 'sich auflösen',
-            'zersetzen': 'umwandeln',
-            'zersplittern': 'sich teilen'
-        }
-    
-    def eliminiere_zer(self, text: str) -> Tuple[str, List[str]]:
-        """Ersetzt alle zer-Wörter"""
-        aenderungen = []
-        
-        for alt, neu in self.zer_transformationen.items():
-            if alt in text:
-                text = text.replace(alt, neu)
-                aenderungen.append(f"{alt} → {neu}")
-            # Auch Großschreibung
-            if alt.capitalize() in text:
-                text = text.replace(alt.capitalize(), neu.capitalize())
-                aenderungen.append(f"{alt.capitalize()} → {neu.capitalize()}")
-        
-        return text, aenderungen
-
-
-# ============= 6. SPRACHWISSENSCHAFTLICHE WERKZEUGE =============
-
-class SprachWerkzeuge:
-    """Sammlung sprachwissenschaftlicher Werkzeuge"""
-    
-    def __init__(self):
-        self.werkzeuge = {
-            'Phonetik': self.phonetische_analyse,
-            'Morphologie': self.morphologische_analyse,
-            'Etymologie': self.etymologische_herkunft,
-            'Gematria': self.gematria_berechnung
-        }
-    
-    def phonetische_analyse(self, wort: str) -> Dict:
-        """Analysiert Lautstruktur"""
-        return {
-            'silben': self._silben_trennung(wort),
-            'betonung': self._finde_betonung(wort),
-            'lautgruppen': self._klassifiziere_laute(wort)
-        }
-    
-    def morphologische_analyse(self, wort: str) -> Dict:
-        """Analysiert Wortstruktur"""
-        return {
-            'wortstamm': self._extrahiere_stamm(wort),
-            'präfixe': self._finde_praefixe(wort),
-            'suffixe': self._finde_suffixe(wort),
-            'wortart': self._bestimme_wortart(wort)
-        }
-    
-    def etymologische_herkunft(self, begriff: str) -> Dict:
-        """Bestimmt Wortherkunft"""
-        herkunft_db = {
-            'Kabbala': {'sprache': 'Hebräisch', 'wurzel': 'קבל (QBL)', 'bedeutung': 'empfangen'},
-            'Zimzum': {'sprache': 'Hebräisch', 'wurzel': 'צמצם', 'bedeutung': 'zusammenziehen'},
-            'Schechina': {'sprache': 'Hebräisch', 'wurzel': 'שכן', 'bedeutung': 'wohnen'}
-        }
-        return herkunft_db.get(begriff, {'sprache': 'unbekannt'})
-    
-    def gematria_berechnung(self, wort: str) -> int:
-        """Berechnet Gematria-Wert"""
-        gematria_werte = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ל': 30, 'מ': 40, 'נ': 50, 'ס': 60,
-            'ע': 70, 'פ': 80, 'צ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
-        return sum(gematria_werte.get(buchstabe, 0) for buchstabe in wort)
-    
-    def _silben_trennung(self, wort: str) -> List[str]:
-        """Trennt Wort in Silben"""
-        # Vereinfachte Silbentrennung
-        silben = []
-        aktuelle_silbe = ""
-        
-        for i, char in enumerate(wort):
-            aktuelle_silbe += char
-            # Einfache Regel: Nach Vokal+Konsonant trennen
-            if (i < len(wort) - 1 and 
-                char.lower() in 'aeiouäöü' and 
-                wort[i+1].lower() not in 'aeiouäöü'):
-                if i < len(wort) - 2 and wort[i+2].lower() not in 'aeiouäöü':
-                    silben.append(aktuelle_silbe)
-                    aktuelle_silbe = ""
-        
-        if aktuelle_silbe:
-            silben.append(aktuelle_silbe)
-        
-        return silben if silben else [wort]
-    
-    def _finde_betonung(self, wort: str) -> str:
-        """Findet betonte Silbe"""
-        # Hebräische Wörter: meist Endbetonung
-        if any(h in wort for h in ['Qabbala', 'Zimzum', 'Tiqqun']):
-            return 'Endbetonung'
-        return 'Standardbetonung'
-    
-    def _klassifiziere_laute(self, wort: str) -> Dict:
-        """Klassifiziert Laute im Wort"""
-        vokale = sum(1 for c in wort.lower() if c in 'aeiouäöüy')
-        konsonanten = sum(1 for c in wort.lower() if c.isalpha() and c not in 'aeiouäöüy')
-        
-        return {
-            'vokale': vokale,
-            'konsonanten': konsonanten,
-            'verhältnis': f"{konsonanten}:{vokale}"
-        }
-    
-    def _extrahiere_stamm(self, wort: str) -> str:
-        """Extrahiert Wortstamm"""
-        # Entferne häufige Suffixe
-        suffixe = ['ung', 'heit', 'keit', 'schaft', 'ismus', 'ist']
-        for suffix in suffixe:
-            if wort.endswith(suffix):
-                return wort[:-len(suffix)]
-        return wort
-    
-    def _finde_praefixe(self, wort: str) -> List[str]:
-        """Findet Präfixe"""
-        praefixe = []
-        moegliche = ['un', 'ver', 'be', 'ent', 'er', 'ge']
-        for praefix in moegliche:
-            if wort.startswith(praefix):
-                praefixe.append(praefix)
-        return praefixe
-    
-    def _finde_suffixe(self, wort: str) -> List[str]:
-        """Findet Suffixe"""
-        suffixe = []
-        moegliche = ['ung', 'heit', 'keit', 'schaft', 'lich', 'isch', 'ig']
-        for suffix in moegliche:
-            if wort.endswith(suffix):
-                suffixe.append(suffix)
-        return suffixe
-    
-    def _bestimme_wortart(self, wort: str) -> str:
-        """Bestimmt Wortart"""
-        # Vereinfachte Regeln
-        if wort[0].isupper():
-            return 'Substantiv'
-        elif wort.endswith(('en', 'ern', 'eln')):
-            return 'Verb'
-        elif wort.endswith(('ig', 'lich', 'isch')):
-            return 'Adjektiv'
-        return 'unbestimmt'
-
-
-# ============= HAUPTKLASSE =============
-
-class DeutscheSchreibweise:
-    """Hauptklasse für deutsche Schreibweise im Ez Chajim System"""
-    
-    def __init__(self):
-        self.transliterator = HebraischDeutschTransliterator()
-        self.orthografie = DeutscheOrthografie()
-        self.semantik = SemantikPruefer()
-        self.stil = AusdruckStilPruefer()
-        self.zer_eliminator = ZerEliminator()
-        self.werkzeuge = SprachWerkzeuge()
-    
-    def vollstaendige_pruefung(self, text: str) -> Dict:
-        """Führt vollständige Prüfung durch"""
-        ergebnis = {
-            'original': text,
-            'korrekturen': [],
-            'warnungen': [],
-            'empfehlungen': []
-        }
-        
-        # 1. Transliteration
-        korrigiert = self.transliterator.transliteriere(text)
-        if korrigiert != text:
-            ergebnis['korrekturen'].append(f"Transliteration: {len(korrigiert)} Zeichen geändert")
-            text = korrigiert
-        
-        # 2. Zer-Elimination
-        text, zer_aenderungen = self.zer_eliminator.eliminiere_zer(text)
-        if zer_aenderungen:
-            ergebnis['korrekturen'].extend(zer_aenderungen)
-        
-        # 3. Stil-Prüfung
-        stil_probleme = self.stil.pruefe_stil(text)
-        if stil_probleme:
-            ergebnis['warnungen'].extend(stil_probleme)
-        
-        # 4. Finale Version
-        ergebnis['korrigiert'] = text
-        
-        # 5. Q! am Ende sicherstellen
-        if not text.strip().endswith('Q!'):
-            ergebnis['korrigiert'] = text.rstrip() + '\n\nQ!'
-            ergebnis['empfehlungen'].append("Q! am Ende hinzugefügt")
-        
-        return ergebnis
-    
-    def zeige_regeln(self) -> str:
-        """Zeigt alle Schreibregeln"""
-        regeln = """
-B"H - DEUTSCHE SCHREIBWEISE REGELN
-=====================================
-Stand: 18. Tammus 5785, MESZ 05:07
-Beschluss: JBR.-Wolff!Q!
-
-1. SEFIROT (Korrekte Schreibweise):
-   1. Keter
-   2. Chochma
-   3. Bina
-   4. Chessed (mit Doppel-ss)
-   5. Gewura (mit w statt v)
-   6. Tiferet
-   7. Nezach
-   8. Hod
-   9. Jessod (mit Doppel-ss)
-   10. Malchut
-
-2. WWAK-TRANSFORMATIONEN:
-   - K bleibt K! (Kabbala, Kawana, Kli)
-   - Q→K bei falschen Schreibweisen
-   - V→W (Gewura statt Gevura)
-   - Keine h-Endungen (Tora statt Torah)
-   - Zer-Elimination (bersten statt zerbrechen)
-
-3. ABKÜRZUNGEN:
-   - SA (nicht S"A) = Se'ir Anpin
-   - AA (nicht A"A) = Arich Anpin
-   - AK (nicht A"K) = Adam Kadmon (mit K!)
-
-4. GRAMMATIK:
-   - das Kli (Neutrum), die Klim (Plural)
-   - der Zimzum, die Zimzumim
-   - die Sefira, die Sefirot
-
-5. ZEICHEN:
-   - Q! bleibt als Zeichen (wegen QBL-Wurzel)
-   - Aber KEINE Q-Schreibweise in Wörtern!
-
-6. STIL:
-   - Anti-anthropomorph
-   - Keine englischen Schreibweisen
-   - Q! am Ende jedes Haupttextes
-
-PHONETISCHE BEGRÜNDUNG:
-- Q im Deutschen = "Kw" Aussprache
-- Würde zu falscher Aussprache führen
-- Im Hebräischen kein k+w Laut
-- Daher: K-Schreibweise für Klarheit
+try:
+    from .gematria import gematria
+except ImportError:
+    from gematria import gematria
 
-Motto: Prüfe. Meide. Wandle.
-Ki Ilu Azilut. Q!
-"""
-        return regeln
 
+# Ein Wort: Buchstaben, auch mit Apostroph oder Bindestrich (Se'ir, Ez-Chajim)
+WORT_MUSTER = re.compile(r"[^\W\d_]+(?:['’-][^\W\d_]+)*")
 
-# ============= BEISPIEL-VERWENDUNG =============
 
-if __name__ == "__main__":
-    # Erstelle Prüfer
-    pruefer = DeutscheSchreibweise()
-    
-    # Beispieltext mit vielen Fehlern
-    test_text = """
-    Die Torah lehrt uns über die Sephirot, besonders über Chesed und Gevurah.
-    Durch Tzimtzum kann das göttliche Licht in die Qlipot eindringen.
-    Gott will dass wir Seine Gebote befolgen.
-    Die Qabbala zerreißt die Schleier der Illusion.
-    S"A und A"A sind wichtige Parzufim.
+def trie_muster(woerter) -> str:
     """
-    
-    print("B\"H - Deutsche Schreibweise Prüfung")
-    print("="*60)
-    print("\nORIGINAL:")
-    print(test_text)
-    
-    # Führe Prüfung durch
-    ergebnis = pruefer.vollstaendige_pruefung(test_text)
-    
-    print("\nKORRIGIERT:")
-    print(ergebnis['korrigiert'])
-    
-    print("\nÄNDERUNGEN:")
-    for korrektur in ergebnis['korrekturen']:
-        print(f"  • {korrektur}")
-    
-    print("\nWARNUNGEN:")
-    for warnung in ergebnis['warnungen']:
-        print(f"  ⚠ {warnung}")
-    
-    # Zeige Regeln
-    print("\n" + pruefer.zeige_regeln())#!/usr/bin/env python3
-"""B"H - Deutsche Schreibweise Modul für Ez Chajim
-18. Tammus 5785, MESZ 04:50, Oostende
-Vollständiges sprachwissenschaftliches Werkzeug-System
-WWAK-konform nach K-Beschluss!
-"""
-
-import re
-from typing import Dict, List, Tuple, Optional, Set
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
-import unicodedata
-from collections import defaultdict
+    Schreibt eine Wortliste als Präfix-Baum-Regex: gemeinsame Anfänge
+    werden nur einmal geprüft, längere Fortsetzungen vor kürzeren -
+    an jeder Stelle gewinnt der längste Treffer.
+    """
+    baum: Dict[str, Dict] = {}
+    for wort in woerter:
+        knoten = baum
+        for zeichen in wort:
+            knoten = knoten.setdefault(zeichen, {})
+        knoten[''] = {}
+    
+    def schreibe(knoten: Dict) -> str:
+        zweige = [re.escape(zeichen) + schreibe(kind)
+                  for zeichen, kind in sorted(knoten.items()) if zeichen]
+        if not zweige:
+            return ''
+        muster = zweige[0] if len(zweige) == 1 else '(?:' + '|'.join(zweige) + ')'
+        if '' in knoten:
+            muster = '(?:' + muster + ')?'  # gierig: erst die längere Form
+        return muster
+    
+    return schreibe(baum)
+
+
+def uebertrage_schreibung(vorlage: str, wort: str) -> str:
+    """Überträgt Groß-/Kleinschreibung des gefundenen Wortes auf den Ersatz"""
+    if len(vorlage) > 1 and vorlage.isupper():
+        return wort.upper()
+    if vorlage[:1].isupper():
+        return wort[:1].upper() + wort[1:]
+    return wort[:1].lower() + wort[1:]
 
 # ============= 1. TRANSLITERATION (UMSCHRIFT) =============
 
+class Ersetzung(NamedTuple):
+    """Eine angewandte WWAK-Regel (Position im Originaltext)"""
+    position: int
+    alt: str
+    neu: str
+
 class HebraischDeutschTransliterator:
     """DIN 31636 konforme Umschrift Hebräisch→Deutsch"""
     
@@ -1243,18 +158,70 @@ class HebraischDeutschTransliterator:
             'A"A': 'AA',
             'A"K': 'AQ'
         }
+        
+        self.kompiliere_regeln()
+    
+    def kompiliere_regeln(self):
+        """
+        Alle WWAK-Regeln als EIN Muster (nach Änderungen an wwak_regeln
+        erneut aufrufen). Längere Schlüssel stehen vorne - so gewinnt an
+        jeder Stelle der längste Treffer ("Gevurah" vor "Gevura").
+        """
+        schluessel = sorted(self.wwak_regeln, key=len, reverse=True)
+        self._regel_muster = re.compile('|'.join(re.escape(alt) for alt in schluessel))
+    
+    def transliteriere_mit_positionen(self, text: str) -> Tuple[str, List[Ersetzung]]:
+        """
+        Wendet alle WWAK-Regeln in einem Durchlauf an.
+        Liefert den neuen Text und die tatsächlich geänderten Stellen.
+        """
+        teile = []
+        ersetzungen = []
+        ende = 0
+        for treffer in self._regel_muster.finditer(text):
+            alt = treffer.group()
+            neu = self.wwak_regeln[alt]
+            if neu == alt:
+                continue  # Regel bestätigt nur die Schreibweise
+            teile.append(text[ende:treffer.start()])
+            teile.append(neu)
+            ende = treffer.end()
+            ersetzungen.append(Ersetzung(treffer.start(), alt, neu))
+        
+        if not ersetzungen:
+            return text, ersetzungen
+        teile.append(text[ende:])
+        return ''.join(teile), ersetzungen
     
     def transliteriere(self, text: str) -> str:
         """Hauptfunktion für Transliteration"""
-        # Erst WWAK-Regeln anwenden
-        for alt, neu in self.wwak_regeln.items():
-            text = text.replace(alt, neu)
-        
-        return text
+        return self.transliteriere_mit_positionen(text)[0]
 
 
 # ============= 2. ORTHOGRAFIE UND GRAMMATIK =============
 
+# Bestimmte und unbestimmte Artikel mit allen Genera, zu denen sie in
+# irgendeinem Kasus passen (m, f, n, pl) - "der" auch Dativ feminin
+ARTIKEL_FORMEN = {
+    'der': {'m', 'f', 'pl'}, 'die': {'f', 'pl'}, 'das': {'n'},
+    'dem': {'m', 'n'}, 'den': {'m', 'pl'}, 'des': {'m', 'n'},
+    'ein': {'m', 'n'}, 'eine': {'f'}, 'einem': {'m', 'n'},
+    'einen': {'m'}, 'einer': {'f'}, 'eines': {'m', 'n'}
+}
+GENUS_NAMEN = {'m': 'maskulin', 'f': 'feminin', 'n': 'neutrum', 'pl': 'Plural'}
+NOMINATIV = {'m': 'der', 'f': 'die', 'n': 'das', 'pl': 'die'}
+
+
+class ArtikelBefund(NamedTuple):
+    """Artikel, der nicht zum Genus des folgenden Substantivs passt"""
+    position: int
+    artikel: str   # wie im Text geschrieben
+    wort: str
+    genus: str     # m, f, n oder pl
+    quelle: str    # 'lexikon' (sicher) oder 'endung' (Hinweis)
+    meldung: str
+
+
 class DeutscheOrthografie:
     """Deutsche Rechtschreibung und Grammatik-Prüfung"""
     
@@ -1282,8 +249,50 @@ class DeutscheOrthografie:
             '-keit': 'feminin', # die Heiligkeit
             '-schaft': 'feminin', # die Eigenschaft
             '-ismus': 'maskulin', # der Chassidismus
-            '-er': 'maskulin'    # der Lehrer
+            # kein '-er': das Opfer, das Wasser, die Mutter
+            # Plural nur, wo die Endung ihn zeigt
+            '-ungen': 'Plural', '-heiten': 'Plural', '-keiten': 'Plural',
+            '-schaften': 'Plural', '-ismen': 'Plural'
+        }
+        
+        # Pluralformen im Artikel-Lexikon (Artikel 'die' ≠ feminin)
+        self.plural = {'Klim', 'Sefirot', 'Parzufim', 'Orot'}
+        
+        self.kompiliere_index()
+    
+    def kompiliere_index(self):
+        """
+        Genus-Index (Wort → Genus) und Endungsbaum einmal aufbauen
+        (nach Änderungen an artikel, plural oder genus_endungen erneut aufrufen)
+        """
+        genus_codes = {'maskulin': 'm', 'feminin': 'f', 'neutrum': 'n', 'Plural': 'pl'}
+        self._genus_index = {
+            wort: 'pl' if wort in self.plural else {'der': 'm', 'die': 'f', 'das': 'n'}[artikel]
+            for wort, artikel in self.artikel.items()
         }
+        
+        # Endungen rückwärts als Baum: ein Schritt pro Buchstabe vom
+        # Wortende aus, die längste passende Endung gewinnt
+        self._endungs_baum: Dict[str, Dict] = {}
+        for endung, genus in self.genus_endungen.items():
+            knoten = self._endungs_baum
+            for zeichen in reversed(endung.lstrip('-')):
+                knoten = knoten.setdefault(zeichen, {})
+            knoten[''] = genus_codes[genus]
+        
+        formen = '|'.join(sorted(ARTIKEL_FORMEN, key=len, reverse=True))
+        # Das Substantiv nur vorausschauen: es kann selbst Artikel des nächsten Paars sein
+        self._artikel_muster = re.compile(r'\b((?i:' + formen + r'))\s+(?=([^\W\d_]+))')
+    
+    def _genus_aus_endung(self, wort: str) -> Optional[str]:
+        knoten = self._endungs_baum
+        genus = None
+        for zeichen in reversed(wort):
+            knoten = knoten.get(zeichen)
+            if knoten is None:
+                break
+            genus = knoten.get('', genus)
+        return genus
     
     def pruefe_artikel(self, wort: str, artikel: str) -> Tuple[bool, str]:
         """Prüft ob der Artikel korrekt ist"""
@@ -1295,18 +304,57 @@ class DeutscheOrthografie:
     
     def bestimme_genus(self, wort: str) -> Optional[str]:
         """Bestimmt das Genus eines Wortes"""
-        for endung, genus in self.genus_endungen.items():
-            if wort.endswith(endung):
-                return genus
-        return None
+        genus = self._genus_aus_endung(wort)
+        return GENUS_NAMEN[genus] if genus else None
+    
+    def pruefe_artikel_text(self, text: str) -> List[ArtikelBefund]:
+        """
+        Prüft alle Artikel+Substantiv-Paare eines Textes in einem Durchlauf.
+        Lexikon-Wörter werden sicher geprüft, sonst das Genus der Endung
+        (-ung feminin, -ungen Plural, ...).
+        """
+        befunde = []
+        for treffer in self._artikel_muster.finditer(text):
+            artikel, wort = treffer.group(1), treffer.group(2)
+            if not wort[0].isupper():
+                continue  # kein Substantiv
+            
+            genus = self._genus_index.get(wort)
+            if genus is not None:
+                quelle, erlaubt = 'lexikon', {genus}
+            else:
+                genus = self._genus_aus_endung(wort)
+                if genus is None:
+                    continue
+                quelle, erlaubt = 'endung', {genus}
+            
+            formen = ARTIKEL_FORMEN.get(artikel.lower())
+            if formen is None:
+                continue  # Sonderfälle der Faltung, z.B. ſ oder İ
+            if formen.isdisjoint(erlaubt):
+                befunde.append(ArtikelBefund(
+                    treffer.start(), artikel, wort, genus, quelle,
+                    f"'{artikel} {wort}': {wort} ist {GENUS_NAMEN[genus]} ({NOMINATIV[genus]} {wort})"
+                ))
+        return befunde
 
 
 # ============= 3. SEMANTIK =============
 
+class FeldAnnotation(NamedTuple):
+    """Ein Wort des Textes mit seinen semantischen Feldern"""
+    position: int
+    wort: str
+    felder: List[str]
+
+
 class SemantikPruefer:
     """Prüft semantische Korrektheit und Bedeutung"""
     
-    def __init__(self):
+    def __init__(self, verwandte_maxsize: int = 4096):
+        # Gemerkte verwandte Begriffe, begrenzt (LRU)
+        self.verwandte_maxsize = verwandte_maxsize
+        
         # Bedeutungs-Mapping
         self.bedeutungen = {
             'Kabbala': 'Empfangen, Überlieferung',
@@ -1328,22 +376,98 @@ class SemantikPruefer:
             'Korrektur': ['Tiqqun', 'korrigieren', 'heilen', 'wiederherstellen'],
             'Verhüllung': ['Klipa', 'verbergen', 'verhüllen', 'bedecken']
         }
+        
+        self.kompiliere_index()
+    
+    def kompiliere_index(self):
+        """
+        Invertierter Index Begriff → Felder, einmal aufgebaut
+        (nach Änderungen an wortfelder erneut aufrufen).
+        Verwandte Begriffe werden pro Begriff beim ersten Abruf
+        bestimmt und in einem begrenzten LRU-Cache gemerkt - bei Feldern
+        mit tausenden Begriffen wäre die vollständige Tabelle quadratisch groß.
+        """
+        self._felder_von: Dict[str, List[str]] = {}
+        for feld, begriffe in self.wortfelder.items():
+            for begriff in begriffe:
+                self._felder_von.setdefault(begriff, []).append(feld)
+        self._verwandte = lru_cache(maxsize=self.verwandte_maxsize)(self._bestimme_verwandte)
+    
+    def lade_wortfelder(self, pfad: str, ersetzen: bool = False):
+        """
+        Lädt Wortfelder aus YAML (Feld: [Begriff, ...]) und ergänzt
+        oder ersetzt die vorhandenen. Für große Lexika den C-Parser
+        von PyYAML verwenden, falls vorhanden.
+        """
+        import yaml  # nur hier gebraucht - nicht beim Modul-Import laden
+        
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(pfad, 'r', encoding='utf-8') as datei:
+            felder = yaml.load(datei, Loader=loader) or {}
+        
+        if ersetzen:
+            self.wortfelder = {}
+        for feld, begriffe in felder.items():
+            vorhanden = self.wortfelder.setdefault(str(feld), [])
+            bekannt = set(vorhanden)
+            for begriff in begriffe or []:
+                begriff = str(begriff)
+                if begriff not in bekannt:
+                    vorhanden.append(begriff)
+                    bekannt.add(begriff)
+        self.kompiliere_index()
+    
+    def felder_von(self, wort: str) -> List[str]:
+        """Semantische Felder eines Wortes (am Satzanfang auch klein gesucht)"""
+        felder = self._felder_von.get(wort)
+        if felder is None and wort[:1].isupper():
+            felder = self._felder_von.get(wort[0].lower() + wort[1:])
+        return felder or []
+    
+    def annotiere_text(self, text: str) -> List[FeldAnnotation]:
+        """Jedes Wort des Textes, das zu einem Wortfeld gehört, in einem Durchlauf"""
+        annotationen = []
+        for treffer in WORT_MUSTER.finditer(text):
+            felder = self.felder_von(treffer.group())
+            if felder:
+                annotationen.append(FeldAnnotation(treffer.start(), treffer.group(), felder))
+        return annotationen
+    
+    def feld_heatmap(self, texte: List[str]) -> Dict[str, List[int]]:
+        """Feld → Anzahl der Treffer je Text (z.B. je Vortrag einer Reihe)"""
+        heatmap = {feld: [0] * len(texte) for feld in self.wortfelder}
+        for i, text in enumerate(texte):
+            for annotation in self.annotiere_text(text):
+                for feld in annotation.felder:
+                    heatmap[feld][i] += 1
+        return heatmap
     
     def erklaere_begriff(self, begriff: str) -> Optional[str]:
         """Gibt Erklärung eines Begriffs zurück"""
         return self.bedeutungen.get(begriff)
     
+    def _bestimme_verwandte(self, wort: str) -> Tuple[str, ...]:
+        verwandte = []
+        for feld in self._felder_von[wort]:
+            verwandte.extend([b for b in self.wortfelder[feld] if b != wort])
+        return tuple(verwandte)
+    
     def finde_verwandte_begriffe(self, wort: str) -> List[str]:
         """Findet semantisch verwandte Begriffe"""
-        verwandte = []
-        for feld, begriffe in self.wortfelder.items():
-            if wort in begriffe:
-                verwandte.extend([b for b in begriffe if b != wort])
-        return verwandte
+        if wort not in self._felder_von:
+            return []  # unbekannte Wörter nicht merken
+        return list(self._verwandte(wort))
 
 
 # ============= 4. AUSDRUCK UND STIL =============
 
+class StilTreffer(NamedTuple):
+    """Ein zu vermeidender Ausdruck im Text"""
+    position: int
+    text: str         # wie im Text geschrieben
+    ausdruck: str     # Eintrag aus anthropomorph_vermeiden
+    alternative: str  # Vorschlag ('' wenn keiner hinterlegt)
+
 class AusdruckStilPruefer:
     """Prüft Ausdruck und Schreibstil"""
     
@@ -1377,16 +501,63 @@ class AusdruckStilPruefer:
             "Er": "die Höhere Kraft",
             "Seine": "die göttliche"
         }
+        
+        self.kompiliere_ausdruecke()
+    
+    def kompiliere_ausdruecke(self):
+        """
+        Alle zu vermeidenden Ausdrücke als EIN Präfix-Baum-Muster - auch
+        hunderte Einträge kosten nur einen Durchlauf über den Text
+        (nach Änderungen an anthropomorph_vermeiden erneut aufrufen)
+        """
+        # lower() statt casefold(): casefold macht aus ß ein ss, das
+        # IGNORECASE im Text nicht wiederfindet
+        self._ausdruecke = {ausdruck.lower(): ausdruck for ausdruck in self.anthropomorph_vermeiden}
+        self._ausdruck_muster = re.compile(
+            r'\b(?:' + trie_muster(self._ausdruecke) + r')\b', re.IGNORECASE
+        ) if self._ausdruecke else None
+    
+    def ergaenze_ausdruecke(self, ausdruecke: Dict[str, str]):
+        """Weitere Ausdrücke samt Alternative aufnehmen ('' = keine)"""
+        for ausdruck, alternative in ausdruecke.items():
+            if ausdruck not in self.anthropomorph_vermeiden:
+                self.anthropomorph_vermeiden.append(ausdruck)
+            if alternative:
+                self.spirituelle_alternativen[ausdruck] = alternative
+        self.kompiliere_ausdruecke()
+    
+    def finde_ausdruecke(self, text: str) -> List[StilTreffer]:
+        """Jedes Vorkommen eines zu vermeidenden Ausdrucks mit Position"""
+        if self._ausdruck_muster is None:
+            return []
+        treffer = []
+        # Ohne Groß-/Kleinschreibung direkt im Original - die Positionen
+        # stimmen, auch wo lower() die Länge ändern würde (İ → i̇)
+        for gefunden in self._ausdruck_muster.finditer(text):
+            ausdruck = self._ausdruecke.get(gefunden.group().lower())
+            if ausdruck is None:
+                continue  # Sonderfälle der Faltung, z.B. ſ
+            treffer.append(StilTreffer(
+                gefunden.start(), gefunden.group(), ausdruck,
+                self.spirituelle_alternativen.get(ausdruck, "")
+            ))
+        return treffer
     
     def pruefe_stil(self, text: str, stil: str = 'spirituell') -> List[str]:
         """Prüft Text auf Stil-Konformität"""
+        # Prüfe auf anthropomorphe Ausdrücke (je Ausdruck eine Meldung)
+        vorkommen: Dict[str, List[int]] = {}
+        for treffer in self.finde_ausdruecke(text):
+            vorkommen.setdefault(treffer.ausdruck, []).append(treffer.position)
+        return self.meldungen(vorkommen)
+    
+    def meldungen(self, vorkommen: Dict[str, List[int]]) -> List[str]:
+        """Eine Meldung je Ausdruck: Ausdruck → Positionen"""
         probleme = []
-        
-        # Prüfe auf anthropomorphe Ausdrücke
-        for ausdruck in self.anthropomorph_vermeiden:
-            if ausdruck.lower() in text.lower():
-                alt = self.spirituelle_alternativen.get(ausdruck, "")
-                probleme.append(f"Vermeide: '{ausdruck}' → '{alt}'")
+        for ausdruck, positionen in vorkommen.items():
+            alt = self.spirituelle_alternativen.get(ausdruck, "")
+            stellen = ", ".join(str(position) for position in positionen)
+            probleme.append(f"Vermeide: '{ausdruck}' → '{alt}' ({len(positionen)}× an Position {stellen})")
         
         return probleme
 
@@ -1411,21 +582,107 @@ class ZerEliminator:
             'zersetzen': 'umwandeln',
             'zersplittern': 'sich teilen'
         }
-    
-    def eliminiere_zer(self, text: str) -> Tuple[str, List[str]]:
-        """Ersetzt alle zer-Wörter"""
-        aenderungen = []
         
+        # Stammformen für die Flexion: Infinitiv, 3. Person Präsens,
+        # Präteritum, Partizip II. None = keine Ein-Wort-Entsprechung
+        # (reflexiv/trennbar: "zerfällt" → "löst sich auf")
+        self.zer_stammformen = {
+            ('zerbrechen', 'zerbricht', 'zerbrach', 'zerbrochen'):
+                ('bersten', 'berstet', 'barst', 'geborsten'),
+            ('zerstören', 'zerstört', 'zerstörte', 'zerstört'):
+                ('wandeln', 'wandelt', 'wandelte', 'gewandelt'),
+            ('zerreißen', 'zerreißt', 'zerriss', 'zerrissen'):
+                ('trennen', 'trennt', 'trennte', 'getrennt'),
+            ('zerschlagen', 'zerschlägt', 'zerschlug', 'zerschlagen'):
+                ('transformieren', 'transformiert', 'transformierte', 'transformiert'),
+            ('zerfallen', 'zerfällt', 'zerfiel', 'zerfallen'):
+                (None, None, None, 'aufgelöst'),
+            ('zersetzen', 'zersetzt', 'zersetzte', 'zersetzt'):
+                (None, None, None, 'umgewandelt'),
+            ('zersplittern', 'zersplittert', 'zersplitterte', 'zersplittert'):
+                (None, None, None, 'geteilt')
+        }
+        
+        # Substantive auf -ung (Plural auf -en)
+        self.zer_substantive = {
+            'Zerstörung': 'Wandlung'
+        }
+        
+        self.kompiliere_formen()
+    
+    @staticmethod
+    def _konjugiere(infinitiv: str, praesens: str, praeteritum: str) -> List[str]:
+        """Finite Formen in fester Reihenfolge (für Quelle und Ziel gleich)"""
+        stamm = infinitiv[:-2] if infinitiv.endswith('en') else infinitiv[:-1]
+        # du zerbrichst, aber du zerreißt
+        du = praesens if praesens[-2:-1] in ('s', 'ß', 'z', 'x') else praesens[:-1] + 'st'
+        ihr = stamm + ('et' if stamm.endswith(('t', 'd')) else 't')
+        plural = praeteritum + ('n' if praeteritum.endswith('e') else 'en')
+        # 3. Person vor 2. Person: bei "zerreißt" gilt "trennt", nicht "trennst"
+        return [infinitiv, stamm + 'e', praesens, ihr, du, praeteritum, plural]
+    
+    def erzeuge_formen(self) -> Dict[str, str]:
+        """
+        Alle flektierten zer-Formen (klein geschrieben) mit ihrem Ersatz.
+        Bei gleichlautenden Formen gilt die zuerst erzeugte: erst die
+        Einträge aus zer_transformationen, dann Verbformen, dann die
+        Partizip-Adjektive ("zerstörte" → "wandelte", nicht "gewandelte").
+        """
+        formen: Dict[str, str] = {}
         for alt, neu in self.zer_transformationen.items():
-            if alt in text:
-                text = text.replace(alt, neu)
-                aenderungen.append(f"{alt} → {neu}")
-            # Auch Großschreibung
-            if alt.capitalize() in text:
-                text = text.replace(alt.capitalize(), neu.capitalize())
-                aenderungen.append(f"{alt.capitalize()} → {neu.capitalize()}")
+            formen.setdefault(alt.lower(), neu)
         
-        return text, aenderungen
+        for quelle, ziel in self.zer_stammformen.items():
+            if ziel[0] is not None:
+                for alt, neu in zip(self._konjugiere(*quelle[:3]), self._konjugiere(*ziel[:3])):
+                    formen.setdefault(alt, neu)
+            formen.setdefault(quelle[3], ziel[3])
+        
+        for quelle, ziel in self.zer_stammformen.items():
+            for endung in ('e', 'en', 'em', 'er', 'es'):
+                formen.setdefault(quelle[3] + endung, ziel[3] + endung)
+        
+        for alt, neu in self.zer_substantive.items():
+            formen.setdefault(alt.lower(), neu)
+            formen.setdefault(alt.lower() + 'en', neu + 'en')
+        
+        return formen
+    
+    def kompiliere_formen(self):
+        """Alle Formen als EIN Muster (nach Änderungen an den Tabellen erneut aufrufen)"""
+        self.formen = self.erzeuge_formen()
+        self._formen_muster = re.compile(r'\b(?:' + trie_muster(self.formen) + r')\b', re.IGNORECASE)
+    
+    def eliminiere_zer_mit_positionen(self, text: str) -> Tuple[str, List[Ersetzung]]:
+        """
+        Ersetzt alle zer-Formen in einem Durchlauf, die Schreibung
+        (klein, groß am Satzanfang, VERSALIEN) bleibt erhalten
+        """
+        teile = []
+        ersetzungen = []
+        ende = 0
+        for treffer in self._formen_muster.finditer(text):
+            alt = treffer.group()
+            ziel = self.formen.get(alt.lower())
+            if ziel is None:
+                continue  # Sonderfälle der Faltung, z.B. ſ oder İ
+            neu = uebertrage_schreibung(alt, ziel)
+            teile.append(text[ende:treffer.start()])
+            teile.append(neu)
+            ende = treffer.end()
+            ersetzungen.append(Ersetzung(treffer.start(), alt, neu))
+        
+        if not ersetzungen:
+            return text, ersetzungen
+        teile.append(text[ende:])
+        return ''.join(teile), ersetzungen
+    
+    def eliminiere_zer(self, text: str) -> Tuple[str, List[str]]:
+        """Ersetzt alle zer-Wörter"""
+        text, ersetzungen = self.eliminiere_zer_mit_positionen(text)
+        # Jede Änderung einmal nennen, in der Reihenfolge des Auftretens
+        aenderungen = dict.fromkeys(f"{e.alt} → {e.neu}" for e in ersetzungen)
+        return text, list(aenderungen)
 
 
 # ============= 6. SPRACHWISSENSCHAFTLICHE WERKZEUGE =============
@@ -1458,25 +715,20 @@ class SprachWerkzeuge:
             'wortart': self._bestimme_wortart(wort)
         }
     
+    # Herkunftsdatenbank (einmal pro Klasse, nicht pro Aufruf)
+    HERKUNFT_DB = {
+        'Kabbala': {'sprache': 'Hebräisch', 'wurzel': 'קבל (QBL)', 'bedeutung': 'empfangen'},
+        'Zimzum': {'sprache': 'Hebräisch', 'wurzel': 'צמצם', 'bedeutung': 'zusammenziehen'},
+        'Schechina': {'sprache': 'Hebräisch', 'wurzel': 'שכן', 'bedeutung': 'wohnen'}
+    }
+    
     def etymologische_herkunft(self, begriff: str) -> Dict:
         """Bestimmt Wortherkunft"""
-        herkunft_db = {
-            'Kabbala': {'sprache': 'Hebräisch', 'wurzel': 'קבל (QBL)', 'bedeutung': 'empfangen'},
-            'Zimzum': {'sprache': 'Hebräisch', 'wurzel': 'צמצם', 'bedeutung': 'zusammenziehen'},
-            'Schechina': {'sprache': 'Hebräisch', 'wurzel': 'שכן', 'bedeutung': 'wohnen'}
-        }
-        return herkunft_db.get(begriff, {'sprache': 'unbekannt'})
-    
-    def gematria_berechnung(self, wort: str) -> int:
-        """Berechnet Gematria-Wert"""
-        gematria_werte = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ל': 30, 'מ': 40, 'נ': 50, 'ס': 60,
-            'ע': 70, 'פ': 80, 'צ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
-        return sum(gematria_werte.get(buchstabe, 0) for buchstabe in wort)
+        return self.HERKUNFT_DB.get(begriff, {'sprache': 'unbekannt'})
+    
+    def gematria_berechnung(self, wort: str, methode: str = 'standard') -> int:
+        """Berechnet Gematria-Wert (standard, klein oder ordinal)"""
+        return gematria(wort, methode)
     
     def _silben_trennung(self, wort: str) -> List[str]:
         """Trennt Wort in Silben"""
@@ -1556,44 +808,348 @@ class SprachWerkzeuge:
         return 'unbestimmt'
 
 
+def _speicher(objekt) -> int:
+    """Ungefährer Speicherbedarf einer Analyse (Dicts, Listen, Strings)"""
+    groesse = sys.getsizeof(objekt)
+    if isinstance(objekt, dict):
+        groesse += sum(_speicher(k) + _speicher(v) for k, v in objekt.items())
+    elif isinstance(objekt, (list, tuple)):
+        groesse += sum(_speicher(element) for element in objekt)
+    return groesse
+
+
+class WortAnalyseCache:
+    """Begrenzter LRU-Cache: Wort → Analyse, mit Treffer- und Speicherzählern"""
+    
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._eintraege: "OrderedDict[str, Tuple[Dict, int]]" = OrderedDict()
+    
+    def get(self, wort: str) -> Optional[Dict]:
+        eintrag = self._eintraege.get(wort)
+        if eintrag is None:
+            self.misses += 1
+            return None
+        self._eintraege.move_to_end(wort)
+        self.hits += 1
+        return eintrag[0]
+    
+    def put(self, wort: str, analyse: Dict):
+        if self.maxsize <= 0:
+            return
+        alt = self._eintraege.pop(wort, None)
+        if alt is not None:
+            self.bytes -= alt[1]
+        groesse = _speicher(wort) + _speicher(analyse)
+        self._eintraege[wort] = (analyse, groesse)
+        self.bytes += groesse
+        while len(self._eintraege) > self.maxsize:
+            _, (_, verdraengt) = self._eintraege.popitem(last=False)
+            self.bytes -= verdraengt
+    
+    def clear(self):
+        self._eintraege.clear()
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+    
+    def info(self) -> Dict:
+        gesamt = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / gesamt if gesamt else 0.0,
+            'size': len(self._eintraege),
+            'maxsize': self.maxsize,
+            'bytes': self.bytes
+        }
+
+
+class TokenAnalyse(NamedTuple):
+    """Ein Wort des Textes mit seiner (geteilten) Analyse"""
+    position: int
+    wort: str
+    analyse: Dict  # aus dem Cache - nicht verändern
+
+
+class KorpusAnalyse:
+    """
+    Analyse auf Korpus-Ebene: jedes verschiedene Wort wird nur einmal
+    untersucht (Phonetik, Morphologie, Etymologie, Gematria).
+    Worthäufigkeiten folgen dem Zipfschen Gesetz - die meisten
+    Aufrufe sind Wiederholungen und kommen aus dem LRU-Cache.
+    """
+    
+    WORT_MUSTER = WORT_MUSTER
+    
+    def __init__(self, werkzeuge: Optional[SprachWerkzeuge] = None, maxsize: int = 100_000):
+        self.werkzeuge = werkzeuge or SprachWerkzeuge()
+        self.cache = WortAnalyseCache(maxsize)
+    
+    def analysiere_wort(self, wort: str) -> Dict:
+        """Vollständige Analyse eines Wortes (aus dem Cache, falls vorhanden)"""
+        analyse = self.cache.get(wort)
+        if analyse is None:
+            analyse = {
+                'phonetik': self.werkzeuge.phonetische_analyse(wort),
+                'morphologie': self.werkzeuge.morphologische_analyse(wort),
+                'etymologie': self.werkzeuge.etymologische_herkunft(wort),
+                'gematria': self.werkzeuge.gematria_berechnung(wort)
+            }
+            self.cache.put(wort, analyse)
+        return analyse
+    
+    def analysiere_text(self, text: str) -> List[TokenAnalyse]:
+        """Zerlegt den Text einmal in Wörter und analysiert jedes davon"""
+        return [
+            TokenAnalyse(treffer.start(), treffer.group(), self.analysiere_wort(treffer.group()))
+            for treffer in self.WORT_MUSTER.finditer(text)
+        ]
+    
+    def info(self) -> Dict:
+        """Trefferquote und Speicherbedarf des Caches"""
+        return self.cache.info()
+
+
 # ============= HAUPTKLASSE =============
 
+class BlockErgebnis(NamedTuple):
+    """Prüfung eines Textblocks - Positionen relativ zum Block"""
+    korrigiert: str
+    transliteriert_laenge: int
+    ersetzungen: List[Ersetzung]      # im Original-Block
+    zer_ersetzungen: List[Ersetzung]  # im transliterierten Block
+    stil_treffer: List[StilTreffer]   # im korrigierten Block
+
+
+# Prüfer im Arbeitsprozess (siehe vollstaendige_pruefung_parallel)
+_block_pruefer: Optional["DeutscheSchreibweise"] = None
+
+def _init_block_worker(transliterator, zer_eliminator, stil):
+    global _block_pruefer
+    _block_pruefer = DeutscheSchreibweise()
+    # Komponenten des Aufrufers übernehmen (auch mit ergänzten Tabellen)
+    _block_pruefer.transliterator = transliterator
+    _block_pruefer.zer_eliminator = zer_eliminator
+    _block_pruefer.stil = stil
+
+def _pruefe_block_in_worker(block: str) -> BlockErgebnis:
+    ergebnis = _block_pruefer.pruefe_block(block)
+    # Schlichte Tupel statt NamedTuples - etwa zehnmal schneller gepickelt
+    return BlockErgebnis(
+        ergebnis.korrigiert, ergebnis.transliteriert_laenge,
+        [tuple(e) for e in ergebnis.ersetzungen],
+        [tuple(e) for e in ergebnis.zer_ersetzungen],
+        [tuple(t) for t in ergebnis.stil_treffer]
+    )
+
+
 class DeutscheSchreibweise:
-    """Hauptklasse für deutsche Schreibweise im Ez Chajim System"""
+    """
+    Hauptklasse für deutsche Schreibweise im Ez Chajim System.
     
-    def __init__(self):
-        self.transliterator = HebraischDeutschTransliterator()
-        self.orthografie = DeutscheOrthografie()
-        self.semantik = SemantikPruefer()
-        self.stil = AusdruckStilPruefer()
-        self.zer_eliminator = ZerEliminator()
-        self.werkzeuge = SprachWerkzeuge()
+    Die Komponenten entstehen erst beim ersten Zugriff - wer nur
+    transliteriert, baut weder Sprachwerkzeuge noch Semantik auf
+    (Kaltstart von CLI und Serverless-Handlern).
+    
+    block_groesse > 0 teilt lange Texte in Blöcke (an Zeilen- und
+    Satzgrenzen) und prüft sie in `prozesse` Arbeitsprozessen.
+    """
+    
+    def __init__(self, block_groesse: int = 0, prozesse: Optional[int] = None):
+        self.block_groesse = block_groesse
+        self.prozesse = prozesse
+    
+    @cached_property
+    def transliterator(self) -> HebraischDeutschTransliterator:
+        return HebraischDeutschTransliterator()
+    
+    @cached_property
+    def orthografie(self) -> DeutscheOrthografie:
+        return DeutscheOrthografie()
+    
+    @cached_property
+    def semantik(self) -> SemantikPruefer:
+        return SemantikPruefer()
+    
+    @cached_property
+    def stil(self) -> AusdruckStilPruefer:
+        return AusdruckStilPruefer()
+    
+    @cached_property
+    def zer_eliminator(self) -> ZerEliminator:
+        return ZerEliminator()
+    
+    @cached_property
+    def werkzeuge(self) -> SprachWerkzeuge:
+        return SprachWerkzeuge()
+    
+    @cached_property
+    def korpus(self) -> KorpusAnalyse:
+        return KorpusAnalyse(self.werkzeuge)
+    
+    def komponenten(self) -> List[str]:
+        """Namen der bereits aufgebauten Komponenten"""
+        return [name for name in ('transliterator', 'orthografie', 'semantik', 'stil',
+                                  'zer_eliminator', 'werkzeuge', 'korpus')
+                if name in self.__dict__]
+    
+    def analysiere_text(self, text: str) -> List[TokenAnalyse]:
+        """Sprachwissenschaftliche Analyse aller Wörter (je Wort einmal berechnet)"""
+        return self.korpus.analysiere_text(text)
+    
+    def _vorfilter(self) -> Optional["re.Pattern"]:
+        """
+        EIN Muster über alle Suchtexte der Schritte 1-3, klein und ohne
+        Wortgrenzen. Neu gebaut, sobald sich der Inhalt der Regeln ändert -
+        auch nur ein Ersatz: eine Regel, die bisher nur die Schreibweise
+        bestätigte, muss danach in den Vorfilter
+        """
+        stand = (tuple(self.transliterator.wwak_regeln.items()),
+                 tuple(self.zer_eliminator.formen),
+                 tuple(self.stil.anthropomorph_vermeiden))
+        if self.__dict__.get('_vorfilter_stand') != stand:
+            texte = [alt for alt, neu in self.transliterator.wwak_regeln.items() if alt != neu]
+            texte += self.zer_eliminator.formen
+            texte += self.stil.anthropomorph_vermeiden
+            # Wörter mit kürzerem Anfang aus der Liste sind überflüssig
+            noetig: List[str] = []
+            for text in sorted({text.lower() for text in texte}):
+                if not noetig or not text.startswith(noetig[-1]):
+                    noetig.append(text)
+            self._vorfilter_muster = re.compile(trie_muster(noetig)) if noetig else None
+            self._vorfilter_stand = stand
+        return self._vorfilter_muster
+    
+    def kann_betroffen_sein(self, text: str) -> bool:
+        """
+        Vorfilter für die Schritte 1-3: False heißt, keine Regel kann
+        greifen - der Text bleibt unverändert und ohne Meldung.
+        Alle Schritte finden nur Treffer, deren lower() ein Suchtext
+        ist; ein Suchtext im Text steht also auch in text.lower().
+        """
+        muster = self._vorfilter()
+        return muster is not None and muster.search(text.lower()) is not None
+    
+    def pruefe_block(self, text: str) -> BlockErgebnis:
+        """Schritte 1-3 der Prüfung für einen Text oder Textblock"""
+        if not self.kann_betroffen_sein(text):
+            return BlockErgebnis(text, len(text), [], [], [])
+        # 1. Transliteration
+        transliteriert, ersetzungen = self.transliterator.transliteriere_mit_positionen(text)
+        # 2. Zer-Elimination (Positionen im transliterierten Text)
+        korrigiert, zer_ersetzungen = self.zer_eliminator.eliminiere_zer_mit_positionen(transliteriert)
+        # 3. Stil-Prüfung
+        stil_treffer = self.stil.finde_ausdruecke(korrigiert)
+        return BlockErgebnis(korrigiert, len(transliteriert), ersetzungen, zer_ersetzungen, stil_treffer)
     
     def vollstaendige_pruefung(self, text: str) -> Dict:
         """Führt vollständige Prüfung durch"""
+        if self.block_groesse > 0 and len(text) > self.block_groesse:
+            return self.vollstaendige_pruefung_parallel(text, self.block_groesse, self.prozesse)
+        return self._bericht(text, [(self.pruefe_block(text), 0, 0, 0)])
+    
+    def _regel_texte(self) -> List[str]:
+        """Alle Such- und Ersatztexte der Schritte 1-3"""
+        texte = list(self.stil.anthropomorph_vermeiden)
+        for regeln in (self.transliterator.wwak_regeln, self.zer_eliminator.formen):
+            for alt, neu in regeln.items():
+                texte += [alt, neu]
+        return texte
+    
+    def teile_bloecke(self, text: str, block_groesse: int) -> List[str]:
+        """
+        Teilt den Text in Blöcke von etwa block_groesse Zeichen, nur
+        nach einem Zeilenumbruch oder nach einem Satzende. Enthält eine
+        Regel selbst eine solche Grenze, wird dort nicht geteilt - sonst
+        könnte ein Treffer über eine Blockgrenze reichen.
+        Zusammengefügt ergeben die Blöcke wieder genau den Text.
+        """
+        texte = self._regel_texte()
+        if any('\n' in regel for regel in texte):
+            return [text]
+        if any(re.search(r'[.!?]\s', regel) for regel in texte):
+            grenzen = re.compile(r'\n')
+        else:
+            grenzen = re.compile(r'\n|[.!?](?=\s)')
+        
+        block_groesse = max(block_groesse, 1)
+        bloecke = []
+        anfang = 0
+        while True:
+            # Erste Grenze, die den Block mindestens block_groesse lang macht
+            grenze = grenzen.search(text, anfang + block_groesse - 1)
+            if grenze is None:
+                break
+            bloecke.append(text[anfang:grenze.end()])
+            anfang = grenze.end()
+        bloecke.append(text[anfang:])
+        return [block for block in bloecke if block] or [text]
+    
+    def vollstaendige_pruefung_parallel(self, text: str, block_groesse: int = 64_000,
+                                        prozesse: Optional[int] = None) -> Dict:
+        """
+        Wie vollstaendige_pruefung(), die Blöcke laufen aber in einem
+        Prozess-Pool. Das Ergebnis ist identisch mit dem sequentiellen
+        Weg - alle Positionen beziehen sich auf den ganzen Text.
+        """
+        bloecke = self.teile_bloecke(text, block_groesse)
+        if len(bloecke) == 1 or prozesse == 1:
+            ergebnisse = [self.pruefe_block(block) for block in bloecke]
+        else:
+            # Erst hier laden - der Import kostet Startzeit
+            import multiprocessing
+            with multiprocessing.Pool(
+                prozesse,
+                initializer=_init_block_worker,
+                initargs=(self.transliterator, self.zer_eliminator, self.stil)
+            ) as pool:
+                ergebnisse = pool.map(_pruefe_block_in_worker, bloecke)
+        
+        # Zusammenführen: Positionen um den Anfang des Blocks verschieben
+        verschoben = []
+        original_anfang = transliteriert_anfang = korrigiert_anfang = 0
+        for block, ergebnis in zip(bloecke, ergebnisse):
+            verschoben.append((ergebnis, original_anfang, transliteriert_anfang, korrigiert_anfang))
+            original_anfang += len(block)
+            transliteriert_anfang += ergebnis.transliteriert_laenge
+            korrigiert_anfang += len(ergebnis.korrigiert)
+        return self._bericht(text, verschoben)
+    
+    def _bericht(self, original: str, bloecke: List[Tuple[BlockErgebnis, int, int, int]]) -> Dict:
+        """
+        Ergebnis-Bericht aus den Blöcken, je Block mit dem Anfang im
+        Original, im transliterierten und im korrigierten Text
+        """
         ergebnis = {
-            'original': text,
+            'original': original,
             'korrekturen': [],
             'warnungen': [],
             'empfehlungen': []
         }
+        korrekturen = ergebnis['korrekturen']
         
-        # 1. Transliteration
-        korrigiert = self.transliterator.transliteriere(text)
-        if korrigiert != text:
-            ergebnis['korrekturen'].append(f"Transliteration: {len(korrigiert)} Zeichen geändert")
-            text = korrigiert
-        
-        # 2. Zer-Elimination
-        text, zer_aenderungen = self.zer_eliminator.eliminiere_zer(text)
-        if zer_aenderungen:
-            ergebnis['korrekturen'].extend(zer_aenderungen)
+        # Entpacken statt Attributzugriff: aus dem Pool kommen schlichte Tupel
+        for block, anfang, _, _ in bloecke:
+            for position, alt, neu in block.ersetzungen:
+                korrekturen.append(f"Transliteration: {alt} → {neu} (Position {position + anfang})")
+        for block, _, anfang, _ in bloecke:
+            for position, alt, neu in block.zer_ersetzungen:
+                korrekturen.append(f"Zer-Elimination: {alt} → {neu} (Position {position + anfang})")
         
-        # 3. Stil-Prüfung
-        stil_probleme = self.stil.pruefe_stil(text)
+        vorkommen: Dict[str, List[int]] = {}
+        for block, _, _, anfang in bloecke:
+            for position, _, ausdruck, _ in block.stil_treffer:
+                vorkommen.setdefault(ausdruck, []).append(position + anfang)
+        stil_probleme = self.stil.meldungen(vorkommen)
         if stil_probleme:
             ergebnis['warnungen'].extend(stil_probleme)
         
+        text = ''.join(block.korrigiert for block, _, _, _ in bloecke)
+        
         # 4. Finale Version
         ergebnis['korrigiert'] = text
         
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gematria-Kern für Ez Chajim
+===========================
+
+Eine gemeinsame Gematria für alle Module (Sprachwerkzeuge,
+Manuskript-Prozessor). Jede Methode ist eine fertige Tabelle
+Codepunkt → Wert, einmal beim Import aufgebaut.
+
+Methoden:
+    standard  - Mispar Hechrachi (Alef=1 ... Taw=400)
+    klein     - Mispar Katan (nur die Einerstelle: Jod=1, Qof=1, Taw=4)
+    ordinal   - Mispar Siduri (Stellung im Alef-Bet: 1 ... 22)
+
+Endbuchstaben (ך ם ן ף ץ) zählen wie ihre Grundform.
+
+Für Millionen von Wörtern berechnet gematria_batch() alle Werte auf
+einmal mit NumPy: alle Codepunkte hintereinander, Tabellen-Lookup als
+Array-Index, Summen pro Wort mit np.add.reduceat. Ohne NumPy fällt
+es auf die Schleife in reinem Python zurück.
+"""
+
+from typing import Dict, List, Sequence
+
+# Alef-Bet in Reihenfolge, Endbuchstaben bei ihrer Grundform
+ALEF_BET = "אבגדהוזחטיכלמנסעפצקרשת"
+ENDBUCHSTABEN = {'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ'}
+
+# Tabellen-Bereich: alle hebräischen Buchstaben liegen darunter
+TABELLEN_GROESSE = 0x0600
+
+
+def _standardwert(stelle: int) -> int:
+    """Alef..Tet = 1..9, Jod..Zade = 10..90, Qof..Taw = 100..400"""
+    zehner, einer = divmod(stelle, 9)
+    return (einer + 1) * 10 ** zehner
+
+
+def _baue_werte() -> Dict[str, Dict[str, int]]:
+    werte: Dict[str, Dict[str, int]] = {'standard': {}, 'klein': {}, 'ordinal': {}}
+    for stelle, buchstabe in enumerate(ALEF_BET):
+        standard = _standardwert(stelle)
+        werte['standard'][buchstabe] = standard
+        werte['klein'][buchstabe] = int(str(standard)[0])
+        werte['ordinal'][buchstabe] = stelle + 1
+    for endform, grundform in ENDBUCHSTABEN.items():
+        for tabelle in werte.values():
+            tabelle[endform] = tabelle[grundform]
+    return werte
+
+
+WERTE = _baue_werte()
+METHODEN = tuple(WERTE)
+
+# Nachschlage-Tabellen: Index = Codepunkt, letzter Eintrag (0) für
+# alle Codepunkte außerhalb des Bereichs
+TABELLEN: Dict[str, List[int]] = {}
+for _methode, _werte in WERTE.items():
+    TABELLEN[_methode] = [0] * (TABELLEN_GROESSE + 1)
+    for _buchstabe, _wert in _werte.items():
+        TABELLEN[_methode][ord(_buchstabe)] = _wert
+
+
+def _werte_fuer(methode: str) -> Dict[str, int]:
+    try:
+        return WERTE[methode]
+    except KeyError:
+        raise ValueError(f"Unbekannte Gematria-Methode: {methode} (erlaubt: {', '.join(METHODEN)})")
+
+
+def gematria(wort: str, methode: str = 'standard') -> int:
+    """Gematria-Wert eines Wortes oder Textes (Nicht-Buchstaben zählen 0)"""
+    werte = _werte_fuer(methode)
+    return sum(werte[zeichen] for zeichen in wort if zeichen in werte)
+
+
+_numpy = None
+
+def _lade_numpy():
+    """NumPy erst bei Bedarf importieren - der Import kostet Startzeit"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy
+
+
+def gematria_batch(woerter: Sequence[str], methode: str = 'standard'):
+    """
+    Gematria-Werte vieler Wörter auf einmal.
+
+    Mit NumPy: ein Array (int64) in der Reihenfolge der Eingabe.
+    Ohne NumPy: eine Liste, Wert für Wert in Python berechnet.
+    """
+    _werte_fuer(methode)
+    np = _lade_numpy()
+    if not np:
+        return [gematria(wort, methode) for wort in woerter]
+
+    anzahl = len(woerter)
+    laengen = np.fromiter(map(len, woerter), dtype=np.int64, count=anzahl)
+    ergebnis = np.zeros(anzahl, dtype=np.int64)
+    if not laengen.any():
+        return ergebnis
+
+    # Alle Codepunkte hintereinander, ein Tabellen-Lookup für alle
+    codepunkte = np.frombuffer(''.join(woerter).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    tabelle = np.asarray(TABELLEN[methode], dtype=np.int64)
+    werte = tabelle[np.minimum(codepunkte, TABELLEN_GROESSE)]
+
+    # Summe pro Wort; leere Wörter würden reduceat verwirren - sie bleiben 0
+    anfaenge = np.cumsum(laengen) - laengen
+    belegt = laengen > 0
+    ergebnis[belegt] = np.add.reduceat(werte, anfaenge[belegt])
+    return ergebnis
@@ -11,10 +11,23 @@ KRITISCH: Jeder falsche Buchstabe leitet Licht zu den Klipot!
          Jeder richtige Buchstabe öffnet einen Kanal zu Ein Sof!
 """
 
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Iterator, Iterable
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+import codecs
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import threading
+import time
 
 # Integration mit anderen Modulen
 from typing import TYPE_CHECKING
@@ -36,6 +49,1367 @@ class WWAKViolation:
     correction: str
     severity: str  # "kritisch", "warnung", "hinweis"
     world_impact: Optional[str] = None  # Welche Welt wird beeinflusst
+    byte_position: Optional[int] = None  # UTF-8 Byte-Offset (nur bei Streams)
+    line: Optional[int] = None    # Zeile (ab 1), siehe LineIndex
+    column: Optional[int] = None  # Spalte (ab 1), siehe LineIndex
+
+@dataclass(frozen=True)
+class WWAKRule:
+    """Eine Regel des kombinierten Automaten (ein Wort, klein geschrieben)"""
+    word: str
+    violation_type: Optional[str]  # None = geschütztes Wort, nie melden
+    correction: Optional[str]      # None = aus dem Treffer ableiten
+    group: int                     # Reihenfolge der Prüfungen in check_text
+    order: int                     # Reihenfolge innerhalb der Regeltabelle
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Baut aus allen Wörtern einen Präfix-Baum und schreibt ihn als Regex.
+    Gemeinsame Präfixe werden nur einmal geprüft - das Muster verhält
+    sich wie ein kombinierter Automat statt wie eine lange Alternation.
+    """
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        alternatives = [re.escape(char) + emit(child)
+                        for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        # Längere Wörter zuerst versuchen, das Wortende darf auch hier liegen
+        return '(?:' + body + ')?' if '' in node else body
+
+    return emit(trie)
+
+# Zeichen, die re.IGNORECASE anders faltet als str.lower()
+# (ı, İ, ſ, K als Kelvin-Zeichen ...) - nur in diesen Blöcken
+_CASE_FOLD_CANDIDATES = "".join(
+    chr(code) for start, end in ((0x80, 0x250), (0x1E00, 0x1F00), (0x2100, 0x2150), (0xFB00, 0xFB50))
+    for code in range(start, end)
+)
+
+def _case_fold_table(letters: str) -> Dict[int, str]:
+    """
+    Zeichen, die re.IGNORECASE als einen der Buchstaben erkennt, die
+    str.lower() aber nicht auf genau diesen Buchstaben abbildet
+    (İ, ı, K als Kelvin-Zeichen ...) - als Tabelle für str.translate
+    """
+    if not letters:
+        return {}
+    table = {}
+    for char in re.findall('[' + re.escape(letters) + ']', _CASE_FOLD_CANDIDATES, re.IGNORECASE):
+        lowered = char.lower()
+        if len(lowered) == 1 and lowered in letters:
+            continue
+        for letter in letters:
+            if re.fullmatch(re.escape(letter), char, re.IGNORECASE):
+                table[ord(char)] = letter
+                break
+    return table
+
+class WWAKPrefilter:
+    """
+    Billiger Vorfilter: kann ein Text überhaupt einen Verstoß enthalten?
+
+    Sucht nur nach den kürzesten Regelwörtern, die in keinem anderen
+    enthalten sind, ohne Wortgrenzen und im klein geschriebenen Text.
+    Jedes Regelwort enthält eines davon - "kein Kandidat" ist also
+    sicher, ein Kandidat dagegen nur ein Hinweis für die volle Prüfung.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        words = {word.lower() for word in words}
+        self.needles = sorted(word for word in words
+                              if not any(other != word and other in word for other in words))
+        self.pattern = re.compile(_trie_pattern(self.needles)) if self.needles else None
+
+        # Zeichen, die die Regel-Suche als Buchstaben der Regelwörter
+        # erkennt, str.lower() aber nicht dazu macht: dann immer prüfen
+        letters = "".join(sorted(set("".join(self.needles))))
+        unsafe = "".join(sorted(map(chr, _case_fold_table(letters))))
+        self.unsafe = re.compile('[' + re.escape(unsafe) + ']') if unsafe else None
+
+    def might_match(self, text: str) -> bool:
+        """False nur, wenn sicher kein Regelwort im Text steht"""
+        if self.pattern is None:
+            return False
+        if self.unsafe is not None and self.unsafe.search(text):
+            return True
+        return self.pattern.search(text.lower()) is not None
+
+class WWAKMatcher:
+    """
+    Findet alle WWAK-Verstöße in EINEM Durchlauf über den Text.
+
+    Alle Regeltabellen (falsche Q-Formen, Lehnwörter, verbotene Formen,
+    geschützte deutsche Wörter) werden einmal zu einem Muster kompiliert.
+    Da jede Regel nur aus Wortzeichen besteht, ist jeder Treffer genau
+    ein ganzes Wort - die Treffer überlappen sich nie.
+    """
+
+    GROUP_FALSE_Q = 0
+    GROUP_MISSING_Q = 1
+    GROUP_FORBIDDEN_Q = 2
+
+    def __init__(self, hebrew_loanwords: Dict[str, str], german_protected: List[str],
+                 forbidden_q_forms: List[str], false_q_forms: List[str],
+                 fingerprint: str = ""):
+        self.fingerprint = fingerprint
+        self.rules: Dict[str, WWAKRule] = {}
+
+        # Geschützte Wörter zuerst - echte Regeln überschreiben sie
+        for i, word in enumerate(german_protected):
+            self._add(WWAKRule(word.lower(), None, None, -1, i))
+        # Früher ein einziges Muster - daher nur nach Position sortiert
+        for word in false_q_forms:
+            self._add(WWAKRule(word.lower(), "false_q_in_german", None, self.GROUP_FALSE_Q, 0))
+        for i, (wrong, correct) in enumerate(hebrew_loanwords.items()):
+            self._add(WWAKRule(wrong.lower(), "missing_q_in_hebrew", correct, self.GROUP_MISSING_Q, i))
+        for i, word in enumerate(forbidden_q_forms):
+            self._add(WWAKRule(word.lower(), "forbidden_q_form", None, self.GROUP_FORBIDDEN_Q, i))
+
+        self.pattern = re.compile(r'\b(?:' + _trie_pattern(self.rules) + r')\b', re.IGNORECASE)
+        self.prefilter = self._build_prefilter()
+        self.fold = self._build_fold()
+
+    def _add(self, rule: WWAKRule):
+        self.rules[rule.word] = rule
+
+    def _build_fold(self) -> Dict[int, str]:
+        # Faltung wie im Muster für Treffer, die lower() nicht findet
+        return _case_fold_table("".join(sorted(set("".join(self.rules)))))
+
+    def rule_for(self, word: str) -> Optional[WWAKRule]:
+        """Regel zu einem Treffer - auch für "KLİ" (lower() ergibt "kli̇")"""
+        rule = self.rules.get(word.lower())
+        if rule is None and self.fold:
+            rule = self.rules.get(word.translate(self.fold).lower())
+        return rule
+
+    def _build_prefilter(self) -> WWAKPrefilter:
+        # Geschützte Wörter erzeugen nie einen Verstoß
+        return WWAKPrefilter(rule.word for rule in self.rules.values()
+                             if rule.violation_type is not None)
+
+    def finditer(self, text: str, pos: int = 0,
+                 endpos: Optional[int] = None) -> Iterator[Tuple["re.Match", WWAKRule]]:
+        """Liefert (Treffer, Regel) für jedes Regelwort im Text"""
+        if endpos is None:
+            endpos = len(text)
+        rules = self.rules
+        for match in self.pattern.finditer(text, pos, endpos):
+            rule = rules.get(match.group().lower()) or self.rule_for(match.group())
+            if rule is not None and rule.violation_type is not None:
+                yield match, rule
+
+    def correction_for(self, word: str, rule: WWAKRule) -> Optional[str]:
+        """Korrektur zu einem Treffer (oder None, wenn kein Verstoß vorliegt)"""
+        if rule.group == self.GROUP_FALSE_Q:
+            return word.replace('Q', 'K').replace('q', 'k')
+        elif rule.group == self.GROUP_MISSING_Q:
+            # Nur wenn es ein Substantiv ist (Großschreibung prüfen)
+            if not word[0].isupper():
+                return None
+            return rule.correction
+        else:
+            return word.replace('q', 'k').replace('Q', 'k')
+
+    def violation_for(self, match: "re.Match", rule: WWAKRule) -> Optional[WWAKViolation]:
+        """Erzeugt den Verstoß zu einem Treffer (oder None, wenn keiner vorliegt)"""
+        word = match.group()
+        correction = self.correction_for(word, rule)
+        if correction is None:
+            return None
+
+        return WWAKViolation(
+            text=word,
+            position=match.start(),
+            violation_type=rule.violation_type,
+            correction=correction,
+            severity="kritisch"
+        )
+
+    def scan(self, text: str) -> List[WWAKViolation]:
+        """
+        Ein linearer Durchlauf über den Text.
+        Die Reihenfolge entspricht den früheren Einzelprüfungen:
+        nach Prüfung, dann nach Regel, dann nach Position.
+        """
+        found = []
+        for match, rule in self.finditer(text):
+            violation = self.violation_for(match, rule)
+            if violation is not None:
+                found.append((rule.group, rule.order, violation))
+
+        found.sort(key=lambda item: (item[0], item[1], item[2].position))
+        return [violation for _, _, violation in found]
+
+    def scan_compact(self, text: str) -> "ViolationSet":
+        """
+        Wie scan(), legt die Treffer aber direkt im Spaltenspeicher ab,
+        ohne WWAKViolation-Objekte zu erzeugen
+        """
+        strings = _StringTable()
+        buckets: Dict[Tuple[int, int], ViolationSet] = {}
+        for match, rule in self.finditer(text):
+            word = match.group()
+            correction = self.correction_for(word, rule)
+            if correction is None:
+                continue
+            bucket = buckets.get((rule.group, rule.order))
+            if bucket is None:
+                bucket = buckets[(rule.group, rule.order)] = ViolationSet(strings)
+            bucket.append(word, match.start(), rule.violation_type, correction, "kritisch")
+
+        result = ViolationSet(strings)
+        result.rule_fingerprint = self.fingerprint
+        for key in sorted(buckets):
+            result.extend(buckets[key])
+        return result
+
+    def order_key(self, violation: WWAKViolation) -> Tuple[int, int, int]:
+        """Sortierschlüssel wie in scan() für einen bereits gefundenen Verstoß"""
+        rule = self.rule_for(violation.text)
+        if rule is None:
+            # Unscharfe Treffer stehen hinter allen Regelgruppen
+            return (self.GROUP_FORBIDDEN_Q + 1, 0, violation.position)
+        return (rule.group, rule.order, violation.position)
+
+class LineIndex:
+    """
+    Zeilenanfänge eines Dokuments, einmal aufgebaut.
+    Zeile und Spalte einer Position kosten danach eine binäre Suche
+    statt eines erneuten Zählens der Zeilenumbrüche. Byte-Offsets
+    kommen aus den Byte-Anfängen der Zeilen; nur für Zeilen mit
+    Nicht-ASCII-Zeichen wird einmal eine Zeichen→Byte-Tabelle angelegt.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.line_starts = array('q', [0])
+        self.line_starts.extend(m.end() for m in re.finditer('\n', text))
+        self._line_byte_starts: Optional[array] = None
+        self._line_bytes: Dict[int, Optional[array]] = {}  # Zeile → Tabelle (None = ASCII)
+
+    def resolve(self, position: int) -> Tuple[int, int]:
+        """Position → (Zeile, Spalte), beide ab 1"""
+        line = bisect_right(self.line_starts, position) - 1
+        return line + 1, position - self.line_starts[line] + 1
+
+    def _line_end(self, line: int) -> int:
+        return self.line_starts[line + 1] if line + 1 < len(self.line_starts) else len(self.text)
+
+    def _byte_table(self, line: int) -> Optional[array]:
+        """Byte-Offsets der Zeichen einer Zeile ab Zeilenanfang, None für ASCII"""
+        if line not in self._line_bytes:
+            segment = self.text[self.line_starts[line]:self._line_end(line)]
+            table = None
+            if not segment.isascii():
+                # UTF-8-Länge je Zeichen (Surrogate wie mit surrogatepass: 3)
+                table = array('q', accumulate(
+                    (1 if code < 0x80 else 2 if code < 0x800 else 3 if code < 0x10000 else 4
+                     for code in map(ord, segment)),
+                    initial=0))
+            self._line_bytes[line] = table
+        return self._line_bytes[line]
+
+    def byte_offset(self, position: int) -> int:
+        """Position → UTF-8 Byte-Offset"""
+        if self._line_byte_starts is None:
+            starts = self.line_starts
+            byte_starts = array('q', [0])
+            for i in range(1, len(starts)):
+                segment = self.text[starts[i - 1]:starts[i]]
+                byte_starts.append(byte_starts[-1] + len(segment.encode('utf-8', 'surrogatepass')))
+            self._line_byte_starts = byte_starts
+        line = bisect_right(self.line_starts, position) - 1
+        column = position - self.line_starts[line]
+        table = self._byte_table(line)
+        return self._line_byte_starts[line] + (column if table is None else table[column])
+
+    def annotate(self, violations: Iterable[WWAKViolation]) -> List[WWAKViolation]:
+        """
+        Kopien der Verstöße mit Zeile, Spalte und Byte-Offset - die
+        Originale bleiben unverändert (sie können im Analyse-Cache liegen)
+        """
+        annotated = []
+        for violation in violations:
+            line, column = self.resolve(violation.position)
+            byte_position = violation.byte_position
+            if byte_position is None:
+                byte_position = self.byte_offset(violation.position)
+            annotated.append(replace(violation, line=line, column=column, byte_position=byte_position))
+        return annotated
+
+# Version des Automaten-Formats - bei Änderungen am Aufbau erhöhen
+RULE_FORMAT_VERSION = 1
+
+# Glossar als zusätzliche Regelquelle: fließt in den Fingerabdruck ein
+GLOSSAR_PATH = Path(__file__).resolve().parents[2] / "docs" / "glossar" / "wwaq-glossar.yaml"
+
+def rule_fingerprint(hebrew_loanwords: Dict[str, str], german_protected: List[str],
+                     forbidden_q_forms: List[str], false_q_forms: List[str],
+                     sources: Iterable[Path] = ()) -> str:
+    """Hash über alle Regeltabellen und Quelldateien"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "format": RULE_FORMAT_VERSION,
+        "hebrew_loanwords": list(hebrew_loanwords.items()),
+        "german_protected": list(german_protected),
+        "forbidden_q_forms": list(forbidden_q_forms),
+        "false_q_forms": list(false_q_forms)
+    }, ensure_ascii=False).encode("utf-8"))
+    for source in sources:
+        digest.update(str(source).encode("utf-8"))
+        try:
+            digest.update(Path(source).read_bytes())
+        except OSError:
+            digest.update(b"<fehlt>")
+    return digest.hexdigest()
+
+class WWAKRuleCompiler:
+    """
+    Baut den Regel-Automaten pro Fingerabdruck der Regelquellen nur
+    einmal im Prozess - alle Instanzen mit denselben Regeln teilen ihn.
+    (Ein Datei-Cache lohnt nicht: auch ein geladener Automat müsste
+    sein Muster neu kompilieren, das ist der Großteil der Bauzeit.)
+    """
+
+    # Zuletzt benutzte Automaten, begrenzt - ältere Regelstände fallen heraus
+    MAX_LOADED = 8
+    _loaded: "OrderedDict[str, WWAKMatcher]" = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, sources: Iterable[Path] = (GLOSSAR_PATH,)):
+        self.sources = list(sources)
+
+    def compile(self, hebrew_loanwords: Dict[str, str], german_protected: List[str],
+                forbidden_q_forms: List[str], false_q_forms: List[str]) -> WWAKMatcher:
+        fingerprint = rule_fingerprint(hebrew_loanwords, german_protected,
+                                       forbidden_q_forms, false_q_forms, self.sources)
+        with self._lock:
+            matcher = self._loaded.get(fingerprint)
+            if matcher is not None:
+                self._loaded.move_to_end(fingerprint)
+                return matcher
+        matcher = WWAKMatcher(hebrew_loanwords, german_protected, forbidden_q_forms,
+                              false_q_forms, fingerprint)
+        with self._lock:
+            self._loaded[fingerprint] = matcher
+            while len(self._loaded) > self.MAX_LOADED:
+                self._loaded.popitem(last=False)
+        return matcher
+
+class _StringTable:
+    """Internierte Zeichenketten - Index 0 steht für None"""
+
+    def __init__(self):
+        self.strings: List[Optional[str]] = [None]
+        self.ids: Dict[Optional[str], int] = {None: 0}
+
+    def intern(self, value: Optional[str]) -> int:
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+class ViolationSet:
+    """
+    Spaltenspeicher für sehr viele WWAK-Verstöße.
+
+    Positionen, Längen und Codes liegen in parallelen typisierten Arrays,
+    alle Zeichenketten (Text, Typ, Korrektur, Schwere) nur einmal in einer
+    gemeinsamen Tabelle. WWAKViolation-Objekte entstehen erst beim Zugriff.
+    """
+
+    def __init__(self, strings: Optional[_StringTable] = None):
+        self.strings = strings or _StringTable()
+        self.positions = array('q')
+        self.lengths = array('I')
+        self.texts = array('I')
+        self.types = array('I')
+        self.corrections = array('I')
+        self.severities = array('I')
+        self.world_impacts = array('I')
+        self.byte_positions = array('q')  # -1 = unbekannt
+        self.rule_fingerprint = ""
+        self._by_position: Optional[array] = None
+        # Optional: Zeile/Spalte/Byte-Offset werden erst beim Zugriff aufgelöst
+        self.line_index: Optional[LineIndex] = None
+
+    @classmethod
+    def from_violations(cls, violations: Iterable[WWAKViolation]) -> "ViolationSet":
+        result = cls()
+        for v in violations:
+            result.append(v.text, v.position, v.violation_type, v.correction,
+                          v.severity, v.world_impact, v.byte_position)
+        return result
+
+    def append(self, text: str, position: int, violation_type: str, correction: str,
+               severity: str, world_impact: Optional[str] = None,
+               byte_position: Optional[int] = None):
+        intern = self.strings.intern
+        self.positions.append(position)
+        self.lengths.append(len(text))
+        self.texts.append(intern(text))
+        self.types.append(intern(violation_type))
+        self.corrections.append(intern(correction))
+        self.severities.append(intern(severity))
+        self.world_impacts.append(intern(world_impact))
+        self.byte_positions.append(-1 if byte_position is None else byte_position)
+        self._by_position = None
+
+    def extend(self, other: "ViolationSet"):
+        """Hängt einen Speicher mit derselben String-Tabelle an"""
+        if other.strings is not self.strings:
+            for v in other:
+                self.append(v.text, v.position, v.violation_type, v.correction,
+                            v.severity, v.world_impact, v.byte_position)
+            return
+        for column in self._columns():
+            getattr(self, column).extend(getattr(other, column))
+        self._by_position = None
+
+    @staticmethod
+    def _columns() -> Tuple[str, ...]:
+        return ('positions', 'lengths', 'texts', 'types', 'corrections',
+                'severities', 'world_impacts', 'byte_positions')
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index: int) -> WWAKViolation:
+        strings = self.strings.strings
+        byte_position = self.byte_positions[index]
+        violation = WWAKViolation(
+            text=strings[self.texts[index]],
+            position=self.positions[index],
+            violation_type=strings[self.types[index]],
+            correction=strings[self.corrections[index]],
+            severity=strings[self.severities[index]],
+            world_impact=strings[self.world_impacts[index]],
+            byte_position=None if byte_position < 0 else byte_position
+        )
+        if self.line_index is not None:
+            violation = self.line_index.annotate((violation,))[0]
+        return violation
+
+    def __iter__(self) -> Iterator[WWAKViolation]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_list(self) -> List[WWAKViolation]:
+        return list(self)
+
+    def _take(self, indices: Iterable[int]) -> "ViolationSet":
+        result = ViolationSet(self.strings)
+        result.line_index = self.line_index
+        result.rule_fingerprint = self.rule_fingerprint
+        indices = list(indices)
+        for column in self._columns():
+            source = getattr(self, column)
+            getattr(result, column).extend(source[i] for i in indices)
+        return result
+
+    def filter_severity(self, severity: str) -> "ViolationSet":
+        """Alle Verstöße einer Schwere ("kritisch", "warnung", "hinweis")"""
+        code = self.strings.ids.get(severity)
+        if code is None:
+            return ViolationSet(self.strings)
+        return self._take(i for i, c in enumerate(self.severities) if c == code)
+
+    def in_range(self, start: int, end: int) -> "ViolationSet":
+        """Alle Verstöße mit start <= Position < end (binäre Suche)"""
+        if self._by_position is None:
+            self._by_position = array('I', sorted(range(len(self)), key=self.positions.__getitem__))
+        order = self._by_position
+        sorted_positions = _PositionView(self.positions, order)
+        lo = bisect_left(sorted_positions, start)
+        hi = bisect_left(sorted_positions, end)
+        return self._take(sorted(order[lo:hi]))
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl pro Schwere"""
+        strings = self.strings.strings
+        result: Dict[str, int] = {}
+        for code in self.severities:
+            result[strings[code]] = result.get(strings[code], 0) + 1
+        return result
+
+class _PositionView:
+    """Positionen in sortierter Reihenfolge - für bisect, ohne Kopie"""
+
+    def __init__(self, positions: array, order: array):
+        self.positions = positions
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, index: int) -> int:
+        return self.positions[self.order[index]]
+
+def _violation_position(violation: WWAKViolation) -> int:
+    return violation.position
+
+def _shifted(violation: WWAKViolation, shift: int) -> WWAKViolation:
+    """Kopie an verschobener Position (Zeile/Spalte/Byte gelten nicht mehr)"""
+    return WWAKViolation(violation.text, violation.position + shift, violation.violation_type,
+                         violation.correction, violation.severity, violation.world_impact)
+
+class WWAKViolationIndex:
+    """
+    Verstöße eines Textes nach Position, für recheck().
+
+    Gespeichert als Stücke (Liste, von, bis, Verschiebung): jedes Stück
+    ist ein Ausschnitt einer nie veränderten, nach Position sortierten
+    Liste. Eine Bearbeitung ersetzt per bisect nur das Fenster und gibt
+    den Stücken dahinter eine neue Verschiebung - die Verstöße selbst
+    werden dabei nicht angefasst, verschobene Kopien entstehen erst beim
+    Iterieren.
+    """
+
+    MAX_PIECES = 256  # danach einmal zu einer Liste zusammenfassen
+
+    def __init__(self, pieces: Iterable[Tuple[List[WWAKViolation], int, int, int]] = ()):
+        self.pieces = [piece for piece in pieces if piece[1] < piece[2]]
+        self.length = sum(hi - lo for _, lo, hi, _ in self.pieces)
+
+    @classmethod
+    def from_violations(cls, violations: Iterable[WWAKViolation]) -> "WWAKViolationIndex":
+        ordered = sorted(violations, key=_violation_position)
+        return cls([(ordered, 0, len(ordered), 0)])
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[WWAKViolation]:
+        for items, lo, hi, shift in self.pieces:
+            if shift:
+                for index in range(lo, hi):
+                    yield _shifted(items[index], shift)
+            else:
+                yield from items[lo:hi]
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """(Stück, Index) des ersten Verstoßes mit Position >= position"""
+        for k, (items, lo, hi, shift) in enumerate(self.pieces):
+            if items[hi - 1].position + shift >= position:
+                return k, bisect_left(items, position - shift, lo, hi, key=_violation_position)
+        return len(self.pieces), 0
+
+    def splice(self, start: int, end: int, found: List[WWAKViolation],
+               delta: int) -> "WWAKViolationIndex":
+        """
+        Neuer Index: Verstöße in [start, end) durch found (nach Position
+        sortiert, schon in neuen Koordinaten) ersetzt, alle ab end um
+        delta verschoben
+        """
+        first, first_index = self._locate(start)
+        last, last_index = self._locate(end)
+        pieces = self.pieces[:first]
+        if first < len(self.pieces):
+            items, lo, _, shift = self.pieces[first]
+            pieces.append((items, lo, first_index, shift))
+        pieces.append((found, 0, len(found), 0))
+        for k in range(last, len(self.pieces)):
+            items, lo, hi, shift = self.pieces[k]
+            pieces.append((items, last_index if k == last else lo, hi, shift + delta))
+        result = WWAKViolationIndex(pieces)
+        if len(result.pieces) > self.MAX_PIECES:
+            flat = list(result)
+            result = WWAKViolationIndex([(flat, 0, len(flat), 0)])
+        return result
+
+class _RuleOrderView:
+    """
+    Verstöße aus recheck() in der Reihenfolge von analyze() - die
+    Sortierung nach Regel läuft erst beim ersten Zugriff, len() sofort
+    """
+
+    def __init__(self, index: WWAKViolationIndex, order_key, tail: List[WWAKViolation]):
+        self.index = index
+        self.order_key = order_key
+        self.tail = tail
+        self._items: Optional[List[WWAKViolation]] = None
+
+    def _list(self) -> List[WWAKViolation]:
+        if self._items is None:
+            self._items = sorted(self.index, key=self.order_key) + self.tail
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self.index) + len(self.tail)
+
+    def __iter__(self) -> Iterator[WWAKViolation]:
+        return iter(self._list())
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __eq__(self, other) -> bool:
+        return self._list() == list(other)
+
+    def __repr__(self) -> str:
+        return repr(self._list())
+
+@dataclass
+class WWAKAnalysis:
+    """
+    Ergebnis EINER Prüfung eines Textes.
+    Welten-Ebene, Korrektur, Bericht und Nukwa-Integration
+    verwenden dieses Objekt, statt den Text erneut zu prüfen.
+    """
+    content_hash: str
+    violations: List[WWAKViolation]
+    word_count: int
+    rule_fingerprint: str = ""  # Regelstand, mit dem geprüft wurde
+    prefiltered: bool = False   # Vom Vorfilter als sauber erkannt, nicht durchsucht
+    # Dieselben Verstöße nach Position (ohne Gesamttext), von recheck() fortgeführt
+    by_position: Optional[WWAKViolationIndex] = field(default=None, repr=False, compare=False)
+
+    @property
+    def conformity(self) -> float:
+        return 1.0 - len(self.violations) / max(self.word_count, 1)
+
+    @property
+    def world_level(self) -> Tuple[str, float]:
+        """Welten-Ebene nach WWAK-Konformität"""
+        return world_for_conformity(self.conformity)
+
+def world_for_conformity(conformity: float) -> Tuple[str, float]:
+    """Ordnet eine Konformität der Welten-Ebene zu"""
+    if conformity >= 0.95:
+        return ("Azilut", conformity)
+    elif conformity >= 0.85:
+        return ("Brija", conformity)
+    elif conformity >= 0.70:
+        return ("Jezira", conformity)
+    else:
+        return ("Assija", conformity)
+
+def content_hash(text: str) -> str:
+    """Inhalts-Schlüssel eines Textes für den Analyse-Cache"""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+class WWAKAnalysisCache:
+    """
+    Begrenzter LRU-Cache: (Inhalts-Hash, Optionen) → WWAKAnalysis.
+    Alle Zugriffe laufen unter einer Sperre - sicher für mehrere Threads.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, WWAKAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[WWAKAnalysis]:
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return analysis
+
+    def put(self, key: Tuple, analysis: WWAKAnalysis):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = analysis
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        """Zähler für Dashboards"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+def osa_distance(a: str, b: str, max_distance: int, vowels: str = "") -> int:
+    """
+    Editierdistanz mit Vertauschung benachbarter Zeichen (OSA).
+    Bricht ab, sobald max_distance sicher überschritten ist.
+    Mit vowels kostet nur das Ersetzen eines Vokals durch einen Vokal 1,
+    jedes andere Ersetzen 2.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                cost = 0
+            elif not vowels or (a[i - 1] in vowels and b[j - 1] in vowels):
+                cost = 1
+            else:
+                cost = 2
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1 and
+                    a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[len(b)]
+
+# Worte und Wortteile für die unscharfe Suche: nur Buchstaben
+_LETTER_WORD = re.compile(r'[^\W\d_]+')
+
+# Gleichwertige Umschriften hebräischer Laute (Kether/Keter, Gevura/Gewura,
+# Malkuth/Malchut, Yesod/Jessod) - vor dem Vergleich auf eine Form gebracht
+_TRANSLIT_FOLDS = (("tz", "z"), ("ph", "f"), ("th", "t"), ("kh", "k"), ("ch", "k"),
+                   ("ck", "k"), ("q", "k"), ("y", "j"), ("v", "w"))
+_DOUBLE_LETTER = re.compile(r'(.)\1+')
+_FINAL_H = re.compile(r'(?<=[aeiou])h$')
+_VOWELS = "aeiouäöü"
+
+def transliteration_key(word: str) -> str:
+    """Vergleichsform eines Wortes: Umschriften vereinheitlicht, Doppelbuchstaben einfach"""
+    key = word.lower()
+    for old, new in _TRANSLIT_FOLDS:
+        key = key.replace(old, new)
+    return _FINAL_H.sub("", _DOUBLE_LETTER.sub(r"\1", key))
+
+# Deutsche Wörter, die einem Lehnwort oder einer Sefira nahe kommen -
+# werden nie unscharf gemeldet
+DEUTSCHE_NACHBARWOERTER = frozenset({
+    "kater", "köter", "kutter", "kette", "kelter", "meter", "peter",
+    "biene", "bine", "kabale", "klippe", "kilim", "kelims", "keim",
+    "koma", "komma", "ticken", "hode", "klick", "klipp",
+})
+
+class WWAKFuzzyIndex:
+    """
+    SymSpell-Index über Lehnwörter und Sefirot.
+
+    Verglichen werden Umschrift-Schlüssel (siehe transliteration_key),
+    die erlaubte Distanz wächst mit der Wortlänge, der erste Buchstabe
+    muss übereinstimmen und Konsonanten zu ersetzen kostet doppelt.
+    Für jedes Lexikonwort werden alle Löschvarianten bis zur Distanz 2
+    einmal vorberechnet. Eine Abfrage erzeugt die (wenigen) Löschvarianten
+    des Wortes und schlägt sie nach - die Kosten hängen von der Wortlänge
+    ab, nicht von der Größe des Lexikons. Ergebnisse pro Wort werden in
+    einem begrenzten LRU-Cache gehalten (Zipf: die meisten Wörter kehren
+    wieder).
+    """
+
+    MIN_KEY_LENGTH = 4  # Hod, Kli, WWAK: nur exakt
+
+    def __init__(self, lexicon: Dict[str, str], max_distance: int = 2,
+                 exact: Iterable[str] = (), cache_size: int = 65536,
+                 stopwords: Iterable[str] = DEUTSCHE_NACHBARWOERTER):
+        # lexicon: Schreibweise (klein) → korrekte Form
+        self.lexicon = {term.lower(): correct for term, correct in lexicon.items()}
+        self.max_distance = max_distance
+        # Bereits exakt geregelte oder korrekte Wörter nie unscharf melden,
+        # ebenso bekannte deutsche Nachbarwörter
+        self.exact = {word.lower() for word in exact} | set(self.lexicon)
+        self.exact |= {correct.lower() for correct in self.lexicon.values()}
+        self.exact |= {word.lower() for word in stopwords}
+        self.cache_size = cache_size
+
+        # Verglichen wird in Umschrift-Schlüsseln; zu kurze nur exakt
+        self.keys: Dict[str, str] = {}
+        for term, correct in self.lexicon.items():
+            key = transliteration_key(term)
+            if len(key) >= self.MIN_KEY_LENGTH:
+                self.keys.setdefault(key, correct)
+
+        self.deletes: Dict[str, List[str]] = {}
+        for key in self.keys:
+            for variant in self._deletes(key, max_distance):
+                self.deletes.setdefault(variant, []).append(key)
+        self._init_cache()
+
+    def _init_cache(self):
+        self.lookup = lru_cache(maxsize=self.cache_size)(self._lookup)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["lookup"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init_cache()
+
+    @staticmethod
+    def _deletes(word: str, distance: int) -> set:
+        result = {word}
+        frontier = {word}
+        for _ in range(distance):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+            result |= frontier
+        return result
+
+    def allowed_distance(self, key: str) -> int:
+        """
+        Distanz nach Länge des Schlüssels: unter 4 Buchstaben keine,
+        bis 7 Buchstaben 1, darüber max_distance
+        """
+        if len(key) < self.MIN_KEY_LENGTH:
+            return -1
+        if len(key) <= 7:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def _lookup(self, word: str) -> Optional[Tuple[str, int]]:
+        """Wort (klein) → (korrekte Form, Distanz) oder None"""
+        if word in self.exact:
+            return None
+        key = transliteration_key(word)
+        max_distance = self.allowed_distance(key)
+        if max_distance < 0:
+            return None
+
+        best: Optional[Tuple[int, str]] = None
+        seen = set()
+        for variant in self._deletes(key, max_distance):
+            for term in self.deletes.get(variant, ()):
+                if term in seen:
+                    continue
+                seen.add(term)
+                if term[0] != key[0]:
+                    continue
+                distance = osa_distance(key, term, max_distance, _VOWELS)
+                if distance <= max_distance and (best is None or (distance, term) < best):
+                    best = (distance, term)
+        if best is None:
+            return None
+        return self.keys[best[1]], best[0]
+
+    def scan(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> List[WWAKViolation]:
+        """Alle vermutlich falsch geschriebenen Lehnwörter im Text"""
+        violations = []
+        lookup = self.lookup
+        for match in _LETTER_WORD.finditer(text, pos, len(text) if endpos is None else endpos):
+            word = match.group()
+            # Wie bei den Lehnwörtern: nur Substantive
+            if not word[0].isupper():
+                continue
+            found = lookup(word.lower())
+            if found is None:
+                continue
+            correction, distance = found
+            violations.append(WWAKViolation(
+                text=word,
+                position=match.start(),
+                violation_type="fuzzy_spelling",
+                correction=correction,
+                severity="hinweis"
+            ))
+        return violations
+
+    def cache_info(self) -> Dict:
+        info = self.lookup.cache_info()
+        total = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / total if total else 0.0,
+            "size": info.currsize,
+            "maxsize": info.maxsize
+        }
+
+# Gottesnamen, von denen mindestens einer im Text stehen sollte
+GOTTESNAMEN = ("B\"H", "ב״ה", "HaSchem", "השם", "G'tt")
+
+@dataclass(frozen=True)
+class WWAKOptions:
+    """Einstellungen für EINEN Aufruf - statt veränderlichem Zustand am Prüfer"""
+    integrity_checks: bool = True  # Gesamttext-Prüfungen (Gottesname, Bnei Baruch)
+    fuzzy: bool = False            # Unscharfe Suche nach verschriebenen Lehnwörtern
+    prefilter: bool = True         # Texte ohne Kandidaten nicht voll durchsuchen
+    ki_ilu_azilut: bool = False    # Als-ob-Modus; wird mitgeführt, ändert die Prüfung nicht
+
+DEFAULT_OPTIONS = WWAKOptions()
+
+@dataclass(frozen=True)
+class WWAKEngine:
+    """
+    Unveränderliche, kompilierte Regel-Engine.
+
+    Hält nur den fertigen Automaten und keinerlei Zustand pro Aufruf -
+    eine Instanz kann von beliebig vielen Threads gleichzeitig benutzt
+    werden (auch auf CPython-Builds ohne GIL). Einstellungen kommen
+    pro Aufruf als WWAKOptions.
+    """
+    matcher: WWAKMatcher
+    divine_names: Tuple[str, ...] = GOTTESNAMEN
+    fuzzy_index: Optional[WWAKFuzzyIndex] = None
+
+    @property
+    def fingerprint(self) -> str:
+        return self.matcher.fingerprint
+
+    def analyze(self, text: str, options: WWAKOptions = DEFAULT_OPTIONS,
+                key: Optional[str] = None) -> WWAKAnalysis:
+        """Prüft einen Text (ohne Cache)"""
+        # Prüfungen 1-3 in einem Durchlauf:
+        # falsche Q in deutschen Wörtern, fehlende Q in hebräischen
+        # Lehnwörtern, verbotene Q-Formen (Adjektive etc.)
+        prefiltered = options.prefilter and not self.matcher.prefilter.might_match(text)
+        violations = [] if prefiltered else self.matcher.scan(text)
+        
+        # Optional: verschriebene Lehnwörter (Kabala, Qabbalah, Tikkoun)
+        if options.fuzzy and self.fuzzy_index is not None:
+            violations.extend(self.fuzzy_index.scan(text))
+        
+        # Prüfung 4: Kritische spirituelle Integrität
+        if options.integrity_checks:
+            violations.extend(self.check_integrity(text))
+        
+        return WWAKAnalysis(
+            content_hash=key or content_hash(text),
+            violations=violations,
+            word_count=len(text.split()),
+            rule_fingerprint=self.matcher.fingerprint,
+            prefiltered=prefiltered
+        )
+
+    def check_text(self, text: str, options: WWAKOptions = DEFAULT_OPTIONS) -> List[WWAKViolation]:
+        return self.analyze(text, options).violations
+
+    def check_text_compact(self, text: str, options: WWAKOptions = DEFAULT_OPTIONS) -> ViolationSet:
+        if options.prefilter and not self.matcher.prefilter.might_match(text):
+            violations = ViolationSet()
+            violations.rule_fingerprint = self.matcher.fingerprint
+        else:
+            violations = self.matcher.scan_compact(text)
+        if options.fuzzy and self.fuzzy_index is not None:
+            for violation in self.fuzzy_index.scan(text):
+                violations.append(violation.text, violation.position, violation.violation_type,
+                                  violation.correction, violation.severity)
+        if options.integrity_checks:
+            for violation in self.check_integrity(text):
+                violations.append(violation.text, violation.position, violation.violation_type,
+                                  violation.correction, violation.severity)
+        return violations
+
+    def check_integrity(self, text: str) -> List[WWAKViolation]:
+        """Prüft auf spirituelle Integrität - Männliches Kli"""
+        mentions_kabbala = "kabbala" in text
+        return self.integrity_violations(
+            # text.lower() kopiert den ganzen Text - nur wenn nötig
+            not mentions_kabbala and "bnei baruch" in text.lower(),
+            mentions_kabbala,
+            any(name in text for name in self.divine_names)
+        )
+
+    def integrity_phrases(self) -> List[str]:
+        """Alle Phrasen, die die Gesamttext-Prüfung sucht"""
+        return ["bnei baruch", "kabbala"] + list(self.divine_names)
+
+    @staticmethod
+    def integrity_violations(mentions_bnei_baruch: bool, mentions_kabbala: bool,
+                             has_divine_name: bool) -> List[WWAKViolation]:
+        violations = []
+        
+        # Fehlt "Kabbala" im Text über Bnei Baruch?
+        if mentions_bnei_baruch and not mentions_kabbala:
+            violations.append(WWAKViolation(
+                text="[Gesamttext]",
+                position=0,
+                violation_type="missing_kabbala_mention",
+                correction="Text muss 'Kabbala' enthalten",
+                severity="warnung"
+            ))
+            
+        # Fehlt Gottesname?
+        if not has_divine_name:
+            violations.append(WWAKViolation(
+                text="[Gesamttext]",
+                position=0,
+                violation_type="missing_divine_name",
+                correction="Text sollte Gottesnamen enthalten",
+                severity="hinweis"
+            ))
+            
+        return violations
+
+# Wortende am Pufferende - dieses Wort kann im nächsten Block weitergehen
+_TRAILING_WORD = re.compile(r'\w*\Z')
+# Wortanfänge im Sinne von str.split()
+_WORD_START = re.compile(r'(?<!\S)\S')
+
+class WWAKStream:
+    """
+    Prüft einen Datei-Strom blockweise mit konstantem Speicher.
+
+    Iteration liefert die Verstöße nach Position (Zeichen- und Byte-Offset,
+    Zeile und Spalte absolut im Strom). Ein Block wird nur bis zum letzten Nicht-Wortzeichen
+    geprüft; das angebrochene Wort und ein kurzes Überlappungsfenster
+    wandern in den nächsten Block. Nach der Iteration stehen Wortzahl,
+    Konformität und Welten-Ebene zur Verfügung.
+    """
+
+    def __init__(self, lehre: "WWAKBuchstabenLehre", file_obj, chunk_size: int = 1 << 20):
+        self.lehre = lehre
+        self.file_obj = file_obj
+        self.chunk_size = chunk_size
+        # Längste Phrase der Gesamttext-Prüfung bestimmt das Fenster
+        self.overlap = max(len(p) for p in lehre.engine.integrity_phrases()) - 1
+
+        self.rule_fingerprint = lehre.matcher.fingerprint
+        self.word_count = 0
+        self.violation_count = 0
+        self.char_count = 0
+        self.byte_count = 0
+        self.finished = False
+
+        self._mentions_bnei_baruch = False
+        self._mentions_kabbala = False
+        self._has_divine_name = False
+
+    @property
+    def conformity(self) -> float:
+        return 1.0 - self.violation_count / max(self.word_count, 1)
+
+    @property
+    def world_level(self) -> Tuple[str, float]:
+        return world_for_conformity(self.conformity)
+
+    def _chunks(self) -> Iterator[str]:
+        decoder = None
+        while True:
+            chunk = self.file_obj.read(self.chunk_size)
+            if isinstance(chunk, bytes):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder('utf-8')()
+                final = not chunk
+                chunk = decoder.decode(chunk, final)
+                if chunk:
+                    yield chunk
+                if final:
+                    return
+            elif chunk:
+                yield chunk
+            else:
+                return
+
+    def _scan_phrases(self, window: str):
+        if not self._mentions_bnei_baruch and "bnei baruch" in window.lower():
+            self._mentions_bnei_baruch = True
+        if not self._mentions_kabbala and "kabbala" in window:
+            self._mentions_kabbala = True
+        if not self._has_divine_name:
+            self._has_divine_name = any(name in window for name in self.lehre.engine.divine_names)
+
+    def __iter__(self) -> Iterator[WWAKViolation]:
+        matcher = self.lehre.matcher
+        buffer = ""
+        # buffer[:context] ist schon geprüft und dient nur als Kontext
+        context = 0
+        buffer_char_start = 0
+        buffer_byte_start = 0
+        # Zeile und Zeilenanfang an buffer_char_start
+        line, line_start = 1, 0
+        chunks = self._chunks()
+        eof = False
+
+        while not eof:
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+            else:
+                buffer += chunk
+            cut = len(buffer) if eof else _TRAILING_WORD.search(buffer, context).start()
+            if cut <= context and not eof:
+                continue
+
+            # Gesamttext-Phrasen mit Überlappung in den Kontext hinein
+            self._scan_phrases(buffer[max(0, context - self.overlap):cut])
+            self.word_count += len(_WORD_START.findall(buffer, context, cut))
+
+            last_index = 0
+            last_byte = buffer_byte_start
+            last_line, last_line_start = line, line_start
+            for match, rule in matcher.finditer(buffer, context, cut):
+                violation = matcher.violation_for(match, rule)
+                if violation is None:
+                    continue
+                index = match.start()
+                last_byte += len(buffer[last_index:index].encode('utf-8', 'surrogatepass'))
+                newlines = buffer.count('\n', last_index, index)
+                if newlines:
+                    last_line += newlines
+                    last_line_start = buffer_char_start + buffer.rfind('\n', last_index, index) + 1
+                last_index = index
+                violation.position += buffer_char_start
+                violation.byte_position = last_byte
+                violation.line = last_line
+                violation.column = violation.position - last_line_start + 1
+                self.violation_count += 1
+                yield violation
+
+            # Nur das Überlappungsfenster behalten
+            keep = max(0, cut - max(self.overlap, 1))
+            newlines = buffer.count('\n', 0, keep)
+            if newlines:
+                line += newlines
+                line_start = buffer_char_start + buffer.rfind('\n', 0, keep) + 1
+            buffer_byte_start += len(buffer[:keep].encode('utf-8', 'surrogatepass'))
+            buffer_char_start += keep
+            buffer = buffer[keep:]
+            context = cut - keep
+
+        self.char_count = buffer_char_start + len(buffer)
+        self.byte_count = buffer_byte_start + len(buffer.encode('utf-8', 'surrogatepass'))
+
+        for violation in self.lehre.engine.integrity_violations(
+                self._mentions_bnei_baruch, self._mentions_kabbala, self._has_divine_name):
+            violation.byte_position = 0
+            violation.line, violation.column = 1, 1
+            self.violation_count += 1
+            yield violation
+
+        self.finished = True
+
+# Prüfer im Arbeitsprozess - wird pro Prozess genau einmal aufgebaut
+_worker_lehre: Optional["WWAKBuchstabenLehre"] = None
+
+def _init_worker(engine: "WWAKEngine", cache_size: int):
+    global _worker_lehre
+    # Engine des Aufrufers übernehmen (auch bei geänderten Tabellen) -
+    # der Arbeitsprozess kompiliert keine eigene
+    _worker_lehre = WWAKBuchstabenLehre(cache_size=cache_size, engine=engine)
+
+def _check_in_worker(text: str) -> Tuple[List[WWAKViolation], bool, float]:
+    return _worker_lehre._check_timed(text)
+
+class WWAKBatch:
+    """
+    Prüft eine Sammlung von Texten in einem Prozess-Pool.
+
+    Iteration liefert die Verstöße pro Text in Eingabe-Reihenfolge,
+    sobald sie fertig sind. Danach steht der Durchsatz bereit.
+    """
+
+    def __init__(self, lehre: "WWAKBuchstabenLehre", texts: Iterable[str],
+                 workers: Optional[int] = None, chunksize: int = 64):
+        self.lehre = lehre
+        self.texts = texts
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.rule_fingerprint = lehre.matcher.fingerprint
+
+        self.documents = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.finished = False
+
+        # Vorfilter: übersprungene und voll geprüfte Texte getrennt
+        self.skipped = 0
+        self.skipped_bytes = 0
+        self.skipped_seconds = 0.0
+        self.checked_bytes = 0
+        self.checked_seconds = 0.0
+        self._sizes: deque = deque()
+
+    def _counted(self) -> Iterator[str]:
+        for text in self.texts:
+            size = len(text.encode('utf-8', 'surrogatepass'))
+            self.documents += 1
+            self.bytes += size
+            self._sizes.append(size)
+            yield text
+
+    def _record(self, result: Tuple[List[WWAKViolation], bool, float]) -> List[WWAKViolation]:
+        violations, skipped, seconds = result
+        # imap liefert in Eingabe-Reihenfolge - die Größe steht vorne
+        size = self._sizes.popleft()
+        if skipped:
+            self.skipped += 1
+            self.skipped_bytes += size
+            self.skipped_seconds += seconds
+        else:
+            self.checked_bytes += size
+            self.checked_seconds += seconds
+        return violations
+
+    def __iter__(self) -> Iterator[List[WWAKViolation]]:
+        start = time.perf_counter()
+
+        if self.workers == 1:
+            for text in self._counted():
+                yield self._record(self.lehre._check_timed(text))
+        else:
+            with multiprocessing.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.lehre.engine, self.lehre.analysis_cache.maxsize)
+            ) as pool:
+                for result in pool.imap(_check_in_worker, self._counted(), self.chunksize):
+                    yield self._record(result)
+
+        self.seconds = time.perf_counter() - start
+        self.finished = True
+
+    def throughput(self) -> Dict:
+        """Dokumente/s und MB/s des Laufs"""
+        seconds = max(self.seconds, 1e-9)
+        return {
+            "rule_fingerprint": self.rule_fingerprint,
+            "documents": self.documents,
+            "bytes": self.bytes,
+            "seconds": self.seconds,
+            "workers": self.workers,
+            "docs_per_second": self.documents / seconds,
+            "mb_per_second": self.bytes / seconds / 1e6,
+            "skipped": self.skipped,
+            "skip_rate": self.skipped / self.documents if self.documents else 0.0,
+            "seconds_saved": self.seconds_saved()
+        }
+
+    def seconds_saved(self) -> float:
+        """
+        Geschätzte eingesparte Rechenzeit (über alle Prozesse):
+        die übersprungenen Bytes zum Tempo der voll geprüften Texte,
+        abzüglich der Zeit für den Vorfilter selbst
+        """
+        if not self.skipped or not self.checked_bytes:
+            return 0.0
+        full = self.skipped_bytes * self.checked_seconds / self.checked_bytes
+        return max(full - self.skipped_seconds, 0.0)
+
+    def report(self) -> str:
+        info = self.throughput()
+        return (f"{info['documents']} Texte ({info['bytes'] / 1e6:.1f} MB) in "
+                f"{info['seconds']:.2f}s mit {info['workers']} Prozessen: "
+                f"{info['docs_per_second']:.0f} Texte/s, {info['mb_per_second']:.2f} MB/s; "
+                f"Vorfilter: {info['skipped']} übersprungen ({info['skip_rate']:.0%}), "
+                f"ca. {info['seconds_saved']:.2f}s Rechenzeit gespart")
+
+class WWAKOffsetMap:
+    """
+    Abbildung von Positionen im Originaltext auf den korrigierten Text.
+
+    Speichert pro Ersetzung nur Anfang, Ende und die aufgelaufene
+    Verschiebung - eine Abfrage kostet eine binäre Suche.
+    """
+
+    def __init__(self):
+        self.orig_starts: List[int] = []
+        self.orig_ends: List[int] = []
+        self.new_starts: List[int] = []
+        self.new_ends: List[int] = []
+
+    def add(self, orig_start: int, orig_end: int, new_start: int, new_end: int):
+        """Registriert eine Ersetzung (Aufrufe in aufsteigender Reihenfolge)"""
+        self.orig_starts.append(orig_start)
+        self.orig_ends.append(orig_end)
+        self.new_starts.append(new_start)
+        self.new_ends.append(new_end)
+
+    def __len__(self) -> int:
+        return len(self.orig_starts)
+
+    def to_corrected(self, position: int) -> int:
+        """Originalposition → Position im korrigierten Text"""
+        return self._map(position, self.orig_starts, self.orig_ends,
+                         self.new_starts, self.new_ends)
+
+    def to_original(self, position: int) -> int:
+        """Position im korrigierten Text → Originalposition"""
+        return self._map(position, self.new_starts, self.new_ends,
+                         self.orig_starts, self.orig_ends)
+
+    @staticmethod
+    def _map(position: int, src_starts: List[int], src_ends: List[int],
+             dst_starts: List[int], dst_ends: List[int]) -> int:
+        i = bisect_right(src_starts, position) - 1
+        if i < 0:
+            return position
+        if position < src_ends[i]:
+            # Innerhalb einer Ersetzung: auf die neue Stelle begrenzen
+            return min(dst_starts[i] + (position - src_starts[i]), dst_ends[i])
+        return position + (dst_ends[i] - src_ends[i])
+
+def apply_edits(text: str, edits: Iterable[Tuple[int, int, str]]) -> Tuple[str, WWAKOffsetMap]:
+    """
+    Wendet Ersetzungen (Position, Länge, Ersatz) in einem Durchlauf an.
+
+    Der neue Text wird von links nach rechts aus Teilstücken
+    zusammengesetzt und einmal verbunden - linear statt quadratisch.
+    Überlappende Ersetzungen werden übersprungen.
+    """
+    parts = []
+    offsets = WWAKOffsetMap()
+    cursor = 0
+    new_length = 0
+
+    for position, length, replacement in sorted(edits, key=lambda e: e[0]):
+        if position < cursor:
+            continue
+        parts.append(text[cursor:position])
+        new_length += position - cursor
+        parts.append(replacement)
+        offsets.add(position, position + length, new_length, new_length + len(replacement))
+        new_length += len(replacement)
+        cursor = position + length
+
+    parts.append(text[cursor:])
+    return ''.join(parts), offsets
+
+def diff_edit(old: str, new: str, block: int = 4096) -> Tuple[int, int, str]:
+    """
+    Bestimmt die eine geänderte Stelle zwischen zwei Fassungen als
+    Ersetzung (Position, Länge, Ersatz) über gemeinsamen Anfang und Ende.
+    Verglichen wird blockweise, damit die Schleife nicht pro Zeichen läuft.
+    """
+    limit = min(len(old), len(new))
+
+    prefix = 0
+    while prefix + block <= limit and old[prefix:prefix + block] == new[prefix:prefix + block]:
+        prefix += block
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+
+    limit -= prefix
+    suffix = 0
+    while (suffix + block <= limit and
+           old[len(old) - suffix - block:len(old) - suffix] == new[len(new) - suffix - block:len(new) - suffix]):
+        suffix += block
+    while suffix < limit and old[len(old) - suffix - 1] == new[len(new) - suffix - 1]:
+        suffix += 1
+
+    return (prefix, len(old) - suffix - prefix, new[prefix:len(new) - suffix])
+
+_LEADING_NON_SPACE = re.compile(r'\S*')
+
+def _word_window(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Erweitert [start, end) auf ganze Wörter (bis zum Leerraum)"""
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    return start, _LEADING_NON_SPACE.match(text, end).end()
 
 class WWAKBuchstabenLehre:
     """
@@ -50,7 +1424,11 @@ class WWAKBuchstabenLehre:
     - Assija: Starke Korrektur nötig (unter 70% WWAK)
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 128, engine: Optional["WWAKEngine"] = None):
+        """
+        engine: bereits gebaute Engine übernehmen statt die Tabellen zu
+        kompilieren (Arbeitsprozesse von check_many)
+        """
         # Ki Ilu Azilut Modus - als ob es schon perfekt wäre
         self.ki_ilu_azilut_mode = False
         
@@ -82,132 +1460,257 @@ class WWAKBuchstabenLehre:
             "qabbalistisch", "qabbalistische", "qabbalistischen",
             "klipotisch", "klipotische", "klipotischen"
         ]
+
+        # Deutsche Wörter die fälschlich mit Q geschrieben wurden
+        self.false_q_forms = ["qrone", "qraft", "qommen", "qönnen"]
+
+        # Sefirot in WWAK-Schreibweise (Ziel der unscharfen Suche)
+        self.sefirot = [
+            "Keter", "Chochma", "Bina", "Chessed", "Gewura",
+            "Tiferet", "Nezach", "Hod", "Jessod", "Malchut"
+        ]
+
+        # Bereits geprüfte Texte (Schlüssel: Inhalts-Hash)
+        self.analysis_cache = WWAKAnalysisCache(cache_size)
+
+        # Alle Tabellen einmal zu einem Automaten kompilieren
+        self.rule_compiler = WWAKRuleCompiler()
+        if engine is None:
+            self.compile_rules()
+        else:
+            self.engine = engine
+
+    def compile_rules(self):
+        """
+        Baut den Automaten aus den aktuellen Tabellen - nach Änderungen
+        an den Tabellen aufrufen. Der Analyse-Cache wird dabei geleert.
+        """
+        lexicon = dict(self.hebrew_loanwords)
+        lexicon.update((sefira.lower(), sefira) for sefira in self.sefirot)
+        self.engine = WWAKEngine(
+            self.rule_compiler.compile(
+                self.hebrew_loanwords, self.german_protected,
+                self.forbidden_q_forms, self.false_q_forms
+            ),
+            fuzzy_index=WWAKFuzzyIndex(
+                lexicon,
+                exact=list(self.german_protected) + self.forbidden_q_forms + self.false_q_forms
+            )
+        )
+        self.analysis_cache.clear()
+
+    @property
+    def matcher(self) -> WWAKMatcher:
+        return self.engine.matcher
+
+    @property
+    def rule_fingerprint(self) -> str:
+        """Fingerabdruck der Regelquellen - für nachgelagerte Caches"""
+        return self.engine.fingerprint
+    
+    def default_options(self) -> WWAKOptions:
+        """Optionen aus dem (veralteten) Instanz-Zustand"""
+        return WWAKOptions(ki_ilu_azilut=self.ki_ilu_azilut_mode)
+        
+    def analyze(self, text: str, options: Optional[WWAKOptions] = None) -> WWAKAnalysis:
+        """
+        Prüft einen Text genau einmal - wiederholte Aufrufe mit
+        gleichem Inhalt kommen aus dem LRU-Cache
+        """
+        options = options or self.default_options()
+        key = content_hash(text)
+        analysis = self.analysis_cache.get((key, options))
+        if analysis is not None:
+            return analysis
         
-    def check_text(self, text: str) -> List[WWAKViolation]:
+        analysis = self.engine.analyze(text, options, key)
+        self.analysis_cache.put((key, options), analysis)
+        return analysis
+    
+    def check_text(self, text: str, options: Optional[WWAKOptions] = None) -> List[WWAKViolation]:
         """Prüft einen Text auf WWAK-Konformität"""
-        violations = []
+        return list(self.analyze(text, options).violations)
+    
+    def _check_timed(self, text: str) -> Tuple[List[WWAKViolation], bool, float]:
+        """check_text() samt Vorfilter-Ergebnis und Dauer (für WWAKBatch)"""
+        start = time.perf_counter()
+        analysis = self.analyze(text)
+        return list(analysis.violations), analysis.prefiltered, time.perf_counter() - start
+    
+    def might_violate(self, text: str) -> bool:
+        """
+        Vorfilter: False heißt, der Text enthält sicher keines der
+        WWAK-Regelwörter - check_text() überspringt dann den Regel-Scan
+        (unscharfe Suche und Gesamttext-Prüfung laufen weiter). Für
+        Transliteration, zer-Formen und Stil siehe
+        DeutscheSchreibweise.kann_betroffen_sein()
+        """
+        return self.matcher.prefilter.might_match(text)
+    
+    def check_text_compact(self, text: str, options: Optional[WWAKOptions] = None) -> ViolationSet:
+        """
+        Wie check_text(), aber als speichersparender ViolationSet -
+        für Dateien mit Millionen von Treffern
+        """
+        return self.engine.check_text_compact(text, options or self.default_options())
+    
+    def check_fuzzy(self, text: str) -> List[WWAKViolation]:
+        """
+        Nur die unscharfe Suche: verschriebene Lehnwörter und Sefirot
+        (Kabala, Qabalah, Tikkoun, OCR-Fehler) mit Korrekturvorschlag
+        """
+        return self.engine.fuzzy_index.scan(text)
+    
+    def recheck(self, previous: WWAKAnalysis, old_text: str,
+                edits: Iterable[Tuple[int, int, str]],
+                options: Optional[WWAKOptions] = None) -> Tuple[str, WWAKAnalysis]:
+        """
+        Inkrementelle Prüfung nach einer Bearbeitung.
+        
+        edits sind Ersetzungen (Position, Länge, Ersatz) im alten Text,
+        z.B. aus dem Editor oder aus diff_edit(). Neu geprüft werden nur
+        die betroffenen Wörter; alle übrigen Verstöße werden verschoben.
+        Liefert den neuen Text und seine Analyse.
+        """
+        edits = sorted(edits, key=lambda e: e[0])
+        new_text, _ = apply_edits(old_text, edits)
         
-        # Prüfung 1: Falsche Q-Verwendung in deutschen Wörtern
-        violations.extend(self._check_false_q_usage(text))
+        # Betroffene Fenster (alte Koordinaten) samt Verschiebung
+        windows = []  # [alt_start, alt_ende, Verschiebung davor, Verschiebung danach]
+        cursor = 0
+        delta = 0
+        for position, length, replacement in edits:
+            if position < cursor:
+                continue  # überlappend - wie in apply_edits übersprungen
+            cursor = position + length
+            start, end = _word_window(old_text, position, position + length)
+            new_delta = delta + len(replacement) - length
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+                windows[-1][3] = new_delta
+            else:
+                windows.append([start, end, delta, new_delta])
+            delta = new_delta
         
-        # Prüfung 2: Fehlende Q in hebräischen Lehnwörtern
-        violations.extend(self._check_missing_q(text))
+        if not windows:
+            return old_text, previous
         
-        # Prüfung 3: Verbotene Q-Formen (Adjektive etc.)
-        violations.extend(self._check_forbidden_q(text))
+        # Verstöße nach Position - nach analyze() einmal sortiert (die
+        # Regelgruppen sind schon sortierte Läufe), danach fortgeführt
+        index = previous.by_position
+        if index is None:
+            violations = previous.violations
+            end = len(violations)
+            while end and violations[end - 1].text == "[Gesamttext]":
+                end -= 1
+            index = WWAKViolationIndex.from_violations(violations[:end])
         
-        # Prüfung 4: Kritische spirituelle Integrität
-        violations.extend(self._check_spiritual_integrity(text))
+        # Nur die Fenster im neuen Text prüfen und einsetzen
+        options = options or self.default_options()
+        fuzzy_index = self.engine.fuzzy_index if options.fuzzy else None
+        word_count = previous.word_count
+        for start, end, before, after in windows:
+            new_start, new_end = start + before, end + after
+            word_count -= len(_WORD_START.findall(old_text, start, end))
+            word_count += len(_WORD_START.findall(new_text, new_start, new_end))
+            found = []
+            for match, rule in self.matcher.finditer(new_text, new_start, new_end):
+                violation = self.matcher.violation_for(match, rule)
+                if violation is not None:
+                    found.append(violation)
+            if fuzzy_index is not None:
+                found.extend(fuzzy_index.scan(new_text, new_start, new_end))
+                found.sort(key=_violation_position)
+            # Frühere Fenster sind schon eingesetzt: dieses liegt um before verschoben
+            index = index.splice(new_start, end + before, found, after - before)
         
-        return violations
+        tail = self.engine.check_integrity(new_text) if options.integrity_checks else []
+        analysis = WWAKAnalysis(
+            content_hash=content_hash(new_text),
+            violations=_RuleOrderView(index, self.matcher.order_key, tail),
+            word_count=word_count,
+            rule_fingerprint=self.matcher.fingerprint,
+            by_position=index
+        )
+        self.analysis_cache.put((analysis.content_hash, options), analysis)
+        return new_text, analysis
+    
+    def check_stream(self, file_obj, chunk_size: int = 1 << 20) -> WWAKStream:
+        """
+        Prüft eine (Text- oder Binär-)Datei blockweise.
+        Liefert die Verstöße beim Iterieren, danach stehen Wortzahl,
+        Konformität und Welten-Ebene am Ergebnis bereit.
+        """
+        return WWAKStream(self, file_obj, chunk_size)
+    
+    def check_many(self, texts: Iterable[str], workers: Optional[int] = None,
+                   chunksize: int = 64) -> WWAKBatch:
+        """
+        Prüft viele Texte parallel (ein Prozess pro Kern).
+        Jeder Arbeitsprozess baut den Regel-Automaten einmal auf.
+        """
+        return WWAKBatch(self, texts, workers, chunksize)
+    
+    def cache_info(self) -> Dict:
+        """Treffer/Fehlschläge des Analyse-Caches"""
+        return self.analysis_cache.info()
+    
+    def _check_type(self, text: str, violation_type: str) -> List[WWAKViolation]:
+        """Einzelne Prüfung über den gemeinsamen Automaten"""
+        return [v for v in self.matcher.scan(text) if v.violation_type == violation_type]
     
     def _check_false_q_usage(self, text: str) -> List[WWAKViolation]:
         """Findet deutsche Wörter die fälschlich mit Q geschrieben wurden"""
-        violations = []
-        
-        # Suche nach Wörtern wie "Qrone", "Qraft" etc.
-        false_q_pattern = r'\b[Qq](?:rone|raft|ommen|önnen)\b'
-        
-        for match in re.finditer(false_q_pattern, text, re.IGNORECASE):
-            word = match.group()
-            corrected = word.replace('Q', 'K').replace('q', 'k')
-            
-            violations.append(WWAKViolation(
-                text=word,
-                position=match.start(),
-                violation_type="false_q_in_german",
-                correction=corrected,
-                severity="kritisch"
-            ))
-            
-        return violations
+        return self._check_type(text, "false_q_in_german")
     
     def _check_missing_q(self, text: str) -> List[WWAKViolation]:
         """Findet hebräische Lehnwörter ohne Q"""
-        violations = []
-        
-        for wrong, correct in self.hebrew_loanwords.items():
-            pattern = r'\b' + re.escape(wrong) + r'\b'
-            
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Nur wenn es ein Substantiv ist (Großschreibung prüfen)
-                if match.group()[0].isupper():
-                    violations.append(WWAKViolation(
-                        text=match.group(),
-                        position=match.start(),
-                        violation_type="missing_q_in_hebrew",
-                        correction=correct,
-                        severity="kritisch"
-                    ))
-                    
-        return violations
+        return self._check_type(text, "missing_q_in_hebrew")
     
     def _check_forbidden_q(self, text: str) -> List[WWAKViolation]:
         """Findet verbotene Q-Verwendungen in Adjektiven/Deklinationen"""
-        violations = []
-        
-        for forbidden in self.forbidden_q_forms:
-            pattern = r'\b' + re.escape(forbidden) + r'\b'
-            
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                corrected = match.group().replace('q', 'k').replace('Q', 'k')
-                
-                violations.append(WWAKViolation(
-                    text=match.group(),
-                    position=match.start(),
-                    violation_type="forbidden_q_form",
-                    correction=corrected,
-                    severity="kritisch"
-                ))
-                
-        return violations
+        return self._check_type(text, "forbidden_q_form")
     
     def _check_spiritual_integrity(self, text: str) -> List[WWAKViolation]:
         """Prüft auf spirituelle Integrität - Männliches Kli"""
-        violations = []
-        
-        # Fehlt "Kabbala" im Text über Bnei Baruch?
-        if "bnei baruch" in text.lower() and "kabbala" not in text:
-            violations.append(WWAKViolation(
-                text="[Gesamttext]",
-                position=0,
-                violation_type="missing_kabbala_mention",
-                correction="Text muss 'Kabbala' enthalten",
-                severity="warnung"
-            ))
-            
-        # Fehlt Gottesname?
-        gottesnamen = ["B\"H", "ב״ה", "HaSchem", "השם", "G'tt"]
-        if not any(name in text for name in gottesnamen):
-            violations.append(WWAKViolation(
-                text="[Gesamttext]",
-                position=0,
-                violation_type="missing_divine_name",
-                correction="Text sollte Gottesnamen enthalten",
-                severity="hinweis"
-            ))
-            
-        return violations
+        return self.engine.check_integrity(text)
     
-    def correct_text(self, text: str) -> Tuple[str, List[WWAKViolation]]:
+    def correct_text(self, text: str,
+                     analysis: Optional[WWAKAnalysis] = None) -> Tuple[str, List[WWAKViolation]]:
         """Korrigiert automatisch WWAK-Verstöße"""
-        violations = self.check_text(text)
-        corrected = text
+        corrected, violations, _ = self.correct_text_with_map(text, analysis)
+        return corrected, violations
+    
+    def correct_text_with_map(self, text: str, analysis: Optional[WWAKAnalysis] = None
+                              ) -> Tuple[str, List[WWAKViolation], WWAKOffsetMap]:
+        """
+        Korrigiert automatisch WWAK-Verstöße und liefert zusätzlich die
+        Positions-Abbildung Original → korrigierter Text, damit Anmerkungen
+        ohne erneute Prüfung verschoben werden können.
+        """
+        analysis = analysis or self.analyze(text)
+        violations = list(analysis.violations)
         
-        # Sortiere Violations nach Position (rückwärts für korrekte Ersetzung)
-        violations.sort(key=lambda v: v.position, reverse=True)
+        # Ersetze nur konkrete Textstellen - Hinweise zum Gesamttext nicht
+        edits = [
+            (v.position, len(v.text), v.correction)
+            for v in violations if v.text != "[Gesamttext]"
+        ]
+        corrected, offsets = apply_edits(text, edits)
         
-        for violation in violations:
-            if violation.violation_type != "missing_divine_name":
-                # Ersetze nur konkrete Textstellen
-                before = corrected[:violation.position]
-                after = corrected[violation.position + len(violation.text):]
-                corrected = before + violation.correction + after
+        # Sortiere Violations nach Position (rückwärts, wie bisher geliefert)
+        violations.sort(key=lambda v: v.position, reverse=True)
                 
-        return corrected, violations
+        return corrected, violations, offsets
     
-    def generate_report(self, violations: List[WWAKViolation]) -> str:
-        """Erstellt einen Bericht über WWAK-Verstöße"""
+    def generate_report(self, violations, text: Optional[str] = None) -> str:
+        """
+        Erstellt einen Bericht über WWAK-Verstöße (Liste oder WWAKAnalysis).
+        Mit dem Text werden zusätzlich Zeile:Spalte angegeben.
+        """
+        if isinstance(violations, WWAKAnalysis):
+            violations = violations.violations
+        line_index = LineIndex(text) if text is not None else None
         if not violations:
             return "✓ Text ist WWAK-konform! Das Licht fließt zu den Qelim."
         
@@ -221,7 +1724,16 @@ class WWAKBuchstabenLehre:
         if critical:
             report += f"KRITISCH ({len(critical)} Verstöße):\n"
             for v in critical:
-                report += f"  - '{v.text}' → '{v.correction}' (Position: {v.position})\n"
+                line = v.line
+                if line_index is not None:
+                    line, column = line_index.resolve(v.position)
+                elif line is not None:
+                    column = v.column
+                if line is None:
+                    report += f"  - '{v.text}' → '{v.correction}' (Position: {v.position})\n"
+                else:
+                    report += (f"  - '{v.text}' → '{v.correction}' "
+                               f"(Position: {v.position}, Zeile {line}:{column})\n")
             report += "\n"
             
         if warnings:
@@ -239,25 +1751,14 @@ class WWAKBuchstabenLehre:
         
         return report
     
-    def calculate_world_level(self, text: str) -> Tuple[str, float]:
+    def calculate_world_level(self, text: str,
+                              analysis: Optional[WWAKAnalysis] = None) -> Tuple[str, float]:
         """
         Bestimmt auf welcher Welten-Ebene sich ein Text befindet
         basierend auf WWAK-Konformität
         """
-        violations = self.check_text(text)
-        total_words = len(text.split())
-        violation_ratio = len(violations) / max(total_words, 1)
-        
-        conformity = 1.0 - violation_ratio
-        
-        if conformity >= 0.95:
-            return ("Azilut", conformity)
-        elif conformity >= 0.85:
-            return ("Brija", conformity)
-        elif conformity >= 0.70:
-            return ("Jezira", conformity)
-        else:
-            return ("Assija", conformity)
+        analysis = analysis or self.analyze(text)
+        return analysis.world_level
     
     def activate_ki_ilu_azilut(self):
         """
@@ -267,17 +1768,18 @@ class WWAKBuchstabenLehre:
         self.ki_ilu_azilut_mode = True
         return "Ki Ilu Azilut aktiviert! Q!"
     
-    def integrate_with_nukwa(self, text: str) -> Dict:
+    def integrate_with_nukwa(self, text: str, analysis: Optional[WWAKAnalysis] = None) -> Dict:
         """
         Integration mit Nukwa/Aylala Modul
         Sie sieht die Buchstaben-Verstöße
         """
-        violations = self.check_text(text)
+        analysis = analysis or self.analyze(text)
+        violations = analysis.violations
         
         return {
             "nukwa_sees": f"Aylala sieht {len(violations)} WWAK-Verstöße",
             "nukwa_speaks": "להופיע את האותיות - Lass die Buchstaben erscheinen!",
-            "nukwa_heals": self.correct_text(text)[0] if violations else text
+            "nukwa_heals": self.correct_text(text, analysis)[0] if violations else text
         }
     
     def spiritual_geometry_check(self, letter: str) -> Dict:
@@ -316,16 +1818,19 @@ if __name__ == "__main__":
     print(test_text)
     print("\n" + "="*50 + "\n")
     
+    # Eine Prüfung für alle folgenden Schritte
+    analysis = lehre.analyze(test_text)
+    
     # 1. Welten-Level Check
-    world, conformity = lehre.calculate_world_level(test_text)
+    world, conformity = lehre.calculate_world_level(test_text, analysis)
     print(f"WELTEN-EBENE: {world} (Konformität: {conformity:.2%})")
     print("\n" + "="*50 + "\n")
     
     # 2. Prüfe und korrigiere
-    corrected, violations = lehre.correct_text(test_text)
+    corrected, violations = lehre.correct_text(test_text, analysis)
     
     print("BERICHT:")
-    print(lehre.generate_report(violations))
+    print(lehre.generate_report(violations, test_text))
     print("\n" + "="*50 + "\n")
     
     print("KORRIGIERTER TEXT:")
@@ -334,7 +1839,7 @@ if __name__ == "__main__":
     # 3. Nukwa Integration
     print("\n" + "="*50 + "\n")
     print("NUKWA/AYLALA INTEGRATION:")
-    nukwa_result = lehre.integrate_with_nukwa(test_text)
+    nukwa_result = lehre.integrate_with_nukwa(test_text, analysis)
     for key, value in nukwa_result.items():
         print(f"{key}: {value}")
     
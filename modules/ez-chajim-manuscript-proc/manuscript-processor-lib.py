@@ -10,10 +10,22 @@ Stand: 14. Tammus 5785
 WWAK-konform implementiert
 """
 
+import codecs
+import mmap
 import re
-from typing import Dict, List, Tuple, Optional
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from collections import defaultdict
-import unicodedata
+from itertools import chain
+
+# Gemeinsamer Gematria-Kern aus modules/core - liegt er nicht schon
+# auf dem Pfad (z.B. beim Laden dieser Datei allein), wird er ergänzt
+try:
+    from gematria import WERTE, gematria, gematria_batch
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "core"))
+    from gematria import WERTE, gematria, gematria_batch
 
 class ManuscriptProcessor:
     """
@@ -24,20 +36,22 @@ class ManuscriptProcessor:
     - Gematria-Berechnung
     - Struktur-Erkennung
     - Frage-Antwort-Lade System
+    
+    Paarung von Fragen (F:) und Antworten (A:):
+    - 'nächste'     - jede Frage erhält die nächste noch freie Antwort
+    - 'abwechselnd' - strikt F, A, F, A: eine Antwort gehört nur zur
+                      Frage direkt davor, sonst bleibt die Frage offen
     """
     
-    def __init__(self):
+    PAIRING_POLICIES = ('nächste', 'abwechselnd')
+    
+    def __init__(self, pairing: str = 'nächste'):
         """Initialisiert Manuskript-Prozessor"""
         
-        # Gematria-Werte für hebräische Buchstaben
-        self.gematria_values = {
-            'א': 1, 'ב': 2, 'ג': 3, 'ד': 4, 'ה': 5,
-            'ו': 6, 'ז': 7, 'ח': 8, 'ט': 9, 'י': 10,
-            'כ': 20, 'ך': 20, 'ל': 30, 'מ': 40, 'ם': 40,
-            'נ': 50, 'ן': 50, 'ס': 60, 'ע': 70, 'פ': 80,
-            'ף': 80, 'צ': 90, 'ץ': 90, 'ק': 100, 'ר': 200,
-            'ש': 300, 'ת': 400
-        }
+        self.pairing = self._check_pairing(pairing)
+        
+        # Gematria-Werte für hebräische Buchstaben (gemeinsamer Kern)
+        self.gematria_values = WERTE['standard']
         
         # Struktur-Muster
         self.patterns = {
@@ -49,7 +63,21 @@ class ManuscriptProcessor:
             'quelle': re.compile(r'^\[([^\]]+)\]$', re.MULTILINE),
             'hebräisch': re.compile(r'[\u0590-\u05FF]+'),
             'lade': re.compile(r'^LADE\s+(\d+):\s*(.+)$', re.MULTILINE),
-            'vers': re.compile(r'^\d+\.\s+(.+)$', re.MULTILINE)
+            'vers': re.compile(r'^\d+\.\s+(.+)$', re.MULTILINE),
+            # Anfänge für die Überlappung von Chunks (Position = match.end())
+            'satzanfang': re.compile(r'(?:(?<=[.!?])\s+|^\s*)(?=\S)', re.MULTILINE),
+            'wortanfang': re.compile(r'(?<=\s)(?=\S)')
+        }
+        
+        # Zeilen-Muster für den Struktur-Scan: dieselben Regeln wie oben,
+        # aber auf eine einzelne Zeile angewendet (ohne Zeilenumbruch)
+        self.line_patterns = {
+            'überschrift': re.compile(r'(#{1,3})\s+(.+)'),
+            'frage': re.compile(r'F:\s*(.+)'),
+            'antwort': re.compile(r'A:\s*(.+)'),
+            'quelle': re.compile(r'\[([^\]]+)\]'),
+            'lade': re.compile(r'LADE\s+(\d+):\s*(.+)'),
+            'vers': re.compile(r'\d+\.\s+(.+)')
         }
         
         # WWAK-Transformationen
@@ -67,22 +95,18 @@ class ManuscriptProcessor:
         
         print("✓ Manuskript-Prozessor initialisiert")
     
-    def calculate_gematria(self, text: str) -> int:
+    def calculate_gematria(self, text: str, method: str = 'standard') -> int:
         """
         Berechnet Gematria-Wert eines Textes
         
         Args:
             text: Hebräischer Text
+            method: 'standard', 'klein' oder 'ordinal'
             
         Returns:
             Gematria-Wert
         """
-        total = 0
-        for char in text:
-            if char in self.gematria_values:
-                total += self.gematria_values[char]
-        
-        return total
+        return gematria(text, method)
     
     def find_gematria_connections(self, words: List[str]) -> Dict[int, List[str]]:
         """
@@ -96,24 +120,132 @@ class ManuscriptProcessor:
         """
         connections = defaultdict(list)
         
-        for word in words:
-            value = self.calculate_gematria(word)
+        # Alle Werte auf einmal (mit NumPy vektorisiert)
+        for word, value in zip(words, gematria_batch(words)):
             if value > 0:
-                connections[value].append(word)
+                connections[int(value)].append(word)
         
         # Nur Verbindungen mit mehreren Wörtern
         return {k: v for k, v in connections.items() if len(v) > 1}
     
-    def extract_structure(self, text: str) -> Dict[str, List]:
+    @classmethod
+    def _check_pairing(cls, pairing: str) -> str:
+        if pairing not in cls.PAIRING_POLICIES:
+            raise ValueError(f"Unbekannte Paarung: {pairing} (erlaubt: {', '.join(cls.PAIRING_POLICIES)})")
+        return pairing
+    
+    @staticmethod
+    def pair_questions(fragen: List[Tuple[int, str]], antworten: List[Tuple[int, str]],
+                       pairing: str = 'nächste') -> List[Dict]:
+        """
+        Ordnet Fragen und Antworten zu - ein Durchlauf über beide
+        nach Position sortierten Listen, O(F+A)
+        
+        Args:
+            fragen: (Position, Text[, Byte-Position]) aufsteigend
+            antworten: (Position, Text[, Byte-Position]) aufsteigend
+            pairing: 'nächste' oder 'abwechselnd'
+            
+        Returns:
+            Liste von Frage-Antwort-Paaren (offene Fragen mit antwort=None);
+            mit Byte-Positionen zusätzlich frage_byte_pos/antwort_byte_pos
+        """
+        ManuscriptProcessor._check_pairing(pairing)
+        abwechselnd = pairing == 'abwechselnd'
+        
+        paare = []
+        j = 0
+        for i, frage in enumerate(fragen):
+            frage_pos = frage[0]
+            fa_paar = {
+                'frage': frage[1],
+                'frage_pos': frage_pos,
+                'antwort': None,
+                'antwort_pos': None
+            }
+            mit_bytes = len(frage) > 2
+            if mit_bytes:
+                fa_paar['frage_byte_pos'] = frage[2]
+                fa_paar['antwort_byte_pos'] = None
+            
+            # Antworten vor dieser Frage bleiben ohne Frage
+            while j < len(antworten) and antworten[j][0] <= frage_pos:
+                j += 1
+            
+            if j < len(antworten):
+                antwort = antworten[j]
+                # Strikt abwechselnd: die Antwort muss vor der nächsten Frage stehen
+                if not (abwechselnd and i + 1 < len(fragen) and fragen[i + 1][0] < antwort[0]):
+                    fa_paar['antwort'] = antwort[1]
+                    fa_paar['antwort_pos'] = antwort[0]
+                    if mit_bytes:
+                        fa_paar['antwort_byte_pos'] = antwort[2]
+                    j += 1
+            
+            paare.append(fa_paar)
+        
+        return paare
+    
+    @staticmethod
+    def _iter_lines(text: str) -> Iterator[Tuple[int, Optional[int], str]]:
+        """Zeilen des Textes mit ihrer Startposition (ohne Zeilenumbruch, ohne Kopie des Textes)"""
+        position = 0
+        while True:
+            ende = text.find('\n', position)
+            if ende < 0:
+                yield position, None, text[position:]
+                return
+            yield position, None, text[position:ende]
+            position = ende + 1
+    
+    @staticmethod
+    def _iter_mapped_lines(buffer) -> Iterator[Tuple[int, int, str]]:
+        """
+        Zeilen eines UTF-8-Puffers (z.B. mmap) mit Zeichen- und
+        Byte-Position. Jede Zeile wird einzeln dekodiert - der Text
+        liegt nie vollständig im Speicher.
+        """
+        position = 0
+        byte_position = len(codecs.BOM_UTF8) if buffer[:3] == codecs.BOM_UTF8 else 0
+        while True:
+            ende = buffer.find(b'\n', byte_position)
+            if ende < 0:
+                # Letzte Zeile (wie str.split: nach '\n' am Ende eine leere)
+                yield position, byte_position, buffer[byte_position:].decode('utf-8')
+                return
+            line = buffer[byte_position:ende].decode('utf-8')
+            yield position, byte_position, line
+            position += len(line) + 1
+            byte_position = ende + 1
+    
+    def extract_structure(self, text: str, pairing: Optional[str] = None) -> Dict[str, List]:
         """
         Extrahiert Struktur aus Manuskript
         
         Args:
             text: Manuskript-Text
+            pairing: Frage-Antwort-Paarung (Standard: die des Prozessors)
             
         Returns:
             Dictionary mit Strukturelementen
         """
+        return self._scan_structure(self._iter_lines(text), pairing or self.pairing)
+    
+    def _scan_structure(self, lines: Iterable[Tuple[int, str]],
+                        pairing: str = 'nächste') -> Dict[str, List]:
+        """
+        Struktur-Scan in einem Durchlauf: jede Zeile wird einmal
+        anhand ihrer ersten Zeichen eingeordnet, hebräische Begriffe
+        werden im selben Durchlauf gesammelt.
+        
+        Args:
+            lines: (Position, Byte-Position oder None, Zeile) in Textreihenfolge
+            pairing: Frage-Antwort-Paarung
+            
+        Returns:
+            Dictionary mit Strukturelementen (mit Byte-Positionen,
+            falls die Zeilen sie liefern)
+        """
         structure = {
             'kapitel': [],
             'abschnitte': [],
@@ -125,67 +257,84 @@ class ManuscriptProcessor:
             'verse': []
         }
         
-        # Kapitel extrahieren
-        for match in self.patterns['kapitel'].finditer(text):
-            structure['kapitel'].append({
-                'titel': match.group(1),
-                'position': match.start()
-            })
-        
-        # Abschnitte
-        for match in self.patterns['abschnitt'].finditer(text):
-            structure['abschnitte'].append({
-                'titel': match.group(1),
-                'position': match.start()
-            })
-        
-        # Frage-Antwort-Paare
-        fragen = list(self.patterns['frage'].finditer(text))
-        antworten = list(self.patterns['antwort'].finditer(text))
-        
-        # Paare zuordnen
-        for i, frage in enumerate(fragen):
-            fa_paar = {
-                'frage': frage.group(1),
-                'frage_pos': frage.start(),
-                'antwort': None,
-                'antwort_pos': None
-            }
+        ueberschriften = {
+            1: structure['kapitel'],
+            2: structure['abschnitte'],
+            3: structure['unterabschnitte']
+        }
+        fragen = []
+        antworten = []
+        hebr_terms = {}
+        
+        ueberschrift = self.line_patterns['überschrift'].fullmatch
+        frage = self.line_patterns['frage'].fullmatch
+        antwort = self.line_patterns['antwort'].fullmatch
+        quelle = self.line_patterns['quelle'].fullmatch
+        lade = self.line_patterns['lade'].fullmatch
+        vers = self.line_patterns['vers'].fullmatch
+        hebraeisch = self.patterns['hebräisch'].findall
+        
+        def ort(position, byte_position):
+            if byte_position is None:
+                return {'position': position}
+            return {'position': position, 'byte_position': byte_position}
+        
+        for position, byte_position, line in lines:
+            if not line:
+                continue
             
-            # Finde nächste Antwort nach dieser Frage
-            for antwort in antworten:
-                if antwort.start() > frage.start():
-                    fa_paar['antwort'] = antwort.group(1)
-                    fa_paar['antwort_pos'] = antwort.start()
-                    break
+            # Hebräische Begriffe (reine ASCII-Zeilen enthalten keine)
+            if not line.isascii():
+                for term in hebraeisch(line):
+                    hebr_terms[term] = None
             
-            structure['fragen_antworten'].append(fa_paar)
-        
-        # Quellen
-        for match in self.patterns['quelle'].finditer(text):
-            structure['quellen'].append({
-                'quelle': match.group(1),
-                'position': match.start()
-            })
-        
-        # Hebräische Begriffe
-        hebr_terms = self.patterns['hebräisch'].findall(text)
-        structure['hebräische_begriffe'] = list(set(hebr_terms))
-        
-        # Laden (Drawers)
-        for match in self.patterns['lade'].finditer(text):
-            structure['laden'].append({
-                'nummer': int(match.group(1)),
-                'titel': match.group(2),
-                'position': match.start()
-            })
-        
-        # Verse
-        for match in self.patterns['vers'].finditer(text):
-            structure['verse'].append({
-                'text': match.group(1),
-                'position': match.start()
-            })
+            # Zeilenart nach dem ersten Zeichen
+            erstes = line[0]
+            if erstes == '#':
+                match = ueberschrift(line)
+                if match:
+                    ueberschriften[len(match.group(1))].append({
+                        'titel': match.group(2),
+                        **ort(position, byte_position)
+                    })
+            elif erstes == 'F':
+                match = frage(line)
+                if match:
+                    fragen.append((position, match.group(1)) if byte_position is None
+                                  else (position, match.group(1), byte_position))
+            elif erstes == 'A':
+                match = antwort(line)
+                if match:
+                    antworten.append((position, match.group(1)) if byte_position is None
+                                     else (position, match.group(1), byte_position))
+            elif erstes == '[':
+                match = quelle(line)
+                if match:
+                    structure['quellen'].append({
+                        'quelle': match.group(1),
+                        **ort(position, byte_position)
+                    })
+            elif erstes == 'L':
+                match = lade(line)
+                if match:
+                    structure['laden'].append({
+                        'nummer': int(match.group(1)),
+                        'titel': match.group(2),
+                        **ort(position, byte_position)
+                    })
+            elif erstes.isdecimal():
+                match = vers(line)
+                if match:
+                    structure['verse'].append({
+                        'text': match.group(1),
+                        **ort(position, byte_position)
+                    })
+        
+        # Frage-Antwort-Paare (beide Listen sind nach Position sortiert)
+        structure['fragen_antworten'] = self.pair_questions(fragen, antworten, pairing)
+        
+        # Reihenfolge des ersten Vorkommens
+        structure['hebräische_begriffe'] = list(hebr_terms)
         
         return structure
     
@@ -219,77 +368,138 @@ class ManuscriptProcessor:
         Returns:
             Liste von Chunk-Dictionaries
         """
-        chunks = []
+        return list(self.iter_segments(text, max_chunk_size))
+    
+    def iter_segments(self, text: str, max_chunk_size: int = 1500,
+                      overlap: int = 0) -> Iterator[Dict]:
+        """
+        Liefert Chunks einzeln, während der Text durchlaufen wird
         
-        # Erst nach Kapiteln teilen
-        kapitel_matches = list(self.patterns['kapitel'].finditer(text))
+        Kapitel bleiben ganz, wenn sie passen, sonst wird an Absätzen
+        geteilt (nie innerhalb eines Absatzes). 'start'/'end' sind
+        exakte Positionen im Text: chunk['text'] == text[start:end].
         
-        if kapitel_matches:
-            # Teile nach Kapiteln
-            for i in range(len(kapitel_matches)):
-                start = kapitel_matches[i].start()
-                end = kapitel_matches[i+1].start() if i+1 < len(kapitel_matches) else len(text)
-                
-                kapitel_text = text[start:end]
-                kapitel_titel = kapitel_matches[i].group(1)
-                
-                if len(kapitel_text) <= max_chunk_size:
-                    chunks.append({
-                        'text': kapitel_text,
-                        'typ': 'kapitel',
-                        'titel': kapitel_titel,
-                        'start': start,
-                        'end': end
-                    })
-                else:
-                    # Kapitel zu groß, weiter unterteilen
-                    sub_chunks = self._segment_by_paragraphs(
-                        kapitel_text, max_chunk_size, start
-                    )
-                    chunks.extend(sub_chunks)
-        else:
-            # Keine Kapitel, nach Absätzen teilen
-            chunks = self._segment_by_paragraphs(text, max_chunk_size, 0)
-        
-        return chunks
+        Mit overlap > 0 beginnt jeder Folge-Chunk desselben Kapitels
+        bis zu overlap Zeichen vor dem Ende des vorigen (höchstens an
+        dessen Anfang) - am ersten
+        Satzanfang in diesem Bereich, sonst am ersten Wortanfang.
+        Die Überlappung kommt zu max_chunk_size hinzu.
+        
+        Args:
+            text: Zu segmentierender Text
+            max_chunk_size: Maximale Chunk-Größe (ohne Überlappung)
+            overlap: Überlappung in Zeichen
+            
+        Yields:
+            Chunk-Dictionaries (mit overlap > 0 zusätzlich 'overlap')
+        """
+        ueberschrift = self.line_patterns['überschrift'].match
+        satzanfang = self.patterns['satzanfang'].search
+        wortanfang = self.patterns['wortanfang'].search
+        vorheriger_start = vorheriges_ende = None
+        
+        for chunk in self._iter_line_chunks(self._iter_lines(text), max_chunk_size):
+            start = chunk['start']
+            if overlap > 0:
+                ueberlappung = 0
+                # Ein Chunk, der mit einer Kapitelüberschrift beginnt, überlappt nicht
+                kapitel = ueberschrift(text, start)
+                if vorheriges_ende is not None and not (kapitel and len(kapitel.group(1)) == 1):
+                    fenster = max(vorheriges_ende - overlap, vorheriger_start)
+                    match = satzanfang(text, fenster, vorheriges_ende) or wortanfang(text, fenster, vorheriges_ende)
+                    if match:
+                        ueberlappung = vorheriges_ende - match.end()
+                        start = match.end()
+                chunk['overlap'] = ueberlappung
+                vorheriger_start = chunk['start']
+                vorheriges_ende = chunk['end']
+            
+            yield {'text': text[start:chunk['end']], **chunk, 'start': start}
     
-    def _segment_by_paragraphs(self, text: str, max_size: int, offset: int) -> List[Dict]:
-        """Hilfsfunktion: Teilt Text nach Absätzen"""
-        chunks = []
-        paragraphs = text.split('\n\n')
-        
-        current_chunk = ""
-        chunk_start = offset
-        
-        for para in paragraphs:
-            if len(current_chunk) + len(para) + 2 <= max_size:
-                if current_chunk:
-                    current_chunk += "\n\n"
-                current_chunk += para
+    def _iter_line_chunks(self, lines: Iterable[Tuple[int, Optional[int], str]],
+                          max_chunk_size: int) -> Iterator[Dict]:
+        """
+        Chunk-Grenzen in einem Durchlauf über die Zeilen
+        
+        Ein Kapitel (# ...) beginnt immer einen neuen Chunk, sonst wird
+        an Leerzeilen geteilt, sobald max_chunk_size überschritten würde.
+        Absätze werden nie geteilt. Liefert nur Positionen (start/end,
+        mit Byte-Positionen auch byte_start/byte_end), keinen Text.
+        """
+        ueberschrift = self.line_patterns['überschrift'].fullmatch
+        chunk = None    # offener Chunk: [start, byte_start, end, byte_end]
+        absatz = None   # laufender Absatz, ebenso
+        titel = None
+        geteilt = False
+        
+        def eintrag(bereich, typ):
+            chunk_dict = {'typ': typ}
+            if typ == 'kapitel':
+                chunk_dict['titel'] = titel
+            chunk_dict['start'] = bereich[0]
+            chunk_dict['end'] = bereich[2]
+            if bereich[1] is not None:
+                chunk_dict['byte_start'] = bereich[1]
+                chunk_dict['byte_end'] = bereich[3]
+            return chunk_dict
+        
+        for position, byte_position, line in chain(lines, [(None, None, None)]):
+            kapitel = None
+            if line is None or not line.strip():
+                leer = True
             else:
-                # Speichere aktuellen Chunk
-                if current_chunk:
-                    chunks.append({
-                        'text': current_chunk,
-                        'typ': 'absatz',
-                        'start': chunk_start,
-                        'end': chunk_start + len(current_chunk)
-                    })
+                leer = False
+                if line[0] == '#':
+                    match = ueberschrift(line)
+                    if match and len(match.group(1)) == 1:
+                        kapitel = match
+            
+            if leer or kapitel:
+                # Absatz abschließen: an den Chunk hängen oder neuen beginnen
+                if absatz:
+                    if chunk and absatz[2] - chunk[0] > max_chunk_size:
+                        yield eintrag(chunk, 'absatz')
+                        geteilt = True
+                        chunk = absatz
+                    elif chunk:
+                        chunk[2:] = absatz[2:]
+                    else:
+                        chunk = absatz
+                    absatz = None
+                
+                # Kapitelende (oder Textende)
+                if kapitel or line is None:
+                    if chunk:
+                        ganz = titel is not None and not geteilt
+                        yield eintrag(chunk, 'kapitel' if ganz else 'absatz')
+                    chunk = None
+                    geteilt = False
+                    if kapitel:
+                        titel = kapitel.group(2)
                 
-                # Starte neuen Chunk
-                current_chunk = para
-                chunk_start = chunk_start + len(current_chunk) + 2
-        
-        # Letzter Chunk
-        if current_chunk:
-            chunks.append({
-                'text': current_chunk,
-                'typ': 'absatz',
-                'start': chunk_start,
-                'end': chunk_start + len(current_chunk)
-            })
-        
-        return chunks
+                if leer:
+                    continue
+            
+            ende = position + len(line)
+            byte_ende = None if byte_position is None else byte_position + len(line.encode('utf-8'))
+            if absatz:
+                absatz[2] = ende
+                absatz[3] = byte_ende
+            else:
+                absatz = [position, byte_position, ende, byte_ende]
+    
+    @staticmethod
+    def _statistics(structure: Dict[str, List], zeichen: int, woerter: int, zeilen: int) -> Dict:
+        return {
+            'zeichen': zeichen,
+            'wörter': woerter,
+            'zeilen': zeilen,
+            'kapitel': len(structure['kapitel']),
+            'abschnitte': len(structure['abschnitte']),
+            'fragen_antworten': len(structure['fragen_antworten']),
+            'hebräische_begriffe': len(structure['hebräische_begriffe']),
+            'quellen': len(structure['quellen'])
+        }
     
     def analyze_content(self, text: str) -> Dict:
         """
@@ -312,16 +522,8 @@ class ManuscriptProcessor:
         gematria_connections = self.find_gematria_connections(hebrew_words)
         
         # Statistiken
-        stats = {
-            'zeichen': len(wwak_text),
-            'wörter': len(wwak_text.split()),
-            'zeilen': wwak_text.count('\n') + 1,
-            'kapitel': len(structure['kapitel']),
-            'abschnitte': len(structure['abschnitte']),
-            'fragen_antworten': len(structure['fragen_antworten']),
-            'hebräische_begriffe': len(structure['hebräische_begriffe']),
-            'quellen': len(structure['quellen'])
-        }
+        stats = self._statistics(structure, len(wwak_text), len(wwak_text.split()),
+                                 wwak_text.count('\n') + 1)
         
         return {
             'text': wwak_text,
@@ -351,6 +553,8 @@ class ManuscriptProcessor:
             'original_length': len(text),
             'processed_length': len(analysis['text']),
             'wwak_transformed': text != analysis['text'],
+            # Positionen im WWAK-transformierten Text
+            'positionen': 'transformiert',
             'struktur': analysis['struktur'],
             'statistiken': analysis['statistiken'],
             'chunks': chunks,
@@ -363,6 +567,94 @@ class ManuscriptProcessor:
         
         return result
     
+    def process_file(self, path, max_chunk_size: int = 1500,
+                     pairing: Optional[str] = None) -> Dict:
+        """
+        Verarbeitet eine Manuskript-Datei (UTF-8) über mmap
+        
+        Die Datei wird nie vollständig gelesen: Struktur-Scan und
+        Segmentierung laufen zeilenweise über den gemappten Puffer,
+        auch für Archive größer als der Arbeitsspeicher. Positionen
+        beziehen sich auf die Originaldatei - 'position'/'start'/'end'
+        in Zeichen, 'byte_position'/'byte_start'/'byte_end' in Bytes
+        (für seek); result['positionen'] == 'original'. Titel und
+        Texte sind WWAK-transformiert. Ändert eine Transformation die
+        Länge, weichen die Positionen daher von process() ab, das im
+        transformierten Text zählt (result['positionen'] ==
+        'transformiert'). Chunks enthalten keinen Text; read_chunk()
+        dekodiert ihn bei Bedarf.
+        
+        Args:
+            path: Pfad zur Manuskript-Datei
+            max_chunk_size: Maximale Chunk-Größe in Zeichen
+            pairing: Frage-Antwort-Paarung (Standard: die des Prozessors)
+            
+        Returns:
+            Verarbeitungsergebnis wie process(), ohne Text
+        """
+        path = Path(path)
+        zaehler = {'original': 0, 'zeichen': 0, 'wörter': 0, 'zeilen': 0, 'transformiert': False}
+        
+        # Nur Zeilen mit einem zu ersetzenden Wort transformieren
+        aendernd = [re.escape(alt) for alt, neu in self.wwak_transforms.items() if alt != neu]
+        betroffen = re.compile('|'.join(aendernd)).search if aendernd else (lambda line: None)
+        
+        def wwak_lines(lines):
+            # WWAK-Transformation zeilenweise, Statistik nebenbei
+            for position, byte_position, line in lines:
+                wwak_line = self.apply_wwak_transformation(line) if betroffen(line) else line
+                zaehler['original'] += len(line) + 1
+                zaehler['zeichen'] += len(wwak_line) + 1
+                zaehler['wörter'] += len(wwak_line.split())
+                zaehler['zeilen'] += 1
+                if wwak_line != line:
+                    zaehler['transformiert'] = True
+                yield position, byte_position, wwak_line
+        
+        with open(path, 'rb') as datei:
+            size = path.stat().st_size
+            buffer = mmap.mmap(datei.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            try:
+                structure = self._scan_structure(wwak_lines(self._iter_mapped_lines(buffer)),
+                                                 pairing or self.pairing)
+                chunks = list(self._iter_line_chunks(self._iter_mapped_lines(buffer), max_chunk_size))
+            finally:
+                if size:
+                    buffer.close()
+        
+        # Zeilenumbrüche zwischen den Zeilen (einer weniger als Zeilen)
+        stats = self._statistics(structure, zaehler['zeichen'] - 1, zaehler['wörter'], zaehler['zeilen'])
+        
+        result = {
+            'datei': str(path),
+            'byte_length': size,
+            'original_length': zaehler['original'] - 1,
+            'processed_length': stats['zeichen'],
+            'wwak_transformed': zaehler['transformiert'],
+            # Positionen in der Originaldatei (Titel dennoch transformiert)
+            'positionen': 'original',
+            'struktur': structure,
+            'statistiken': stats,
+            'chunks': chunks,
+            'chunk_count': len(chunks)
+        }
+        
+        gematria_connections = self.find_gematria_connections(structure['hebräische_begriffe'])
+        if gematria_connections:
+            result['gematria_verbindungen'] = gematria_connections
+        
+        return result
+    
+    def read_chunk(self, path, chunk: Dict) -> str:
+        """
+        Liest den Text eines Chunks aus process_file() direkt über
+        seine Byte-Positionen (WWAK-transformiert wie in process())
+        """
+        with open(path, 'rb') as datei:
+            datei.seek(chunk['byte_start'])
+            raw = datei.read(chunk['byte_end'] - chunk['byte_start'])
+        return self.apply_wwak_transformation(raw.decode('utf-8'))
+    
     def format_summary(self, result: Dict) -> str:
         """
         Formatiert Verarbeitungsergebnis als Zusammenfassung
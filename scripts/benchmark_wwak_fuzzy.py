@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAK Unscharfe Suche - Durchsatz
+================================
+SymSpell-Index über Lehnwörter und Sefirot gegen ein Korpus aus
+1 Million Token (Zipf-verteilt, mit Verschreibungen und OCR-Rauschen).
+
+Verwendung:
+    python scripts/benchmark_wwak_fuzzy.py [anzahl_token]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "modules" / "core"))
+
+from wwaq_transformer import WWAKBuchstabenLehre
+
+WOERTER = [
+    "die", "und", "der", "Licht", "Gefäß", "Weisheit", "lehrt", "über",
+    "Tradition", "Welt", "Seele", "Keller", "Kabbala", "Tiqqun", "Chochma",
+    "Bina", "Malchut", "Quelle", "Krone", "Azilut",
+    # deutsche Wörter nah an Lehnwörtern - dürfen nie Treffer sein
+    "Meter", "Peter", "Kater", "Kelter", "Bine", "Hode"
+]
+VERSCHRIEBEN = ["Kabala", "Qabalah", "Tikkoun", "Gevurah", "Binah", "Malkhut", "Chesed"]
+
+def erzeuge_korpus(anzahl: int) -> str:
+    zufall = random.Random(5785)
+    gewichte = [1 / (rang + 1) for rang in range(len(WOERTER))]
+    token = zufall.choices(WOERTER, weights=gewichte, k=anzahl)
+    for i in range(0, anzahl, 50):
+        token[i] = zufall.choice(VERSCHRIEBEN)
+    # OCR-Rauschen: seltene, nie wiederkehrende Wörter
+    for i in range(25, anzahl, 200):
+        wort = list(zufall.choice(WOERTER).capitalize())
+        wort[zufall.randrange(len(wort))] = zufall.choice("abcdefghijklmnopqrstuvwxyz")
+        token[i] = "".join(wort)
+    return " ".join(token)
+
+def main():
+    anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    korpus = erzeuge_korpus(anzahl)
+    index = WWAKBuchstabenLehre(cache_size=0).engine.fuzzy_index
+
+    print("WWAK UNSCHARFE SUCHE")
+    print("=" * 50)
+    print(f"Lexikon: {len(index.lexicon)} Wörter, {len(index.deletes)} Löschvarianten")
+
+    start = time.perf_counter()
+    treffer = index.scan(korpus)
+    dauer = time.perf_counter() - start
+
+    info = index.cache_info()
+    print(f"{anzahl} Token in {dauer:.2f}s: {anzahl / dauer:,.0f} Token/s")
+    print(f"Treffer: {len(treffer)}, Cache-Trefferquote {info['hit_rate']:.1%}")
+    print("\nQ!")
+
+if __name__ == "__main__":
+    main()
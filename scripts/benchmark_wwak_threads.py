@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAK Thread-Durchsatz
+=====================
+Eine gemeinsame WWAKEngine, viele Threads.
+
+Misst Texte/s für 1, 2, 4, 8 Threads. Mit GIL bleibt der Durchsatz
+etwa gleich - auf CPython-Builds ohne GIL (python3.13t) skaliert er
+mit der Anzahl der Kerne, weil die Engine keinen Zustand teilt.
+
+Verwendung:
+    python scripts/benchmark_wwak_threads.py [anzahl_texte]
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "modules" / "core"))
+
+from wwaq_transformer import WWAKBuchstabenLehre, WWAKOptions
+
+WOERTER = [
+    "Die", "Kabbala", "lehrt", "über", "Kelim", "und", "Qrone", "der",
+    "qabbalistischen", "Tradition", "Tikkun", "Kraft", "Quelle", "B\"H",
+    "Licht", "Gefäß", "Weisheit", "Azilut"
+]
+
+def erzeuge_texte(anzahl: int, woerter: int = 400):
+    zufall = random.Random(5785)
+    return [" ".join(zufall.choice(WOERTER) for _ in range(woerter)) for _ in range(anzahl)]
+
+def messe(engine, texte, threads: int) -> float:
+    options = WWAKOptions()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(lambda text: engine.check_text(text, options), texte,
+                          chunksize=max(1, len(texte) // (threads * 8))):
+            pass
+    return len(texte) / (time.perf_counter() - start)
+
+def main():
+    anzahl = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    texte = erzeuge_texte(anzahl)
+    engine = WWAKBuchstabenLehre(cache_size=0).engine
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("WWAK THREAD-DURCHSATZ")
+    print("=" * 50)
+    print(f"{anzahl} Texte, GIL {'aktiv' if gil else 'deaktiviert'}\n")
+
+    basis = None
+    for threads in (1, 2, 4, 8):
+        rate = messe(engine, texte, threads)
+        basis = basis or rate
+        print(f"  {threads} Threads: {rate:8.0f} Texte/s  (x{rate / basis:.2f})")
+
+    print("\nQ!")
+
+if __name__ == "__main__":
+    main()
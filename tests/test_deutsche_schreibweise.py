@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regressionstests für deutsche_schreibweise
+==========================================
+Besonders Eingaben, bei denen Groß-/Kleinschreibung nicht mit
+lower() übereinstimmt (ſ, İ, ẞ) - typisch für OCR und Fraktur.
+
+Verwendung:
+    python -m pytest tests/test_deutsche_schreibweise.py -q
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "modules" / "core"))
+
+import deutsche_schreibweise as ds
+
+
+def test_zer_sonderfaelle_der_faltung():
+    zer = ds.ZerEliminator()
+    text, aenderungen = zer.eliminiere_zer("Er zerſtört ZERREİẞEN, dann zerbricht es.")
+    assert "zerbricht" not in text
+    assert aenderungen == ["zerbricht → berstet"]
+
+    ergebnis = ds.DeutscheSchreibweise().vollstaendige_pruefung("Er zerſtört ZERREİẞEN.")
+    assert ergebnis['original'] == "Er zerſtört ZERREİẞEN."
+
+
+def test_artikel_sonderfaelle_der_faltung():
+    orthografie = ds.DeutscheOrthografie()
+    assert orthografie.pruefe_artikel_text("daſ Kli und DİE Weisheit") == []
+    befunde = orthografie.pruefe_artikel_text("Der Kli und der Weisheit")
+    assert [(b.wort, b.quelle) for b in befunde] == [("Kli", "lexikon")]
+
+
+def test_genus_keine_falschen_er_befunde():
+    orthografie = ds.DeutscheOrthografie()
+    text = "Das Opfer, das Wasser, das Zimmer, das Fenster und die Mutter"
+    assert orthografie.pruefe_artikel_text(text) == []
+    assert orthografie.bestimme_genus("Mutter") is None
+    assert orthografie.bestimme_genus("Offenbarung") == "feminin"
+
+
+def test_stil_ausdruck_mit_eszett():
+    stil = ds.AusdruckStilPruefer()
+    stil.ergaenze_ausdruecke({'Gott weiß': 'es ist offenbar'})
+    treffer = stil.finde_ausdruecke("Gott weiß es. GOTT WEIß es. Gott weiss es.")
+    assert [(t.position, t.ausdruck) for t in treffer] == [(0, 'Gott weiß'), (14, 'Gott weiß')]
+    assert stil.pruefe_stil("Ja, gott weiß.")
+
+
+def test_vorfilter_wie_volle_pruefung():
+    pruefer = ds.DeutscheSchreibweise()
+    woerter = ["Die", "Lehre", "über", "Licht", "ſ", "İ", "ZER", "zerſtört", "Gott will"]
+    woerter += list(pruefer.transliterator.wwak_regeln)[:20] + list(pruefer.zer_eliminator.formen)[:20]
+    zufall = random.Random(5785)
+    for _ in range(500):
+        text = " ".join(zufall.choice(woerter) for _ in range(zufall.randrange(0, 12)))
+        transliteriert, ersetzungen = pruefer.transliterator.transliteriere_mit_positionen(text)
+        korrigiert, zer = pruefer.zer_eliminator.eliminiere_zer_mit_positionen(transliteriert)
+        voll = ds.BlockErgebnis(korrigiert, len(transliteriert), ersetzungen, zer,
+                                pruefer.stil.finde_ausdruecke(korrigiert))
+        assert pruefer.pruefe_block(text) == voll, text
+
+    assert not pruefer.kann_betroffen_sein("Die Lehre über das Licht.")
+    assert pruefer.kann_betroffen_sein("Er zerstörte alles.")
+    # Nach Ergänzungen neu gebaut
+    pruefer.stil.ergaenze_ausdruecke({'Die Lehre': ''})
+    assert pruefer.kann_betroffen_sein("Die Lehre über das Licht.")
+
+
+def test_bloecke_wie_sequentiell():
+    sequentiell = ds.DeutscheSchreibweise()
+    woerter = ["Die", "Lehre", "über", "Licht.", "ſ", "İ", "ZER", "zerſtört!", "Gott will", "\n", "?"]
+    woerter += list(sequentiell.transliterator.wwak_regeln)[:20] + list(sequentiell.zer_eliminator.formen)[:20]
+    woerter += list(sequentiell.stil.anthropomorph_vermeiden)[:5]
+    zufall = random.Random(5785)
+    texte = [" ".join(zufall.choice(woerter) for _ in range(zufall.randrange(1, 200))) for _ in range(30)]
+    for text in texte:
+        erwartet = sequentiell.vollstaendige_pruefung(text)
+        for groesse in (1, 7, 50, 400):
+            assert ''.join(sequentiell.teile_bloecke(text, groesse)) == text
+            bloecke = ds.DeutscheSchreibweise(block_groesse=groesse, prozesse=1)
+            assert bloecke.vollstaendige_pruefung(text) == erwartet, (groesse, text)
+    # Einmal wirklich über den Prozess-Pool
+    text = "\n".join(texte)
+    assert sequentiell.vollstaendige_pruefung_parallel(text, 500, prozesse=2) == \
+        sequentiell.vollstaendige_pruefung(text)
+
+
+def test_vorfilter_nach_geaendertem_ersatz():
+    pruefer = ds.DeutscheSchreibweise()
+    assert pruefer.vollstaendige_pruefung("Das Kli. Q!")["korrigiert"] == "Das Kli. Q!"
+    # Nur der Ersatz ändert sich, das Suchmuster bleibt dasselbe
+    pruefer.transliterator.wwak_regeln['Kli'] = 'Qli'
+    pruefer.transliterator.kompiliere_regeln()
+    assert pruefer.transliterator.transliteriere("Das Kli.") == "Das Qli."
+    assert pruefer.vollstaendige_pruefung("Das Kli. Q!")["korrigiert"] == "Das Qli. Q!"
+
+
+def test_artikel_plural_nur_mit_pluralendung():
+    orthografie = ds.DeutscheOrthografie()
+    befunde = orthografie.pruefe_artikel_text("die Chassidismus und den Weisheit")
+    assert [(b.artikel, b.wort, b.genus) for b in befunde] == \
+        [("die", "Chassidismus", "m"), ("den", "Weisheit", "f")]
+    text = "die Offenbarungen, den Weisheiten, der Eigenschaften, die Weisheit"
+    assert orthografie.pruefe_artikel_text(text) == []
+    assert orthografie.bestimme_genus("Offenbarungen") == "Plural"
+
+
+def test_artikel_in_artikelketten():
+    orthografie = ds.DeutscheOrthografie()
+    befunde = orthografie.pruefe_artikel_text("Er las die Der Kli und der Die Weisheit.")
+    assert [(b.position, b.artikel, b.wort) for b in befunde] == [(11, "Der", "Kli")]
+
+
+def test_verwandte_begriffe_begrenzt():
+    semantik = ds.SemantikPruefer(verwandte_maxsize=2)
+    assert semantik.finde_verwandte_begriffe('Kli') == ['Klim', 'empfangen', 'aufnehmen', 'fassen']
+    for wort in ['Or', 'Tiqqun', 'Klipa', 'Kli']:
+        semantik.finde_verwandte_begriffe(wort)
+    for i in range(1000):
+        assert semantik.finde_verwandte_begriffe(f"Unbekannt{i}") == []
+    info = semantik._verwandte.cache_info()
+    assert info.currsize == 2 and info.maxsize == 2
+    # Rückgaben sind Kopien
+    semantik.finde_verwandte_begriffe('Kli').append('x')
+    assert 'x' not in semantik.finde_verwandte_begriffe('Kli')
+
+
+def transliteriere_einfach(regeln, text):
+    """Referenz: an jeder Stelle die längste passende Regel, sonst ein Zeichen weiter"""
+    teile = []
+    i = 0
+    while i < len(text):
+        passend = [alt for alt in regeln if text.startswith(alt, i)]
+        if passend:
+            alt = max(passend, key=len)
+            teile.append(regeln[alt])
+            i += len(alt)
+        else:
+            teile.append(text[i])
+            i += 1
+    return ''.join(teile)
+
+
+def test_transliteration_wie_einzelne_ersetzungen():
+    transliterator = ds.HebraischDeutschTransliterator()
+    regeln = transliterator.wwak_regeln
+    zufall = random.Random(5785)
+    fuellwoerter = ["und", "die", "K", "Kl", "Gevu", "ra", "h", " ", ".", "ä"]
+
+    # Regeln ohne Überschneidung: ein Durchlauf = str.replace je Regel
+    for alt, neu in regeln.items():
+        text = f"{alt} und {alt}{alt}."
+        assert transliterator.transliteriere(text) == text.replace(alt, neu), alt
+
+    for _ in range(300):
+        text = "".join(zufall.choice(list(regeln) + fuellwoerter)
+                       for _ in range(zufall.randrange(0, 30)))
+        neu_text, ersetzungen = transliterator.transliteriere_mit_positionen(text)
+        assert neu_text == transliteriere_einfach(regeln, text), text
+        for ersetzung in ersetzungen:
+            assert text.startswith(ersetzung.alt, ersetzung.position)
+            assert regeln[ersetzung.alt] == ersetzung.neu != ersetzung.alt
+
+    # Längster Treffer gewinnt - sequentiell entstand hier "Gewurah"
+    assert transliterator.transliteriere("Gevurah und Gevura") == "Gewura und Gewura"
+
+
+def test_korpus_cache_verdraengung_und_zaehler():
+    korpus = ds.KorpusAnalyse(maxsize=2)
+    kli = korpus.analysiere_wort("Kli")
+    korpus.analysiere_wort("Or")
+    assert korpus.analysiere_wort("Kli") is kli  # Treffer, Kli zuletzt benutzt
+    korpus.analysiere_wort("Tiqqun")             # verdrängt Or
+    info = korpus.info()
+    assert (info['hits'], info['misses'], info['size'], info['maxsize']) == (1, 3, 2, 2)
+    assert info['hit_rate'] == 0.25
+    assert info['bytes'] > 0
+
+    assert korpus.analysiere_wort("Kli") is kli
+    korpus.analysiere_wort("Or")
+    assert korpus.info()['misses'] == 4
+
+    tokens = korpus.analysiere_text("Or Or Or")
+    assert [t.position for t in tokens] == [0, 3, 6]
+    assert tokens[0].analyse is tokens[2].analyse
+    assert korpus.info()['hits'] == 5
+
+    korpus.cache.clear()
+    assert korpus.info() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0,
+                             'size': 0, 'maxsize': 2, 'bytes': 0}
+
+
+def test_komponenten_erst_bei_bedarf():
+    pruefer = ds.DeutscheSchreibweise()
+    assert pruefer.komponenten() == []
+    pruefer.transliterator.transliteriere("Kli")
+    assert pruefer.komponenten() == ['transliterator']
+    pruefer.analysiere_text("Kli")
+    assert 'korpus' in pruefer.komponenten() and 'semantik' not in pruefer.komponenten()
+    semantik = pruefer.semantik
+    assert pruefer.semantik is semantik
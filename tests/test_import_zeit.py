@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kaltstart-Budget für deutsche_schreibweise
+==========================================
+CLI und Serverless-Handler importieren das Modul bei jedem Start.
+Gemessen wird in einem frischen Interpreter mit `python -X importtime`
+(Bytecode liegt bereits vor - wie nach der Installation).
+
+Verwendung:
+    python -m pytest tests/test_import_zeit.py -q
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+CORE = Path(__file__).resolve().parent.parent / "modules" / "core"
+
+# Budgets in Millisekunden (großzügig für langsame CI-Rechner)
+IMPORT_BUDGET_MS = 60
+KONSTRUKTION_BUDGET_MS = 25
+
+MESSUNG = """
+import sys, time
+start = time.perf_counter()
+import deutsche_schreibweise as ds
+import_ms = (time.perf_counter() - start) * 1e3
+start = time.perf_counter()
+pruefer = ds.DeutscheSchreibweise()
+pruefer.transliterator.transliteriere("Die Torah über Gevurah")
+konstruktion_ms = (time.perf_counter() - start) * 1e3
+print(import_ms, konstruktion_ms, ",".join(pruefer.komponenten()), "numpy" in sys.modules)
+"""
+
+
+def _python(code: str, cache: str, *optionen: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, *optionen, "-c", code], cwd=CORE, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _importzeit_ms(stderr: str, modul: str) -> float:
+    """Kumulierte Zeit eines Moduls aus der -X importtime Ausgabe"""
+    for zeile in stderr.splitlines():
+        teile = [teil.strip() for teil in zeile.split("|")]
+        if len(teile) == 3 and teile[2] == modul:
+            return int(teile[1]) / 1000
+    raise AssertionError(f"{modul} nicht in -X importtime gefunden")
+
+
+def test_import_und_konstruktion_im_budget():
+    with tempfile.TemporaryDirectory() as cache:
+        _python("import deutsche_schreibweise", cache)  # Bytecode anlegen
+
+        importtime = _python("import deutsche_schreibweise", cache, "-X", "importtime")
+        assert _importzeit_ms(importtime.stderr, "deutsche_schreibweise") < IMPORT_BUDGET_MS
+
+        import_ms, konstruktion_ms, komponenten, numpy_geladen = \
+            _python(MESSUNG, cache).stdout.split()
+        assert float(import_ms) < IMPORT_BUDGET_MS
+        assert float(konstruktion_ms) < KONSTRUKTION_BUDGET_MS
+
+        # Nur Transliteration benutzt - nur sie wird aufgebaut
+        assert komponenten == "transliterator"
+        assert numpy_geladen == "False"
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regressionstests für den Manuskript-Prozessor
+=============================================
+Die schnellen Pfade (mmap, Zwei-Zeiger-Paarung, Streaming-Segmente)
+werden gegen die einfachen Pfade bzw. den früheren Stand verglichen.
+
+Verwendung:
+    python -m pytest tests/test_manuscript_processor.py -q
+"""
+
+import contextlib
+import importlib.util
+import io
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "modules" / "core"))
+
+BIBLIOTHEK = ROOT / "modules" / "ez-chajim-manuscript-proc" / "manuscript-processor-lib.py"
+
+_spec = importlib.util.spec_from_file_location("manuscript_processor_lib", BIBLIOTHEK)
+manuscript = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(manuscript)
+
+MANUSKRIPT = """# Die Lehre der Kabbala
+
+Die Kabbala lehrt über Kelim, die zerbrechen.
+
+F: Was ist Kawana?
+A: Kawana ist die gerichtete Absicht.
+
+[Sohar, Teil 1]
+
+## Die עץ חיים
+Das Wort חיים hat den Wert 68.
+LADE 3: Die zerstören Kräfte
+1. Keter - die Krone
+"""
+
+
+def prozessor(**optionen):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return manuscript.ManuscriptProcessor(**optionen)
+
+
+def test_import_ohne_core_pfad(tmp_path):
+    # Frischer Interpreter ohne modules/core auf sys.path
+    code = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('mp', {str(BIBLIOTHEK)!r})\n"
+        "modul = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(modul)\n"
+        "print(modul.gematria('חיים'))\n"
+    )
+    ergebnis = subprocess.run([sys.executable, "-c", code], cwd=tmp_path,
+                              capture_output=True, text=True, env={"PYTHONPATH": ""})
+    assert ergebnis.returncode == 0, ergebnis.stderr
+    assert ergebnis.stdout.strip() == "68"
+
+
+def test_process_file_positionen_in_der_datei(tmp_path):
+    datei = tmp_path / "manuskript.txt"
+    datei.write_bytes(MANUSKRIPT.encode("utf-8"))
+    p = prozessor()
+
+    aus_datei = p.process_file(datei)
+    aus_text = p.process(MANUSKRIPT)
+    assert aus_datei['positionen'] == 'original'
+    assert aus_text['positionen'] == 'transformiert'
+    assert aus_datei['statistiken'] == aus_text['statistiken']
+
+    # Die Transformation verkürzt Zeilen ("zerbrechen", "zerstören"):
+    # Positionen danach weichen von process() ab, zeigen aber in die Originaldatei
+    daten = datei.read_bytes()
+    for lade, lade_text in zip(aus_datei['struktur']['laden'], aus_text['struktur']['laden']):
+        assert lade['titel'] == lade_text['titel']
+        assert lade['position'] != lade_text['position']
+        assert MANUSKRIPT[lade['position']:].startswith("LADE 3:")
+        assert daten[lade['byte_position']:].startswith(b"LADE 3:")
+    vers = aus_datei['struktur']['verse'][0]
+    assert MANUSKRIPT[vers['position']:].startswith("1. Keter")
+
+    for chunk in aus_datei['chunks']:
+        text = MANUSKRIPT[chunk['start']:chunk['end']]
+        assert daten[chunk['byte_start']:chunk['byte_end']].decode("utf-8") == text
+        assert p.read_chunk(datei, chunk) == p.apply_wwak_transformation(text)
+
+
+def paare_einfach(fragen, antworten, pairing):
+    """Referenz: für jede Frage alle Antworten von vorn durchsuchen, O(F*A)"""
+    vergeben = set()
+    paare = []
+    for i, (frage_pos, frage_text) in enumerate(fragen):
+        grenze = fragen[i + 1][0] if pairing == 'abwechselnd' and i + 1 < len(fragen) else None
+        paar = {'frage': frage_text, 'frage_pos': frage_pos, 'antwort': None, 'antwort_pos': None}
+        for antwort_pos, antwort_text in antworten:
+            if antwort_pos > frage_pos and antwort_pos not in vergeben:
+                if grenze is None or antwort_pos < grenze:
+                    paar['antwort'] = antwort_text
+                    paar['antwort_pos'] = antwort_pos
+                    vergeben.add(antwort_pos)
+                break
+        paare.append(paar)
+    return paare
+
+
+def test_paarung_wie_einfache_suche():
+    zufall = random.Random(5785)
+    for _ in range(500):
+        zeilen = [zufall.choice("FA") for _ in range(zufall.randrange(0, 20))]
+        fragen = [(i, f"Frage {i}") for i, art in enumerate(zeilen) if art == "F"]
+        antworten = [(i, f"Antwort {i}") for i, art in enumerate(zeilen) if art == "A"]
+        for pairing in manuscript.ManuscriptProcessor.PAIRING_POLICIES:
+            assert manuscript.ManuscriptProcessor.pair_questions(fragen, antworten, pairing) == \
+                paare_einfach(fragen, antworten, pairing), (zeilen, pairing)
+
+
+def test_paarung_im_text():
+    text = "F: Was ist Kawana?\nF: Und Kli?\nA: Die Absicht.\nA: Das Gefäß.\nA: Nachtrag.\n"
+    p = prozessor()
+    naechste = p.extract_structure(text)['fragen_antworten']
+    assert [(paar['frage'], paar['antwort']) for paar in naechste] == \
+        [("Was ist Kawana?", "Die Absicht."), ("Und Kli?", "Das Gefäß.")]
+    abwechselnd = p.extract_structure(text, pairing='abwechselnd')['fragen_antworten']
+    assert [(paar['frage'], paar['antwort']) for paar in abwechselnd] == \
+        [("Was ist Kawana?", None), ("Und Kli?", "Die Absicht.")]
+    with pytest.raises(ValueError):
+        p.extract_structure(text, pairing='zufall')
+
+
+def test_segmente_mit_ueberlappung():
+    p = prozessor()
+    zufall = random.Random(5785)
+    zeilen = ["# Kapitel {}", "## Abschnitt {}", "Ein Satz {}. Noch ein Satz über Keter! Und eine Frage?",
+              "Fließtext {} äöü ß ohne Punkt", "Langwort" + "x" * 60, "", "", "  "]
+    for _ in range(300):
+        text = "\n".join(zufall.choice(zeilen).format(i) for i in range(zufall.randrange(0, 60)))
+        groesse = zufall.choice([10, 40, 120, 400])
+        ueberlappung = zufall.choice([15, 60])
+        ohne = p.segment_text(text, groesse)
+        mit = list(p.iter_segments(text, groesse, ueberlappung))
+
+        # Ohne Überlappung: exakte Positionen, kein Text geht verloren
+        assert list(p.iter_segments(text, groesse)) == ohne
+        for chunk in ohne:
+            assert chunk['text'] == text[chunk['start']:chunk['end']]
+        assert "".join("".join(c['text'].split()) for c in ohne) == "".join(text.split())
+
+        # Mit Überlappung: gleiche Enden, Anfang nur nach vorn verschoben
+        assert [c['end'] for c in mit] == [c['end'] for c in ohne]
+        vorher = None
+        for chunk, basis in zip(mit, ohne):
+            assert chunk['text'] == text[chunk['start']:chunk['end']]
+            assert 0 <= chunk['overlap'] <= ueberlappung
+            if chunk['overlap']:
+                # 'overlap' zählt die mit dem vorigen Chunk geteilten Zeichen
+                assert chunk['start'] == vorher['end'] - chunk['overlap']
+                assert vorher['start'] <= chunk['start']
+                assert chunk['start'] == 0 or text[chunk['start'] - 1].isspace()
+                assert not text[chunk['start']].isspace()
+            else:
+                assert chunk['start'] == basis['start']
+            vorher = basis
+
+
+def test_struktur_zeilenweise():
+    p = prozessor()
+    text = "# Kapitel\n### Unter\n[Sohar\nA:\nB: kein Treffer\nDas Wort חיים und עץ, dann חיים wieder.\n"
+    struktur = p.extract_structure(text)
+    assert struktur['kapitel'] == [{'titel': 'Kapitel', 'position': 0}]
+    assert struktur['unterabschnitte'] == [{'titel': 'Unter', 'position': 10}]
+    # Offene Klammer und leeres "A:" greifen nicht in die nächste Zeile
+    assert struktur['quellen'] == []
+    assert struktur['fragen_antworten'] == []
+    # Reihenfolge des ersten Auftretens, ohne Dubletten
+    assert struktur['hebräische_begriffe'] == ['חיים', 'עץ']
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regressionstests für wwaq_transformer
+=====================================
+Der Ein-Durchlauf-Matcher wird gegen die früheren Einzelprüfungen
+(ein Regex pro Regel) verglichen - auch mit Zeichen, die
+re.IGNORECASE anders faltet als str.lower() (İ, ı, ſ).
+
+Verwendung:
+    python -m pytest tests/test_wwaq_transformer.py -q
+"""
+
+import io
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "modules" / "core"))
+
+import wwaq_transformer
+from wwaq_transformer import WWAKBuchstabenLehre
+
+WOERTER = [
+    "Die", "Kabbala", "kabbala", "KLİ", "Klı", "kli", "Kli", "KLIPOTİSCH", "klipotische",
+    "Qrone", "qraft", "QÖNNEN", "Krone", "Kelim", "KELİM", "Tikkun", "tikun", "Wwak",
+    "Qabbalistischen", "Kawana", "Kedusha", "Quelle", "Kraft", "ſtark", "Licht", "B\"H"
+]
+
+
+def einzelpruefungen(lehre, text):
+    """Die Prüfungen 1-3 wie vor dem Ein-Durchlauf-Matcher"""
+    gefunden = []
+    for match in re.finditer(r'\b[Qq](?:rone|raft|ommen|önnen)\b', text, re.IGNORECASE):
+        gefunden.append((match.group(), match.start(), "false_q_in_german",
+                         match.group().replace('Q', 'K').replace('q', 'k')))
+    for wrong, correct in lehre.hebrew_loanwords.items():
+        for match in re.finditer(r'\b' + re.escape(wrong) + r'\b', text, re.IGNORECASE):
+            if match.group()[0].isupper():
+                gefunden.append((match.group(), match.start(), "missing_q_in_hebrew", correct))
+    for forbidden in lehre.forbidden_q_forms:
+        for match in re.finditer(r'\b' + re.escape(forbidden) + r'\b', text, re.IGNORECASE):
+            gefunden.append((match.group(), match.start(), "forbidden_q_form",
+                             match.group().replace('q', 'k').replace('Q', 'k')))
+    return gefunden
+
+
+def test_matcher_wie_einzelpruefungen():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    for _ in range(300):
+        text = " ".join(zufall.choice(WOERTER) for _ in range(zufall.randrange(1, 30)))
+        neu = [(v.text, v.position, v.violation_type, v.correction)
+               for v in lehre.engine.matcher.scan(text)]
+        assert neu == einzelpruefungen(lehre, text), text
+
+
+def test_matcher_sonderfaelle_der_faltung():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    gefunden = {v.text for v in lehre.check_text('Die KLİ und KLIPOTİSCH B"H')}
+    assert gefunden == {"KLİ", "KLIPOTİSCH"}
+
+
+def test_unscharf_umschriften_der_sefirot():
+    index = WWAKBuchstabenLehre(cache_size=0).engine.fuzzy_index
+    text = ("Chesed Gevura Binah Kether Jesod Yesod Malkuth Qabala "
+            "Qabalah Tikkoun Tiphereth Netzach Chokhmah")
+    assert [(v.text, v.correction) for v in index.scan(text)] == [
+        ("Chesed", "Chessed"), ("Gevura", "Gewura"), ("Binah", "Bina"),
+        ("Kether", "Keter"), ("Jesod", "Jessod"), ("Yesod", "Jessod"),
+        ("Malkuth", "Malchut"), ("Qabala", "Kabbala"), ("Qabalah", "Kabbala"),
+        ("Tikkoun", "Tiqqun"), ("Tiphereth", "Tiferet"), ("Netzach", "Nezach"),
+        ("Chokhmah", "Chochma"),
+    ]
+
+
+def test_unscharf_keine_deutschen_woerter():
+    index = WWAKBuchstabenLehre(cache_size=0).engine.fuzzy_index
+    text = ("Meter Peter Kater Kelter Keltern Bine Biene Hode Keller Kette Komma "
+            "Tiefere Tiefert Kappala Kawalla Kawanot Kabale Klippe Kessel Keim")
+    assert index.scan(text) == []
+    # Richtige Schreibweisen und kurze Lehnwörter nur exakt
+    assert index.scan("Kabbala Keter Hod Hodd Kli Klo Wach") == []
+
+
+def kurz(violations):
+    return [(v.text, v.position, v.violation_type, v.correction, v.severity) for v in violations]
+
+
+def zufaellige_bearbeitung(zufall, text):
+    position = zufall.randrange(len(text) + 1)
+    laenge = zufall.randrange(min(8, len(text) - position) + 1)
+    ersatz = zufall.choice(["", " ", "Qraft ", " Kli", "İ", "ab", zufall.choice(WOERTER)])
+    return position, laenge, ersatz
+
+
+def test_recheck_wie_volle_pruefung():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    for _ in range(100):
+        text = " ".join(zufall.choice(WOERTER) for _ in range(zufall.randrange(1, 30)))
+        analyse = lehre.analyze(text)
+        # Mehrere Runden hintereinander, teils mit mehreren Ersetzungen
+        for _ in range(5):
+            bearbeitungen = [zufaellige_bearbeitung(zufall, text) for _ in range(zufall.randrange(1, 4))]
+            alt = text
+            text, analyse = lehre.recheck(analyse, alt, bearbeitungen)
+            voll = lehre.analyze(text)
+            assert kurz(analyse.violations) == kurz(voll.violations), (alt, bearbeitungen)
+            assert analyse.word_count == voll.word_count, (alt, bearbeitungen)
+        assert [v.position for v in analyse.by_position] == \
+            sorted(v.position for v in voll.violations if v.text != "[Gesamttext]")
+
+
+def test_recheck_aufwand_unabhaengig_vom_rest(monkeypatch):
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    erzeugt = []
+
+    class ZaehlenderVerstoss(wwaq_transformer.WWAKViolation):
+        def __init__(self, *args, **kwargs):
+            erzeugt.append(1)
+            super().__init__(*args, **kwargs)
+
+    def bearbeitete_verstoesse(woerter):
+        text = " ".join(["Kli Qraft"] * woerter)
+        text, analyse = lehre.recheck(lehre.analyze(text), text, [(0, 0, "Qraft ")])
+        # Gemessen wird die zweite Runde: der Index steht schon
+        erzeugt.clear()
+        with monkeypatch.context() as m:
+            m.setattr(wwaq_transformer, "WWAKViolation", ZaehlenderVerstoss)
+            mitte = len(text) // 2
+            _, analyse = lehre.recheck(analyse, text, [(mitte, 0, " Qraft ")])
+        stuecke = len(analyse.by_position.pieces)
+        return len(erzeugt), stuecke, len(analyse.violations) - 2 * woerter
+
+    klein, gross = bearbeitete_verstoesse(100), bearbeitete_verstoesse(20_000)
+    assert klein == gross
+    assert klein[2] == 2  # die beiden eingefügten Qraft
+
+
+def test_violation_set_wie_check_text():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    woerter = WOERTER + ["Bnei Baruch", "Qabalah", "Tikkoun", "JHWH"]
+    for _ in range(200):
+        text = " ".join(zufall.choice(woerter) for _ in range(zufall.randrange(0, 30)))
+        liste = lehre.check_text(text)
+        kompakt = lehre.check_text_compact(text)
+        assert len(kompakt) == len(liste)
+        assert [kurz([v]) + [v.world_impact] for v in kompakt] == \
+            [kurz([v]) + [v.world_impact] for v in liste], text
+        for schwere in ("kritisch", "warnung", "hinweis"):
+            assert kurz(kompakt.filter_severity(schwere)) == \
+                kurz(v for v in liste if v.severity == schwere)
+        if text:
+            start = zufall.randrange(len(text))
+            ende = zufall.randrange(start, len(text) + 1)
+            assert sorted(kurz(kompakt.in_range(start, ende))) == \
+                sorted(kurz(v for v in liste if start <= v.position < ende))
+
+
+def erwartete_stelle(text, position):
+    """Zeile, Spalte und Byte-Offset durch Abzählen"""
+    zeile = text.count("\n", 0, position) + 1
+    spalte = position - (text.rfind("\n", 0, position) + 1) + 1
+    return zeile, spalte, len(text[:position].encode("utf-8", "surrogatepass"))
+
+
+def test_zeilen_spalten_bytes_mit_umlauten_und_crlf():
+    text = ("Die Kabbala über קבלה\r\nDas Kli – ein Gefäß 🙂 Qraft\r\n\r\n"
+            "ſ Kelim\nḾ" + "ä" * 300 + " Kli Qraft\r\nKli")
+    lehre = WWAKBuchstabenLehre(cache_size=4)
+    index = wwaq_transformer.LineIndex(text)
+    for position in range(len(text) + 1):
+        zeile, spalte, byte = erwartete_stelle(text, position)
+        assert index.resolve(position) == (zeile, spalte)
+        assert index.byte_offset(position) == byte
+
+    analyse = lehre.analyze(text)
+    vorher = kurz(analyse.violations)
+    annotiert = index.annotate(analyse.violations)
+    assert [(v.line, v.column, v.byte_position) for v in annotiert] == \
+        [erwartete_stelle(text, v.position) for v in annotiert]
+    # Die Verstöße im Analyse-Cache bleiben unberührt
+    assert all(v.line is None and v.byte_position is None for v in analyse.violations)
+    assert kurz(lehre.analyze(text).violations) == vorher
+
+    kompakt = lehre.check_text_compact(text)
+    kompakt.line_index = index
+    assert [(v.line, v.column, v.byte_position) for v in kompakt] == \
+        [erwartete_stelle(text, v.position) for v in kompakt]
+
+    # Blockweise aus einer Binärdatei, Blöcke mitten in Mehrbyte-Zeichen
+    strom = lehre.check_stream(io.BytesIO(text.encode("utf-8")), chunk_size=7)
+    for v in strom:
+        if v.text != "[Gesamttext]":
+            assert (v.line, v.column, v.byte_position) == erwartete_stelle(text, v.position)
+
+
+def test_regel_compiler_begrenzt():
+    compiler = wwaq_transformer.WWAKRuleCompiler(sources=())
+    erster = compiler.compile({"kli": "Kli"}, [], [], [])
+    assert compiler.compile({"kli": "Kli"}, [], [], []) is erster
+    for i in range(compiler.MAX_LOADED + 3):
+        compiler.compile({f"wort{i}": f"Wort{i}"}, [], [], [])
+    assert len(compiler._loaded) == compiler.MAX_LOADED
+    assert erster.fingerprint not in compiler._loaded
+
+
+def test_check_many_mit_mehreren_prozessen(monkeypatch):
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    texte = [" ".join(zufall.choice(WOERTER) for _ in range(zufall.randrange(0, 40))) for _ in range(60)]
+    lauf = lehre.check_many(texte, workers=2, chunksize=4)
+    assert [kurz(v) for v in lauf] == [kurz(lehre.check_text(text)) for text in texte]
+    assert lauf.throughput()["documents"] == len(texte)
+
+    # Der Arbeitsprozess übernimmt die Engine, statt selbst zu kompilieren
+    def nicht_kompilieren(self):
+        raise AssertionError("Arbeitsprozess kompiliert die Regeln erneut")
+    monkeypatch.setattr(WWAKBuchstabenLehre, "compile_rules", nicht_kompilieren)
+    wwaq_transformer._init_worker(lehre.engine, 0)
+    assert wwaq_transformer._worker_lehre.engine is lehre.engine
+
+
+def test_matcher_gross_klein_wie_ignorecase():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    text = "QRAFT qRaFt Qraſt KABBALA kaBBala KELİM Kelım ſtark QABBALISTISCH B\"H"
+    neu = [(v.text, v.position, v.violation_type, v.correction) for v in lehre.engine.matcher.scan(text)]
+    assert neu == einzelpruefungen(lehre, text)
+    assert {"QRAFT", "qRaFt", "KELİM", "Kelım", "QABBALISTISCH"} <= {t for t, _, _, _ in neu}
+
+
+def test_korrektur_in_einem_durchlauf():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    for _ in range(100):
+        text = " ".join(zufall.choice(WOERTER) for _ in range(zufall.randrange(1, 30)))
+        korrigiert, verstoesse, abbildung = lehre.correct_text_with_map(text)
+        # Referenz: von hinten nach vorn einzeln ersetzen
+        erwartet = text
+        for v in sorted(verstoesse, key=lambda v: v.position, reverse=True):
+            if v.text != "[Gesamttext]":
+                erwartet = erwartet[:v.position] + v.correction + erwartet[v.position + len(v.text):]
+        assert korrigiert == erwartet
+        for v in verstoesse:
+            if v.text != "[Gesamttext]":
+                neu = abbildung.to_corrected(v.position)
+                assert korrigiert[neu:neu + len(v.correction)] == v.correction
+                assert abbildung.to_original(neu) == v.position
+
+
+def test_analyse_cache_treffer_und_verdraengung():
+    lehre = WWAKBuchstabenLehre(cache_size=2)
+    erste = lehre.analyze("Die Kabbala")
+    assert lehre.analyze("Die Kabbala") is erste
+    lehre.analyze("Die Qraft")
+    lehre.analyze("Das Kli")  # verdrängt "Die Kabbala"
+    info = lehre.cache_info()
+    assert (info["hits"], info["misses"], info["size"], info["maxsize"]) == (1, 3, 2, 2)
+    assert lehre.analyze("Die Kabbala") is not erste
+    # Weltebene, Korrektur und Nukwa teilen die eine Analyse
+    analyse = lehre.analyze("Die Qraft")
+    treffer = lehre.cache_info()["hits"]
+    assert lehre.calculate_world_level("Die Qraft") == analyse.world_level
+    assert lehre.integrate_with_nukwa("Die Qraft")["nukwa_heals"] == "Die Kraft"
+    assert lehre.cache_info()["hits"] == treffer + 2
+
+
+def test_vorfilter_ueberspringt_saubere_texte():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    ohne = wwaq_transformer.WWAKOptions(prefilter=False)
+    sauber = "Das Licht fließt in die Gefäße. B\"H"
+    assert not lehre.might_violate(sauber)
+    analyse = lehre.analyze(sauber)
+    assert analyse.prefiltered
+    assert kurz(analyse.violations) == kurz(lehre.analyze(sauber, ohne).violations)
+    zufall = random.Random(5785)
+    for _ in range(200):
+        text = " ".join(zufall.choice(WOERTER + ["Licht", "über"]) for _ in range(zufall.randrange(0, 10)))
+        mit = lehre.analyze(text)
+        assert kurz(mit.violations) == kurz(lehre.analyze(text, ohne).violations), text
+        assert mit.prefiltered == (not lehre.might_violate(text))
+
+
+def test_strom_wie_check_text():
+    lehre = WWAKBuchstabenLehre(cache_size=0)
+    zufall = random.Random(5785)
+    woerter = WOERTER + ["bnei", "baruch", "\n", "Gefäß", "קבלה"]
+    for _ in range(30):
+        text = " ".join(zufall.choice(woerter) for _ in range(zufall.randrange(1, 200)))
+        erwartet = lehre.check_text(text)
+        for blockgroesse in (5, 64, 1 << 20):
+            for datei in (io.StringIO(text), io.BytesIO(text.encode("utf-8"))):
+                strom = lehre.check_stream(datei, chunk_size=blockgroesse)
+                gefunden = list(strom)
+                assert sorted(kurz(gefunden)) == sorted(kurz(erwartet)), (blockgroesse, text)
+                assert strom.word_count == len(text.split())